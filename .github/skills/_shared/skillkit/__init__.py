@@ -0,0 +1,17 @@
+"""
+Shared helpers for the engagement skills.
+
+Skills are launched as loose scripts from their own folders, so modules that
+need this package put `.github/skills/_shared` on sys.path first:
+
+    _SHARED = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "_shared")
+    if os.path.abspath(_SHARED) not in sys.path:
+        sys.path.insert(0, os.path.abspath(_SHARED))
+
+Modules: agenda (locates agenda-builder's DOCX renderer), aio, atomic,
+config (config.json), customers, ics (calendar export), ledger (task
+analytics), planner (Planner CSV), timeline (task timelines), transcript,
+workiq.
+`python -m skillkit` lists the command lines; bundle.py builds them into
+skillkit.pyz.
+"""
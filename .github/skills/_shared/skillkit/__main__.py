@@ -0,0 +1,41 @@
+"""
+Command dispatcher for `python -m skillkit` and the skillkit.pyz zipapp.
+
+    python skillkit.pyz tasks "Contoso" "2026-03-15" -o ENGAGEMENT_PATH
+    python skillkit.pyz agenda ENGAGEMENT_PATH/agenda_data.json -o ENGAGEMENT_PATH/Contoso_Agenda.docx
+    python skillkit.pyz customers "BAH"
+"""
+
+import runpy
+import sys
+
+COMMANDS = {
+    "tasks": ("skillkit.timeline", "Task timelines and Planner CSVs (business_days.py)"),
+    "agenda": ("skillkit.agenda", "Render an agenda DOCX with agenda-builder (needs the skills folder)"),
+    "ledger": ("skillkit.ledger", "Query the task ledger"),
+    "customers": ("skillkit.customers", "Resolve a customer name to engagement folders"),
+    "transcript": ("skillkit.transcript", "Digest a long meeting transcript"),
+    "workiq": ("skillkit.workiq", "WorkIQ response cache"),
+    "write": ("skillkit.atomic", "Write stdin to a file only if it changed"),
+}
+
+
+def usage():
+    lines = ["usage: skillkit COMMAND [ARGS...]", "", "commands:"]
+    lines += [f"  {name:<11} {description}" for name, (_, description) in COMMANDS.items()]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help") or argv[0] not in COMMANDS:
+        print(usage())
+        return 0 if not argv or argv[0] in ("-h", "--help") else 2
+    module, _ = COMMANDS[argv[0]]
+    sys.argv = [f"skillkit {argv[0]}"] + argv[1:]
+    runpy.run_module(module, run_name="__main__", alter_sys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
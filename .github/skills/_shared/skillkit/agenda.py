@@ -0,0 +1,94 @@
+"""
+Locator for agenda-builder's renderer, for skills other than agenda-builder.
+
+This module does not contain a renderer. The renderer stays in
+agenda-builder's scripts.core (docxtpl + python-docx, installed on first
+import) with its template in agenda-builder/assets. render_agenda() finds the
+agenda-builder skill on disk, imports it on first use and renders with that
+template, so callers do not need sys.path tricks or the template location:
+
+    from skillkit.agenda import render_agenda
+
+    render_agenda("Engagements/Contoso-2026-03-15/agenda_data.json",
+                  "Engagements/Contoso-2026-03-15/Contoso_Agenda.docx")
+
+The skills folder is located from this file or from the SKILLS_DIR environment
+variable. skillkit.pyz therefore renders agendas only next to a checkout of the
+skills (it searches upward from dist/), not as a standalone copy.
+
+Command line:
+    python -m skillkit.agenda ENGAGEMENT_PATH/agenda_data.json -o ENGAGEMENT_PATH/Contoso_Agenda.docx
+"""
+
+import importlib
+import json
+import os
+import sys
+
+AGENDA_SKILL = "agenda-builder"
+TEMPLATE = os.path.join("assets", "agenda_template.docx")
+
+
+def skills_dir():
+    """The .github/skills folder holding agenda-builder (SKILLS_DIR, else searched upward)."""
+    configured = os.environ.get("SKILLS_DIR")
+    if configured:
+        return os.path.abspath(configured)
+    folder = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        if os.path.isdir(os.path.join(folder, AGENDA_SKILL)):
+            return folder
+        parent = os.path.dirname(folder)
+        if parent == folder:
+            raise FileNotFoundError(f"{AGENDA_SKILL} skill not found; set SKILLS_DIR to .github/skills")
+        folder = parent
+
+
+def _core():
+    skill = os.path.join(skills_dir(), AGENDA_SKILL)
+    if skill not in sys.path:
+        sys.path.insert(0, skill)
+    return importlib.import_module("scripts.core")
+
+
+def template_path():
+    return os.path.join(skills_dir(), AGENDA_SKILL, TEMPLATE)
+
+
+def render_agenda(data, output_path=None, logo_path=None, template=None, validate=True):
+    """
+    Render an agenda DOCX with agenda-builder.
+
+    Args:
+        data: Agenda dict, JSON string, or path to an agenda_data.json file
+        output_path: Where to save the DOCX (agenda-builder picks a name if None)
+        logo_path: Optional logo file, URL or base64 image
+        template: Template DOCX (default: agenda-builder's bundled template)
+        validate: Check the data against the agenda schema first
+
+    Returns:
+        Path to the generated document
+    """
+    if isinstance(data, str) and os.path.isfile(data):
+        with open(data, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    return _core().create_agenda_doc(data, template or template_path(), output_path, logo_path,
+                                     validate=validate)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Render an agenda DOCX from agenda_data.json")
+    parser.add_argument("data", help="Path to agenda_data.json")
+    parser.add_argument("--output", "-o", help="Output DOCX path")
+    parser.add_argument("--logo", help="Logo file, URL or base64 image")
+    parser.add_argument("--template", help="Template DOCX (default: agenda-builder's template)")
+    args = parser.parse_args()
+
+    try:
+        path = render_agenda(args.data, args.output, args.logo, args.template)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✅ Agenda created: {path}")
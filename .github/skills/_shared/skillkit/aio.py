@@ -0,0 +1,89 @@
+"""
+Bounded execution of blocking skill functions from asyncio.
+
+Rendering agendas and writing timeline files are synchronous and block on CPU
+and disk. BoundedExecutor runs them on a thread or process pool behind a
+semaphore so an agent host serving several users can overlap them without
+unbounded fan-out:
+
+    executor = BoundedExecutor(max_concurrency=4, kind="process")
+    path = await executor.run(create_agenda_doc, data, template, output)
+
+An executor belongs to the event loop that first uses it.
+
+Cancellation: a call still waiting for a slot is cancelled immediately. A call
+already running in a worker cannot be interrupted; awaiting it is abandoned,
+its slot is released when the worker finishes, and its result is discarded.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+class BoundedExecutor:
+    """Runs blocking callables on a worker pool with at most max_concurrency in flight."""
+
+    def __init__(self, max_concurrency=None, kind="thread"):
+        """
+        Args:
+            max_concurrency: Calls allowed to run at once (default: CPU count)
+            kind: "thread" for I/O-bound work, "process" for CPU-bound work
+                  (callables and arguments must then be picklable)
+        """
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind!r} (expected 'thread' or 'process')")
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.kind = kind
+        self._pool = None
+        self._semaphore = None
+
+    def _ensure_started(self):
+        if self._pool is None:
+            pool_class = ProcessPoolExecutor if self.kind == "process" else ThreadPoolExecutor
+            self._pool = pool_class(max_workers=self.max_concurrency)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def run(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) in the pool once a slot is free and return its result."""
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        await self._semaphore.acquire()
+        try:
+            work = self._pool.submit(functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            self._semaphore.release()
+            raise
+        # Hold the slot until the worker is really done, even if the caller stops waiting
+        work.add_done_callback(lambda _: self._release_from_worker(loop))
+        return await asyncio.wrap_future(work, loop=loop)
+
+    def _release_from_worker(self, loop):
+        semaphore = self._semaphore
+        if semaphore is None:
+            return
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+        except RuntimeError:
+            pass  # Event loop already closed; nothing left waiting on the slot
+
+    async def map(self, fn, argument_lists, return_exceptions=False):
+        """Run fn over several argument tuples concurrently (bounded) and gather results in order."""
+        return await asyncio.gather(
+            *(self.run(fn, *args) for args in argument_lists),
+            return_exceptions=return_exceptions,
+        )
+
+    def shutdown(self, wait=True, cancel_pending=True):
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=cancel_pending)
+            self._pool = None
+            self._semaphore = None
+
+    async def __aenter__(self):
+        self._ensure_started()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
@@ -0,0 +1,193 @@
+"""
+Atomic, change-aware file writes for the synced engagements folder.
+
+Everything under engagements_base_path is synced by OneDrive: each write is an
+upload, and a file caught half-written gets uploaded half-written. write_bytes()
+and friends therefore:
+
+  - compare the new content with the file already on disk (size, then SHA-256)
+    and skip the write entirely when they match, so re-runs cause no uploads
+  - otherwise write to a temporary file in the same folder and os.replace() it
+    into place, so the target only ever holds the old or the new content
+
+Counters for written versus skipped files and bytes are kept per process:
+
+    from skillkit.atomic import write_text, write_stats
+    write_text(readme_path, readme)
+    print(write_stats())   # {'files_written': 0, 'files_skipped': 1, ...}
+
+Command line (content on stdin, prints "written" or "unchanged"):
+    python .github/skills/_shared/skillkit/atomic.py path/to/README.md < README.md.draft
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+_CHUNK_SIZE = 1 << 20
+# mkstemp creates files as 0600; new files get the usual permissions instead
+_NEW_FILE_MODE = 0o644
+
+_stats_lock = threading.Lock()
+_stats = {"files_written": 0, "files_skipped": 0, "bytes_written": 0, "bytes_skipped": 0}
+
+
+def _record(written, size):
+    with _stats_lock:
+        if written:
+            _stats["files_written"] += 1
+            _stats["bytes_written"] += size
+        else:
+            _stats["files_skipped"] += 1
+            _stats["bytes_skipped"] += size
+
+
+def write_stats():
+    """Snapshot of the write counters for this process."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_write_stats():
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def content_matches(path, data):
+    """True when the file at path exists and holds exactly `data`."""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        return _file_sha256(path) == hashlib.sha256(data).digest()
+    except OSError:
+        return False
+
+
+def chunks_match(path, chunks, encoding="utf-8"):
+    """content_matches() for content produced piece by piece."""
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode(encoding)
+        digest.update(chunk)
+        size += len(chunk)
+    try:
+        return os.path.getsize(path) == size and _file_sha256(path) == digest.digest()
+    except OSError:
+        return False
+
+
+def write_bytes(path, data):
+    """
+    Write bytes to path atomically, skipping the write if the content is unchanged.
+
+    Args:
+        path: Destination file
+        data: Complete new content
+
+    Returns:
+        True if the file was written, False if it already held this content
+    """
+    data = bytes(data)
+    if content_matches(path, data):
+        _record(False, len(data))
+        return False
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except OSError:
+            mode = _NEW_FILE_MODE
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _record(True, len(data))
+    return True
+
+
+def write_chunks(path, chunks, encoding="utf-8"):
+    """
+    write_bytes() for content produced piece by piece, without holding all of it.
+
+    Chunks (bytes, or str encoded with `encoding`) stream into the temporary
+    file while being hashed; if the result matches the existing file, the
+    temporary file is dropped instead of replacing it.
+
+    Returns:
+        True if the file was written, False if it already held this content
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=directory)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode(encoding)
+                digest.update(chunk)
+                size += len(chunk)
+                f.write(chunk)
+            f.flush()
+            try:
+                unchanged = os.path.getsize(path) == size and _file_sha256(path) == digest.digest()
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                os.fsync(f.fileno())
+        if unchanged:
+            os.remove(tmp_path)
+            _record(False, size)
+            return False
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except OSError:
+            mode = _NEW_FILE_MODE
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _record(True, size)
+    return True
+
+
+def write_text(path, text, encoding="utf-8"):
+    """write_bytes() for text. Newlines are written as given (no translation)."""
+    return write_bytes(path, text.encode(encoding))
+
+
+def write_json(path, obj, indent=2):
+    """write_bytes() for JSON, serialized the same way on every run so unchanged data is skipped."""
+    return write_text(path, json.dumps(obj, indent=indent, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 2:
+        print("Usage: python atomic.py <target path>  (content on stdin)", file=sys.stderr)
+        sys.exit(2)
+    changed = write_bytes(sys.argv[1], sys.stdin.buffer.read())
+    print("written" if changed else "unchanged")
@@ -0,0 +1,149 @@
+"""
+Build skillkit as a single-file zipapp, and benchmark its cold start.
+
+Skills run as loose scripts, and a loose script's own source is compiled on
+every launch; its imports are compiled on first use and cached in __pycache__
+(when the folder is writable; OneDrive folders and fresh clones often start
+without it). skillkit.pyz ships the package with bytecode compiled at build
+time, so nothing is compiled when a skill starts:
+
+    python .github/skills/_shared/skillkit/bundle.py build
+    python .github/skills/_shared/dist/skillkit.pyz tasks "Contoso" "2026-03-15" -o ENGAGEMENT_PATH
+
+Only skillkit itself is bundled. The `agenda` command still imports
+agenda-builder's renderer and template from the skills folder next to the
+archive (skillkit.agenda is a locator, not a copy of the renderer).
+
+The archive holds each module's .pyc (unchecked hash, so zipimport does not
+compare it with the source timestamp) next to its .py. A different Python
+version rejects the bytecode and falls back to the source, so the archive
+still runs, just without the head start; rebuild after upgrading Python.
+
+`bench` times the same task-timeline run through business_days.py, through
+`python -m skillkit` and through the zipapp, with skillkit's __pycache__
+removed before every run (cold) and left in place (warm):
+
+    python .github/skills/_shared/skillkit/bundle.py bench --runs 20
+    python .github/skills/_shared/skillkit/bundle.py bench --compare old_business_days.py
+"""
+
+import os
+import py_compile
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zipapp
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+SHARED_DIR = os.path.dirname(PACKAGE_DIR)
+SKILLS_DIR = os.path.dirname(SHARED_DIR)
+DEFAULT_TARGET = os.path.join(SHARED_DIR, "dist", "skillkit.pyz")
+
+_ROOT_MAIN = "import runpy\nrunpy.run_module('skillkit', run_name='__main__', alter_sys=True)\n"
+
+
+def build(target=DEFAULT_TARGET, optimize=-1):
+    """
+    Write skillkit.pyz with precompiled bytecode.
+
+    Args:
+        target: Output archive path
+        optimize: Bytecode optimization level passed to py_compile (-1: current)
+
+    Returns:
+        (target, number of modules)
+    """
+    staging = tempfile.mkdtemp(prefix="skillkit-pyz-")
+    try:
+        package = os.path.join(staging, "skillkit")
+        os.makedirs(package)
+        modules = sorted(name for name in os.listdir(PACKAGE_DIR) if name.endswith(".py"))
+        for name in modules:
+            source = os.path.join(PACKAGE_DIR, name)
+            shutil.copy2(source, os.path.join(package, name))
+            py_compile.compile(
+                source,
+                cfile=os.path.join(package, name + "c"),
+                dfile=f"skillkit/{name}",
+                doraise=True,
+                optimize=optimize,
+                invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+            )
+        with open(os.path.join(staging, "__main__.py"), "w", encoding="utf-8") as f:
+            f.write(_ROOT_MAIN)
+
+        os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+        partial = target + ".partial"
+        zipapp.create_archive(staging, partial, interpreter="/usr/bin/env python3")
+        os.replace(partial, target)
+        return target, len(modules)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _time_command(command, runs, cold, env):
+    timings = []
+    for _ in range(runs):
+        if cold:
+            shutil.rmtree(os.path.join(PACKAGE_DIR, "__pycache__"), ignore_errors=True)
+        output = tempfile.mkdtemp(prefix="tasks-")
+        started = time.perf_counter()
+        subprocess.run(command + ["-o", output], env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - started)
+        shutil.rmtree(output, ignore_errors=True)
+    return timings
+
+
+def bench(runs=10, target=DEFAULT_TARGET, compare=None):
+    """Median and minimum start-to-exit times, in ms, for each way of launching a timeline run."""
+    if not os.path.isfile(target):
+        build(target)
+    args = ["Contoso", "2026-03-15"]
+    commands = {
+        "business_days.py": [sys.executable, os.path.join(SKILLS_DIR, "task-generator", "scripts", "business_days.py")] + args,
+        "python -m skillkit": [sys.executable, "-m", "skillkit", "tasks"] + args,
+        "skillkit.pyz": [sys.executable, target, "tasks"] + args,
+    }
+    if compare:
+        commands[os.path.basename(compare)] = [sys.executable, compare] + args
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SHARED_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    env["SKILLS_LEDGER_DIR"] = tempfile.mkdtemp(prefix="ledger-")  # Keep bench runs out of the real ledger
+    results = {}
+    for label, command in commands.items():
+        for cold in (True, False):
+            if not cold:
+                _time_command(command, 1, False, env)  # Populate __pycache__ first
+            timings = _time_command(command, runs, cold, env)
+            results[(label, "cold" if cold else "warm")] = (
+                statistics.median(timings) * 1000, min(timings) * 1000)
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build and benchmark the skillkit zipapp")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("build", help="Write skillkit.pyz")
+    p.add_argument("--output", "-o", default=DEFAULT_TARGET)
+    p.add_argument("--optimize", type=int, default=-1, choices=[-1, 0, 1, 2])
+    p = sub.add_parser("bench", help="Compare cold-start times of the scripts and the zipapp")
+    p.add_argument("--runs", type=int, default=10)
+    p.add_argument("--archive", default=DEFAULT_TARGET)
+    p.add_argument("--compare", help="Another timeline script to time with the same arguments")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        path, count = build(args.output, args.optimize)
+        print(f"✅ Built {path} ({count} modules, {os.path.getsize(path) / 1024:.0f} KB)")
+    else:
+        results = bench(args.runs, args.archive, args.compare)
+        print(f"{'launcher':<24}{'cache':<7}{'median ms':>11}{'min ms':>9}")
+        for (label, cache), (median, fastest) in results.items():
+            print(f"{label:<24}{cache:<7}{median:>11.1f}{fastest:>9.1f}")
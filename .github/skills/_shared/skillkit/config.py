@@ -0,0 +1,39 @@
+"""
+config.json lookup shared by every skill.
+
+Skills read their settings (engagements_base_path, archive_base_path, ...)
+from config.json in the working directory, falling back to the one at the
+repo root:
+
+    from skillkit.config import load_base_path, load_config
+
+    base = args.base or load_base_path()
+    archive = load_config().get("archive_base_path")
+"""
+
+import json
+import os
+
+CONFIG_NAME = "config.json"
+
+
+def load_config(config_path=None):
+    """
+    config.json as a dict: the explicit path, else the working directory's,
+    else the repo root's; {} when there is none.
+    """
+    repo_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..")
+    candidates = [config_path] if config_path else [
+        os.path.join(os.getcwd(), CONFIG_NAME),
+        os.path.join(repo_root, CONFIG_NAME),
+    ]
+    for path in candidates:
+        if os.path.isfile(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+    return {}
+
+
+def load_base_path(config_path=None):
+    """engagements_base_path from config.json (see load_config), or None."""
+    return load_config(config_path).get("engagements_base_path")
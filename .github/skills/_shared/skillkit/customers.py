@@ -0,0 +1,368 @@
+"""
+Fuzzy customer-name resolution for finding engagement and journey folders.
+
+Skills get customers as the user types them ("promote Keller to journey",
+"close out BAH session"). CustomerIndex indexes every customer in the
+engagements folder under:
+
+  - the name from engagement_metadata.json and the name in the folder
+  - acronyms of those names (Booz Allen Hamilton → BAH, U.S. Department of
+    State → DOS and DS) and any acronym in parentheses
+  - aliases from an optional JSON file: {"Booz Allen Hamilton": ["Booz", "BAH"]}
+  - character trigrams of each name and of its words, for typos and partial names
+
+and ranks matches by score (1.0 exact name or alias, 0.95 acronym, 0.8-0.9
+for word prefixes by how much of the name they cover, a little less for
+words with a typo ("kellr" → Keller), up to 0.85 for trigram similarity of
+the whole name):
+
+    from skillkit.customers import CustomerIndex
+
+    index = CustomerIndex(base_path)
+    for match in index.resolve("BAH"):
+        print(match.name, match.score, match.folders)
+
+Building reads each folder's metadata once; refresh() afterwards only stats
+folders and indexes the new or changed ones. Lookups take microseconds.
+
+Command line:
+    python .github/skills/_shared/skillkit/customers.py "BAH"
+    python .github/skills/_shared/skillkit/customers.py "keller" --base ~/Engagements --limit 3
+"""
+
+import bisect
+import json
+import os
+import re
+from collections import Counter, namedtuple
+from itertools import chain
+
+ALIAS_FILE_NAME = "customer_aliases.json"
+METADATA_NAME = "engagement_metadata.json"
+_TRIGRAM_CANDIDATES = 20
+_MIN_TYPO_WORD = 4          # shorter words are matched as prefixes only
+_MIN_TYPO_SIMILARITY = 0.5  # trigram Dice for a query word to count as a typo of a name word
+
+_FOLDER_SUFFIX = re.compile(r"-(\d{4}-\d{2}-\d{2}|\d{4}-Customer-Journey)$")
+_PARENTHESES = re.compile(r"\(([^)]*)\)")
+_STOPWORDS = {"of", "the", "and", "for", "&", "inc", "llc", "plc", "ltd", "co", "corp"}
+# Words from skill requests ("close out BAH session") that are not part of a name
+_REQUEST_WORDS = {
+    "promote", "convert", "close", "closeout", "out", "to", "a", "an", "the", "for", "with", "from",
+    "journey", "customer", "session", "sessions", "engagement", "engagements", "meeting",
+    "followup", "follow", "up", "email", "agenda", "tasks", "status", "show", "update",
+}
+
+Match = namedtuple("Match", "name score folders matched")
+
+
+def normalize(text):
+    """Lowercase words of letters and digits, single-spaced ('U.S. Dept.' → 'us dept')."""
+    text = text.lower().replace("&", " and ").replace(".", "")
+    return " ".join(re.findall(r"[a-z0-9]+", text))
+
+
+def folder_customer(folder_name):
+    """Customer name from a folder name ('Keller-Group-PLC-2026-01-29' → 'Keller Group PLC')."""
+    return _FOLDER_SUFFIX.sub("", folder_name).replace("-", " ").replace("_", " ").strip()
+
+
+def acronyms(name):
+    """Acronyms a name is commonly shortened to, with and without a leading 'US' qualifier."""
+    found = {normalize(a) for a in _PARENTHESES.findall(name)}
+    words = [w for w in normalize(_PARENTHESES.sub(" ", name)).split() if not w.isdigit()]
+    qualifier = 1 if words[:1] == ["us"] else 2 if words[:2] == ["u", "s"] else 0
+    for start in {0, qualifier}:
+        rest = words[start:]
+        if len(rest) > 1:
+            found.add("".join(w[0] for w in rest))
+            significant = [w for w in rest if w not in _STOPWORDS]
+            if len(significant) > 1:
+                found.add("".join(w[0] for w in significant))
+    return {a for a in found if len(a) > 1 and " " not in a}
+
+
+def _trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _Customer:
+    __slots__ = ("name", "folders", "aliases", "strings", "significant_words")
+
+    def __init__(self, name):
+        self.name = name
+        self.folders = set()
+        self.aliases = set()
+        self.strings = {}
+        self.significant_words = len([w for w in normalize(name).split() if w not in _STOPWORDS]) or 1
+
+
+class CustomerIndex:
+    """Alias, acronym, word-prefix and trigram index over customers in an engagements folder."""
+
+    def __init__(self, base_path=None, alias_file=None):
+        """
+        Args:
+            base_path: Engagements folder to index (None: aliases only, add folders yourself)
+            alias_file: JSON {canonical name: [aliases]} (default: customer_aliases.json
+                        in base_path, if present)
+        """
+        self.base_path = base_path
+        self.alias_file = alias_file or (os.path.join(base_path, ALIAS_FILE_NAME) if base_path else None)
+        self._customers = {}        # key -> _Customer
+        self._folder_keys = {}      # folder path -> (customer key, metadata mtime)
+        self._exact = {}            # normalized name or alias -> {key: kind}
+        self._words = []            # sorted (word, key)
+        self._word_grams = {}       # trigram -> words of indexed names (stale words have no keys)
+        self._grams = {}            # trigram -> set of string ids
+        self._string_ids = {}       # (key, string) -> string id
+        self._string_info = []      # string id -> (key, string, trigram count), None once removed
+        if self.alias_file and os.path.isfile(self.alias_file):
+            self.load_aliases(self.alias_file)
+        if base_path:
+            self.refresh()
+
+    # --- Indexing ---------------------------------------------------------
+
+    def _customer(self, name):
+        key = normalize(name)
+        customer = self._customers.get(key)
+        if customer is None:
+            customer = self._customers[key] = _Customer(name)
+        return key, customer
+
+    def _unindex(self, key):
+        customer = self._customers[key]
+        for string in customer.strings:
+            entries = self._exact.get(string)
+            if entries:
+                entries.pop(key, None)
+                if not entries:
+                    del self._exact[string]
+            string_id = self._string_ids.pop((key, string), None)
+            if string_id is not None:
+                for gram in _trigrams(string):
+                    self._grams[gram].discard(string_id)
+                self._string_info[string_id] = None
+        self._words = [(w, k) for w, k in self._words if k != key]
+        customer.strings = {}
+
+    def _index(self, key):
+        customer = self._customers[key]
+        if customer.strings:
+            self._unindex(key)
+        names = {normalize(customer.name)} | {normalize(folder_customer(os.path.basename(f)))
+                                              for f in customer.folders}
+        strings = {n: "name" for n in names if n}
+        strings.update({normalize(a): "alias" for a in customer.aliases if normalize(a)})
+        sources = [customer.name, *(folder_customer(os.path.basename(f)) for f in customer.folders)]
+        for source in sources + list(customer.aliases):
+            for acronym in acronyms(source):
+                strings.setdefault(acronym, "acronym")
+        customer.strings = strings
+        for string, kind in strings.items():
+            self._exact.setdefault(string, {})[key] = kind
+            grams = _trigrams(string)
+            string_id = len(self._string_info)
+            self._string_info.append((key, string, len(grams)))
+            self._string_ids[(key, string)] = string_id
+            for gram in grams:
+                self._grams.setdefault(gram, set()).add(string_id)
+        for word in {w for string, kind in strings.items() if kind != "acronym" for w in string.split()}:
+            bisect.insort(self._words, (word, key))
+            if len(word) >= _MIN_TYPO_WORD:
+                for gram in _trigrams(word):
+                    self._word_grams.setdefault(gram, set()).add(word)
+
+    def load_aliases(self, path):
+        """Add aliases from a JSON file of {canonical name: [aliases]}."""
+        with open(path, "r", encoding="utf-8") as f:
+            for name, aliases in json.load(f).items():
+                self.add_customer(name, aliases)
+
+    def add_customer(self, name, aliases=(), folder=None):
+        """Index a customer (or add aliases/a folder to one already indexed)."""
+        key, customer = self._customer(name)
+        customer.aliases.update(aliases)
+        if folder:
+            customer.folders.add(folder)
+        self._index(key)
+        return key
+
+    def add_folder(self, folder):
+        """Index one engagement or journey folder (call after creating it)."""
+        metadata_path = os.path.join(folder, METADATA_NAME)
+        try:
+            mtime = os.stat(metadata_path).st_mtime
+        except OSError:
+            mtime = None
+        name = None
+        if mtime is not None:
+            try:
+                with open(metadata_path, "r", encoding="utf-8") as f:
+                    name = json.load(f).get("customer")
+            except (OSError, ValueError):
+                pass
+        self.remove_folder(folder)
+        key = self.add_customer(name or folder_customer(os.path.basename(folder)), folder=folder)
+        self._folder_keys[folder] = (key, mtime)
+        return key
+
+    def remove_folder(self, folder):
+        entry = self._folder_keys.pop(folder, None)
+        if entry is None:
+            return
+        customer = self._customers.get(entry[0])
+        if customer is None:
+            return
+        customer.folders.discard(folder)
+        if customer.folders or customer.aliases:
+            self._index(entry[0])
+        else:
+            self._unindex(entry[0])
+            del self._customers[entry[0]]
+
+    def refresh(self):
+        """Index new or changed folders and drop removed ones; returns how many changed."""
+        if not self.base_path:
+            return 0
+        seen, changed = set(), 0
+        for entry in os.scandir(self.base_path):
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+            seen.add(entry.path)
+            try:
+                mtime = os.stat(os.path.join(entry.path, METADATA_NAME)).st_mtime
+            except OSError:
+                mtime = None
+            known = self._folder_keys.get(entry.path)
+            if known is None or known[1] != mtime:
+                self.add_folder(entry.path)
+                changed += 1
+        for folder in [f for f in self._folder_keys if f not in seen]:
+            self.remove_folder(folder)
+            changed += 1
+        return changed
+
+    # --- Lookup -----------------------------------------------------------
+
+    def resolve(self, text, limit=5, min_score=0.3):
+        """
+        Ranked customers for a name, alias, acronym or fragment.
+
+        Request phrasing around the name ("close out BAH session") is ignored.
+
+        Returns:
+            List of Match(name, score, folders, matched) sorted by score;
+            folders are sorted paths, matched is the indexed string that hit.
+        """
+        query = normalize(text)
+        if not query:
+            return []
+        scores = {}
+        stripped = " ".join(w for w in query.split() if w not in _REQUEST_WORDS)
+        for variant in {query, stripped} - {""}:
+            self._score(variant, scores)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1][0], self._customers[item[0]].name))
+        return [
+            Match(self._customers[key].name, round(score, 3), sorted(self._customers[key].folders), matched)
+            for key, (score, matched) in ranked[:limit] if score >= min_score
+        ]
+
+    def _score(self, query, scores):
+        def offer(key, score, matched):
+            if score > scores.get(key, (0, None))[0]:
+                scores[key] = (score, matched)
+
+        for key, kind in self._exact.get(query, {}).items():
+            offer(key, 0.95 if kind == "acronym" else 1.0, query)
+
+        # Every query word is a prefix of, or a typo away from, some word of the name
+        words = query.split()
+        word_hits = None
+        for word in words:
+            hits = {}
+            for similar, similarity in self._similar_words(word):
+                start = bisect.bisect_left(self._words, (similar, ""))
+                for indexed, key in self._words[start:]:
+                    if not indexed.startswith(similar) or (similarity < 1 and indexed != similar):
+                        break
+                    hits[key] = max(hits.get(key, 0), similarity)
+            word_hits = hits if word_hits is None else {
+                key: min(similarity, word_hits[key]) for key, similarity in hits.items() if key in word_hits
+            }
+            if not word_hits:
+                break
+        significant = len([w for w in words if w not in _STOPWORDS])
+        for key, similarity in (word_hits or {}).items():
+            coverage = min(significant / self._customers[key].significant_words, 1.0)
+            offer(key, 0.7 + 0.1 * coverage + 0.1 * similarity, query)
+
+        # Trigram (Dice) similarity for typos, scoring only the strongest candidates
+        query_grams = _trigrams(query)
+        shared = Counter(chain.from_iterable(self._grams.get(gram, ()) for gram in query_grams))
+        for string_id, overlap in shared.most_common(_TRIGRAM_CANDIDATES):
+            key, string, total = self._string_info[string_id]
+            offer(key, round(0.85 * 2 * overlap / (len(query_grams) + total), 3), string)
+
+    def _similar_words(self, word):
+        """(word, similarity): the word itself as a prefix (1.0), then indexed words it is a typo of."""
+        yield word, 1.0
+        if len(word) < _MIN_TYPO_WORD:
+            return
+        grams = _trigrams(word)
+        shared = Counter(chain.from_iterable(self._word_grams.get(gram, ()) for gram in grams))
+        for similar, overlap in shared.most_common(_TRIGRAM_CANDIDATES):
+            dice = 2 * overlap / (len(grams) + len(_trigrams(similar)))
+            if similar != word and dice >= _MIN_TYPO_SIMILARITY:
+                yield similar, round(dice, 3)
+
+    def best(self, text, min_score=0.8):
+        """The top match if it scores at least min_score and clearly beats the runner-up, else None."""
+        matches = self.resolve(text, limit=2, min_score=min_score)
+        if not matches or (len(matches) > 1 and matches[1].score >= matches[0].score):
+            return None
+        return matches[0]
+
+    def customers(self):
+        return sorted(c.name for c in self._customers.values())
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    import time
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from skillkit.config import load_base_path
+
+    parser = argparse.ArgumentParser(description="Resolve a customer name to engagement folders")
+    parser.add_argument("name", help="Customer name, alias, acronym or fragment")
+    parser.add_argument("--base", help="Engagements folder (default: engagements_base_path in config.json)")
+    parser.add_argument("--aliases", help=f"Alias JSON file (default: {ALIAS_FILE_NAME} in the base folder)")
+    parser.add_argument("--limit", type=int, default=5)
+    args = parser.parse_args()
+
+    base = args.base or load_base_path()
+    if not base or not os.path.isdir(base):
+        print("❌ Engagements folder not found (use --base or set engagements_base_path in config.json)")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    index = CustomerIndex(base, args.aliases)
+    built = time.perf_counter() - started
+    started = time.perf_counter()
+    matches = index.resolve(args.name, limit=args.limit)
+    lookup = time.perf_counter() - started
+
+    if not matches:
+        print(f"❌ No customer matching '{args.name}'")
+    for match in matches:
+        print(f"  {match.score:.2f}  {match.name}  (via '{match.matched}')")
+        for folder in match.folders:
+            print(f"        {os.path.basename(folder)}")
+    print(f"Indexed {len(index.customers())} customers in {built * 1000:.1f} ms; "
+          f"lookup {lookup * 1000:.3f} ms")
+    sys.exit(0 if matches else 1)
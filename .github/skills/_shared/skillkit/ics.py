@@ -0,0 +1,218 @@
+"""
+iCalendar (.ics) export for task timelines.
+
+Takes the same task dicts as skillkit.planner (from skillkit.timeline) and
+writes each task as an all-day VEVENT on its due date, so the prep timeline
+shows up in Outlook or any other calendar next to the Planner board:
+
+    from skillkit.ics import save_tasks_ics
+    save_tasks_ics(generate_task_timeline("Contoso", "2026-03-15"), "tasks.ics")
+
+Events are streamed to the file one at a time (via skillkit.atomic.write_chunks),
+so a journey with thousands of tasks never exists as one string in memory.
+
+Each event's UID is derived from what identifies the task rather than from
+when or under which bucket it happens: the customer, the session (the "id"
+journey-promoter gives each session in sessions[] when it is added, 1 for an
+initial engagement, which becomes the journey's first session) and the
+template task title. Re-importing a regenerated calendar, even after the
+session was rescheduled or relabelled or sessions were added before it,
+therefore updates events instead of adding copies, and the per-session and
+combined calendars share UIDs. When the id is unknown (a follow-on session
+with no journey metadata next to it, or one recorded without an id) the
+session date stands in, and a reschedule then yields new UIDs.
+
+DTSTAMP and LAST-MODIFIED carry the generation time and SEQUENCE grows with
+it, so calendar clients accept the newer version of an event. A calendar
+whose events are unchanged keeps its previous stamps and is not rewritten.
+"""
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+from skillkit.atomic import chunks_match, write_chunks
+
+PRODID = "-//copilot-skills//task-generator//EN"
+UID_DOMAIN = "copilot-skills"
+METADATA_NAME = "engagement_metadata.json"
+
+_SESSION_TAG = re.compile(r"\s*\[\d{1,2}/\d{1,2}\]$")
+_STAMP = re.compile(r"^DTSTAMP:(\d{8}T\d{6}Z)\r?$", re.MULTILINE)
+_STAMP_FORMAT = "%Y%m%dT%H%M%SZ"
+
+
+def escape_text(value):
+    """Escape a TEXT value (RFC 5545 3.3.11)."""
+    return (str(value).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def fold(line):
+    """Fold a content line to 75 octets per physical line, ending in CRLF."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts = []
+    start, limit = 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+            end -= 1  # Never split a UTF-8 sequence
+        parts.append(encoded[start:end].decode("utf-8"))
+        start, limit = end, 74  # Continuation lines start with a space
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def task_identity(task):
+    """(customer, template title) of a generated task, from "Customer [m/d] - Title"."""
+    prefix, _, title = task["Task Name"].rpartition(" - ")
+    return _SESSION_TAG.sub("", prefix), title
+
+
+def task_uid(task, session):
+    """Stable UID for a task: same customer, session and template title, same UID."""
+    customer, title = task_identity(task)
+    key = f"{customer}\n{session}\n{title}".encode("utf-8")
+    return f"{hashlib.sha1(key).hexdigest()[:24]}@{UID_DOMAIN}"
+
+
+def _session_of(task):
+    # Fallback identity: the session date the bucket name starts with
+    return task["Bucket"].split(" - ", 1)[0]
+
+
+def _event(task, session, stamp):
+    due = datetime.strptime(task["Due date"], "%m/%d/%Y")
+    description = f"Bucket: {task['Bucket']}\nAssigned to: {task['Assignment']}\nPriority: {task['Priority']}"
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{task_uid(task, session)}",
+        f"DTSTAMP:{stamp:{_STAMP_FORMAT}}",
+        f"LAST-MODIFIED:{stamp:{_STAMP_FORMAT}}",
+        f"SEQUENCE:{int(stamp.timestamp()) // 60}",
+        f"DTSTART;VALUE=DATE:{due:%Y%m%d}",
+        f"DTEND;VALUE=DATE:{due + timedelta(days=1):%Y%m%d}",
+        f"SUMMARY:{escape_text(task['Task Name'])}",
+        f"DESCRIPTION:{escape_text(description)}",
+        f"CATEGORIES:{escape_text(task['Bucket'])}",
+        "TRANSP:TRANSPARENT",
+        "END:VEVENT",
+    ]
+    return "".join(fold(line) for line in lines)
+
+
+def iter_ics(events: Iterable, calendar_name: str, stamp: datetime):
+    """
+    Yield a VCALENDAR piece by piece: header, one chunk per event, footer.
+
+    events holds (session, task) pairs; stamp is the UTC generation time.
+    """
+    yield "".join(fold(line) for line in [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(calendar_name)}",
+    ])
+    for session, task in events:
+        yield _event(task, session, stamp)
+    yield fold("END:VCALENDAR")
+
+
+def _previous_stamp(path):
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            match = _STAMP.search(f.read(4096))
+    except OSError:
+        return None
+    return datetime.strptime(match.group(1), _STAMP_FORMAT).replace(tzinfo=timezone.utc) if match else None
+
+
+def _save(events, output_path, calendar_name):
+    events = list(events)
+    stamp = _previous_stamp(output_path)
+    # Unchanged events keep the stamps they were published with
+    if stamp is None or not chunks_match(output_path, iter_ics(events, calendar_name, stamp)):
+        stamp = datetime.now(timezone.utc).replace(microsecond=0)
+    write_chunks(output_path, iter_ics(events, calendar_name, stamp))
+    return output_path
+
+
+def session_ids(folder):
+    """
+    Session date -> session id from a journey's engagement_metadata.json in
+    `folder`; sessions without an id are left out, and it is empty when
+    there is no metadata.
+    """
+    try:
+        with open(os.path.join(folder, METADATA_NAME), "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    sessions = metadata.get("sessions") if isinstance(metadata, dict) else None
+    ids = {}
+    for session in sessions or []:
+        if isinstance(session, dict) and session.get("date") and isinstance(session.get("id"), int):
+            ids.setdefault(session["date"], session["id"])
+    return ids
+
+
+def save_tasks_ics(
+    tasks: Iterable[Dict],
+    output_path: str,
+    calendar_name: str = None,
+    session: Optional[object] = None
+) -> str:
+    """
+    Save tasks as an all-day event calendar.
+
+    Args:
+        tasks: Task dicts from generate_task_timeline() (any iterable)
+        output_path: .ics file to write
+        calendar_name: Name shown by calendar apps (default: file name)
+        session: Session id used in the UIDs (1 for an initial
+                 engagement); default: each task's session date
+
+    Returns:
+        output_path
+    """
+    name = calendar_name or os.path.splitext(os.path.basename(output_path))[0]
+    return _save(((session if session is not None else _session_of(t), t) for t in tasks), output_path, name)
+
+
+def save_journey_ics(
+    customer_name: str,
+    session_tasks: Dict[str, List[Dict]],
+    output_dir: str,
+    combined: bool = True
+) -> List[str]:
+    """
+    Save journey session tasks as per-session calendars and optionally a combined one.
+
+    Mirrors skillkit.planner.save_journey_tasks(): tasks_YYYY-MM-DD.ics per
+    session, plus tasks_all_sessions.ics when there is more than one session.
+    Session ids come from engagement_metadata.json in output_dir.
+
+    Returns:
+        List of created file paths
+    """
+    ids = session_ids(output_dir)
+    created_files = []
+    for session_date, tasks in sorted(session_tasks.items()):
+        filepath = os.path.join(output_dir, f"tasks_{session_date}.ics")
+        save_tasks_ics(tasks, filepath, f"{customer_name} {session_date}", ids.get(session_date))
+        created_files.append(filepath)
+
+    if combined and len(session_tasks) > 1:
+        combined_path = os.path.join(output_dir, "tasks_all_sessions.ics")
+        events = ((ids.get(session_date, session_date), task)
+                  for session_date, tasks in sorted(session_tasks.items()) for task in tasks)
+        _save(events, combined_path, f"{customer_name} journey")
+        created_files.append(combined_path)
+
+    return created_files
@@ -0,0 +1,441 @@
+"""
+Columnar ledger of every generated task, for analysis across the portfolio.
+
+Task timelines otherwise live only as per-engagement CSVs of formatted
+strings. The ledger keeps one fixed-size record per task in a flat binary
+file (a NumPy structured array), with dates stored as ordinals and strings
+replaced by ids into small dictionaries:
+
+    tasks.bin     records (RECORD dtype), appended in place
+    ledger.json   customers, assignees, session labels and task templates
+                  (the strings behind the ids)
+
+Reads memory-map tasks.bin, so queries run over the columns without parsing
+or copying the file:
+
+    from skillkit.ledger import Ledger
+
+    ledger = Ledger()
+    ledger.append_timeline("Contoso", "2026-03-15", tasks)      # from generate_task_timeline
+    for task in ledger.due_between("2026-03-01", "2026-03-31"):
+        print(task["due"], task["customer"], task["title"])
+    print(ledger.count_by("assignee"))
+
+Regenerating a session supersedes its earlier records (their `live` flag is
+cleared in place); appending an identical timeline is a no-op. One process
+should write at a time; any number may read.
+
+Every Planner CSV saved through skillkit.planner is recorded (record=False to
+opt out), so the ledger follows the CSVs whichever script wrote them. NumPy is
+optional for the skills: without it, Ledger() raises LedgerUnavailable and
+saving simply skips recording.
+
+Default location: ~/.copilot-skills/ledger (SKILLS_LEDGER_DIR to override).
+
+Command line:
+    python -m skillkit.ledger due --from 2026-03-01 --to 2026-03-31 [--customer Contoso]
+    python -m skillkit.ledger counts --by assignee [--from 2026-01-01]
+    python -m skillkit.ledger ingest --base ~/Engagements      # existing tasks*.csv files
+    python -m skillkit.ledger stats
+"""
+
+import csv
+import glob
+import json
+import logging
+import os
+import re
+import threading
+from datetime import date, datetime
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from skillkit.atomic import write_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEDGER_DIR = os.environ.get(
+    "SKILLS_LEDGER_DIR", os.path.join(os.path.expanduser("~"), ".copilot-skills", "ledger")
+)
+RECORDS_FILE = "tasks.bin"
+DICTIONARY_FILE = "ledger.json"
+SESSION_TYPES = ("initial", "followon")
+
+# Little-endian and unaligned, so the file layout is the same everywhere
+RECORD_FIELDS = [
+    ("due", "<i4"),           # due date ordinal
+    ("session", "<i4"),       # session date ordinal
+    ("recorded", "<i4"),      # ordinal of the day the record was written
+    ("customer", "<u4"),      # id in customers
+    ("label", "<u4"),         # id in labels (0: no label)
+    ("assignee", "<u2"),      # id in assignees
+    ("template", "<u2"),      # id in templates
+    ("offset", "i1"),         # business days before the session (negative: after)
+    ("session_type", "u1"),   # index in SESSION_TYPES
+    ("live", "u1"),           # 0 once superseded by a regenerated session
+]
+RECORD = np.dtype(RECORD_FIELDS) if np is not None else None
+
+_BUCKET_DATE = re.compile(r"^(\d{4}-\d{2}-\d{2}) - ")
+_SESSION_TAG = re.compile(r"\s*\[\d{1,2}/\d{1,2}\]$")
+
+
+def _task_session(task):
+    """
+    (session date, customer, label) of a generated task, or None.
+
+    The customer is taken from the task name ("Customer [m/d] - Title"), whose
+    title part never contains " - ", and then matched against the bucket
+    ("YYYY-MM-DD - Customer[ - Label]"), so customers and labels containing
+    " - " are split correctly.
+    """
+    bucket = task.get("Bucket", "")
+    match = _BUCKET_DATE.match(bucket)
+    prefix, separator, _ = task.get("Task Name", "").rpartition(" - ")
+    if not match or not separator:
+        return None
+    customer = _SESSION_TAG.sub("", prefix)
+    rest = bucket[match.end():]
+    if rest == customer:
+        return match.group(1), customer, None
+    if rest.startswith(customer + " - "):
+        return match.group(1), customer, rest[len(customer) + 3:]
+    return None
+
+
+class LedgerUnavailable(RuntimeError):
+    """Raised when NumPy is not installed."""
+
+
+def _ordinal(value):
+    if isinstance(value, str):
+        value = datetime.strptime(value, "%Y-%m-%d" if "-" in value else "%m/%d/%Y")
+    return value.toordinal()
+
+
+def _templates():
+    from skillkit.timeline import ENGAGEMENT_TASKS, JOURNEY_SESSION_TASKS
+    return {"initial": ENGAGEMENT_TASKS, "followon": JOURNEY_SESSION_TASKS}
+
+
+class Ledger:
+    """Append-only task records plus their string dictionaries."""
+
+    def __init__(self, path=DEFAULT_LEDGER_DIR):
+        if np is None:
+            raise LedgerUnavailable("The task ledger needs NumPy (pip install numpy)")
+        self.path = path
+        self.records_path = os.path.join(path, RECORDS_FILE)
+        self.dictionary_path = os.path.join(path, DICTIONARY_FILE)
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        self._load_dictionary()
+
+    # --- dictionaries -------------------------------------------------------
+
+    def _load_dictionary(self):
+        try:
+            with open(self.dictionary_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+        if data.get("record") not in (None, [list(field) for field in RECORD_FIELDS]):
+            raise ValueError(f"{self.dictionary_path} was written with a different record layout")
+        self.customers = data.get("customers", [])
+        self.assignees = data.get("assignees", [])
+        self.labels = data.get("labels", [""])  # id 0: no label
+        self.templates = [tuple(t) for t in data.get("templates", [])]  # (session type, title, offset)
+        self._ids = {
+            "customers": {name: i for i, name in enumerate(self.customers)},
+            "assignees": {name: i for i, name in enumerate(self.assignees)},
+            "labels": {name: i for i, name in enumerate(self.labels)},
+            "templates": {t: i for i, t in enumerate(self.templates)},
+        }
+        self._dirty = False
+
+    def _id(self, table, value):
+        ids = self._ids[table]
+        if value not in ids:
+            ids[value] = len(ids)
+            getattr(self, table).append(value)
+            self._dirty = True
+        return ids[value]
+
+    def _save_dictionary(self):
+        if self._dirty:
+            write_json(self.dictionary_path, {
+                "record": [list(field) for field in RECORD_FIELDS],
+                "customers": self.customers,
+                "assignees": self.assignees,
+                "labels": self.labels,
+                "templates": [list(t) for t in self.templates],
+            })
+            self._dirty = False
+
+    # --- records ------------------------------------------------------------
+
+    def __len__(self):
+        try:
+            return os.path.getsize(self.records_path) // RECORD.itemsize
+        except OSError:
+            return 0
+
+    def records(self, writable=False):
+        """Memory-mapped view of every record (no copy; empty array when there are none)."""
+        count = len(self)
+        if not count:
+            return np.zeros(0, dtype=RECORD)
+        return np.memmap(self.records_path, dtype=RECORD, mode="r+" if writable else "r", shape=(count,))
+
+    def append_timeline(self, customer_name, engagement_date, tasks, session_type="initial", session_label=None):
+        """
+        Record one session's tasks, as returned by generate_task_timeline().
+
+        Earlier live records for the same customer and session date are
+        superseded unless they match exactly, in which case nothing is written.
+
+        Returns:
+            Number of records appended
+        """
+        template_list = _templates()[session_type]
+        if len(tasks) != len(template_list):
+            raise ValueError(f"Expected {len(template_list)} {session_type} tasks, got {len(tasks)}")
+        rows = [
+            (_ordinal(task["Due date"]), template["title"], template["offset"], task["Assignment"])
+            for task, template in zip(tasks, template_list)
+        ]
+        return self._append_session(customer_name, engagement_date, session_type, session_label, rows)
+
+    def append_journey(self, customer_name, sessions, session_tasks):
+        """Record every session from generate_journey_tasks(); returns records appended."""
+        appended = 0
+        for session in sessions:
+            appended += self.append_timeline(customer_name, session["date"], session_tasks[session["date"]],
+                                             session.get("type", "followon"), session.get("label"))
+        return appended
+
+    def _append_session(self, customer_name, session_date, session_type, session_label, rows):
+        with self._lock:
+            new = np.zeros(len(rows), dtype=RECORD)
+            new["session"] = _ordinal(session_date)
+            new["recorded"] = date.today().toordinal()
+            new["customer"] = self._id("customers", customer_name)
+            new["label"] = self._id("labels", session_label or "")
+            new["session_type"] = SESSION_TYPES.index(session_type)
+            new["live"] = 1
+            new["due"] = [due for due, _, _, _ in rows]
+            new["template"] = [self._id("templates", (session_type, title, offset)) for _, title, offset, _ in rows]
+            new["offset"] = [offset for _, _, offset, _ in rows]
+            new["assignee"] = [self._id("assignees", assignee) for _, _, _, assignee in rows]
+
+            existing = self.records(writable=True)
+            if len(existing):
+                previous = np.flatnonzero(
+                    (existing["live"] == 1)
+                    & (existing["customer"] == new["customer"][0])
+                    & (existing["session"] == new["session"][0])
+                )
+                if len(previous) == len(new) and _same_tasks(existing[previous], new):
+                    self._save_dictionary()
+                    return 0
+                if len(previous):
+                    existing["live"][previous] = 0
+                    existing.flush()
+            del existing
+
+            # Dictionary first: a crash afterwards leaves unused strings, never unknown ids
+            self._save_dictionary()
+            with open(self.records_path, "ab") as f:
+                f.truncate(len(self) * RECORD.itemsize)  # Drop a torn record from a crashed write
+                f.write(new.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            return len(new)
+
+    # --- queries ------------------------------------------------------------
+
+    def _mask(self, records, start=None, end=None, customer=None, assignee=None, live=True):
+        mask = np.ones(len(records), dtype=bool)
+        if live:
+            mask &= records["live"] == 1
+        if start is not None:
+            mask &= records["due"] >= _ordinal(start)
+        if end is not None:
+            mask &= records["due"] <= _ordinal(end)
+        for field, table, value in (("customer", "customers", customer), ("assignee", "assignees", assignee)):
+            if value is not None:
+                if value not in self._ids[table]:
+                    return np.zeros(len(records), dtype=bool)
+                mask &= records[field] == self._ids[table][value]
+        return mask
+
+    def select(self, start=None, end=None, customer=None, assignee=None, live=True):
+        """Matching records (structured array, ordered by due date)."""
+        records = self.records()
+        if not len(records):
+            return records
+        matches = records[self._mask(records, start, end, customer, assignee, live)]
+        return matches[np.argsort(matches["due"], kind="stable")]
+
+    def due_between(self, start, end, customer=None, assignee=None):
+        """Live tasks due from start to end inclusive, decoded to dicts."""
+        return [self.decode(record) for record in self.select(start, end, customer, assignee)]
+
+    def count_by(self, field="assignee", start=None, end=None, customer=None, assignee=None):
+        """{name: live task count} per assignee, customer, label or template title."""
+        table = {"assignee": self.assignees, "customer": self.customers, "label": self.labels,
+                 "template": [t[1] for t in self.templates]}[field]
+        records = self.records()
+        if not len(records):
+            return {}
+        column = records[field][self._mask(records, start, end, customer, assignee)]
+        counts = np.bincount(column, minlength=len(table))
+        totals = {}
+        for i in np.flatnonzero(counts):
+            totals[table[i]] = totals.get(table[i], 0) + int(counts[i])
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def decode(self, record):
+        session_type, title, _ = self.templates[record["template"]]
+        return {
+            "due": date.fromordinal(int(record["due"])).isoformat(),
+            "session": date.fromordinal(int(record["session"])).isoformat(),
+            "customer": self.customers[record["customer"]],
+            "label": self.labels[record["label"]] or None,
+            "assignee": self.assignees[record["assignee"]],
+            "title": title,
+            "offset": int(record["offset"]),
+            "session_type": session_type,
+        }
+
+    def stats(self):
+        records = self.records()
+        return {
+            "records": len(records),
+            "live": int(np.count_nonzero(records["live"])) if len(records) else 0,
+            "customers": len(self.customers),
+            "assignees": len(self.assignees),
+            "bytes": len(records) * RECORD.itemsize,
+        }
+
+    # --- existing CSVs ------------------------------------------------------
+
+    def append_tasks(self, tasks):
+        """
+        Record Planner task dicts (as saved by skillkit.planner), working out
+        customer, session date, label and template from each bucket and
+        task name. Tasks that are not a whole generated timeline are skipped.
+
+        Returns:
+            Number of records appended
+        """
+        sessions = {}
+        for task in tasks:
+            session = _task_session(task)
+            if session:
+                sessions.setdefault(session, []).append(task)
+
+        appended = 0
+        templates = _templates()
+        for (session_date, customer_name, label), session in sessions.items():
+            titles = [task["Task Name"].rsplit(" - ", 1)[-1] for task in session]
+            session_type = next((kind for kind, template in templates.items()
+                                 if titles == [t["title"] for t in template]), None)
+            if session_type is None:
+                continue  # Not a generated timeline (edited or from an older template)
+            appended += self.append_timeline(customer_name, session_date, session, session_type, label)
+        return appended
+
+    def ingest_csv(self, path):
+        """Record a Planner CSV written by business_days.py; returns records appended."""
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return self.append_tasks(list(csv.DictReader(f)))
+
+    def ingest(self, base_path):
+        """Record every tasks*.csv under the engagements folder; returns records appended."""
+        appended = 0
+        for path in sorted(glob.glob(os.path.join(base_path, "*", "tasks*.csv"))):
+            if os.path.basename(path) != "tasks_all_sessions.csv":
+                appended += self.ingest_csv(path)
+        return appended
+
+
+_record_lock = threading.Lock()
+
+
+def record_tasks(tasks, path=DEFAULT_LEDGER_DIR):
+    """
+    Ledger(path).append_tasks(tasks), serialized within the process.
+
+    skillkit.planner calls this after every saved CSV, so it never raises: 0
+    when NumPy is not installed, and a logged warning plus 0 when the ledger
+    cannot be written or read.
+    """
+    with _record_lock:
+        try:
+            return Ledger(path).append_tasks(tasks)
+        except LedgerUnavailable:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.warning("Task ledger not updated (%s): %s", path, e)
+            return 0
+
+
+def _same_tasks(old, new):
+    fields = ["due", "template", "assignee", "label", "session_type"]
+    return all(np.array_equal(old[field], new[field]) for field in fields)
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    import time
+
+    parser = argparse.ArgumentParser(description="Query the columnar task ledger")
+    parser.add_argument("--ledger", default=DEFAULT_LEDGER_DIR, help="Ledger folder")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("due", help="Tasks due in a date range")
+    p.add_argument("--from", dest="start", required=True, help="YYYY-MM-DD")
+    p.add_argument("--to", dest="end", required=True, help="YYYY-MM-DD")
+    p.add_argument("--customer")
+    p.add_argument("--assignee")
+    p = sub.add_parser("counts", help="Live task counts")
+    p.add_argument("--by", choices=["assignee", "customer", "label", "template"], default="assignee")
+    p.add_argument("--from", dest="start")
+    p.add_argument("--to", dest="end")
+    p.add_argument("--customer")
+    p = sub.add_parser("ingest", help="Record existing tasks*.csv files")
+    p.add_argument("--base", help="Engagements folder (default: engagements_base_path in config.json)")
+    sub.add_parser("stats", help="Record and dictionary sizes")
+    args = parser.parse_args()
+
+    try:
+        ledger = Ledger(args.ledger)
+    except LedgerUnavailable as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.command == "due":
+        started = time.perf_counter()
+        tasks = ledger.due_between(args.start, args.end, args.customer, args.assignee)
+        elapsed = time.perf_counter() - started
+        for task in tasks:
+            label = f" ({task['label']})" if task["label"] else ""
+            print(f"  {task['due']}  {task['customer']}{label} - {task['title']}  [{task['assignee']}]")
+        print(f"{len(tasks)} task(s) in {elapsed * 1000:.1f} ms")
+    elif args.command == "counts":
+        for name, count in ledger.count_by(args.by, args.start, args.end, args.customer).items():
+            print(f"  {count:>6}  {name}")
+    elif args.command == "ingest":
+        from skillkit.config import load_base_path
+
+        base = args.base or load_base_path()
+        if not base or not os.path.isdir(base):
+            print("❌ Engagements folder not found (use --base or set engagements_base_path in config.json)")
+            sys.exit(1)
+        print(f"✅ Recorded {ledger.ingest(base)} task(s)")
+    else:
+        print(json.dumps(ledger.stats(), indent=2))
@@ -0,0 +1,91 @@
+"""
+Microsoft Planner CSV export for task timelines.
+
+Writes the tasks from skillkit.timeline in the column layout Planner's import
+expects, one file per session (tasks_YYYY-MM-DD.csv) plus a combined file for
+journeys. Files are written with skillkit.atomic, so an unchanged timeline
+causes no OneDrive upload, and each saved timeline is recorded in the task
+ledger (skillkit.ledger; skipped without NumPy).
+"""
+
+import csv
+import io
+import os
+from typing import List, Dict
+
+from skillkit.atomic import write_text
+
+PLANNER_FIELDS = [
+    "Task Name",
+    "Assignment",
+    "Start date",
+    "Due date",
+    "Bucket",
+    "Progress",
+    "Priority",
+    "Labels"
+]
+
+
+def save_journey_tasks(
+    customer_name: str,
+    session_tasks: Dict[str, List[Dict]],
+    output_dir: str,
+    combined: bool = True,
+    record: bool = True
+) -> List[str]:
+    """
+    Save journey session tasks as per-session CSVs and optionally a combined CSV.
+    
+    Args:
+        customer_name: Customer name for filename
+        session_tasks: Dict from generate_journey_tasks()
+        output_dir: Directory to write CSV files
+        combined: If True, also write a combined CSV with all sessions
+        record: If True, record each session's tasks in the task ledger
+    
+    Returns:
+        List of created file paths
+    """
+    created_files = []
+    all_tasks = []
+    
+    for session_date, tasks in sorted(session_tasks.items()):
+        # Per-session file: tasks_YYYY-MM-DD.csv
+        filename = f"tasks_{session_date}.csv"
+        filepath = os.path.join(output_dir, filename)
+        save_tasks_csv(tasks, filepath, record)
+        created_files.append(filepath)
+        all_tasks.extend(tasks)
+    
+    if combined and len(session_tasks) > 1:
+        combined_path = os.path.join(output_dir, "tasks_all_sessions.csv")
+        save_tasks_csv(all_tasks, combined_path, record=False)  # Sessions are recorded above
+        created_files.append(combined_path)
+    
+    return created_files
+
+
+def save_tasks_csv(tasks: List[Dict], output_path: str, record: bool = True) -> str:
+    """
+    Save tasks to CSV format for Microsoft Planner import.
+
+    Written atomically, and skipped when the file already holds the same CSV,
+    so re-running for an unchanged timeline causes no OneDrive upload. With
+    record=True the tasks are also recorded in the task ledger (an unchanged
+    timeline is a no-op there too).
+    """
+    if not tasks:
+        return None
+    
+    buffer = io.StringIO(newline='')
+    writer = csv.DictWriter(buffer, fieldnames=PLANNER_FIELDS)
+    writer.writeheader()
+    writer.writerows(tasks)
+    write_text(output_path, buffer.getvalue())
+    if record:
+        # Imported here: the ledger pulls in NumPy
+        from skillkit.ledger import record_tasks
+        record_tasks(tasks)
+
+    return output_path
@@ -0,0 +1,430 @@
+"""
+Streaming transcript digest for planning and meeting transcripts.
+
+Hour-long calls are mostly filler and back-channel ("yeah", "mm-hmm", "right").
+digest_transcript() reads a transcript line by line in constant memory and
+produces a compact digest for the agenda, closeout and follow-up skills:
+
+  - speakers and timestamps normalized across Teams VTT, Teams/Word exports
+    ("Name   0:03" headers) and "[hh:mm:ss] Name: text" style lines
+  - filler words removed, back-channel turns dropped, same-speaker turns merged
+  - candidate dates, times, attendees and topics tallied as it streams
+  - the most informative turns kept, in order, within a token budget
+
+Usage:
+    from skillkit.transcript import digest_transcript
+
+    digest = digest_transcript("planning_call.vtt", token_budget=1500)
+    print(digest["text"])
+    print(digest["stats"]["compression_ratio"])
+
+Command line:
+    python .github/skills/_shared/skillkit/transcript.py planning_call.vtt --budget 1500 [--output digest.md]
+"""
+
+import heapq
+import re
+from collections import Counter
+
+# Rough token estimate for English text (OpenAI/Anthropic tokenizers average ~4 chars)
+CHARS_PER_TOKEN = 4
+DEFAULT_TOKEN_BUDGET = 1500
+# A monologue is split into turns of at most this many characters
+MAX_TURN_CHARS = 1200
+# Tallies are pruned back to half this size when they grow past it
+_MAX_TALLY = 4000
+
+_TIMESTAMP = r"(?:\d{1,2}:)?\d{1,2}:\d{2}(?:[.,]\d{1,3})?"
+_VTT_CUE = re.compile(rf"^\s*({_TIMESTAMP})\s*-->\s*{_TIMESTAMP}")
+_VTT_VOICE = re.compile(r"^<v\s+([^>]+)>(.*?)(?:</v>)?\s*$")
+_BRACKETED = re.compile(rf"^\s*\[?({_TIMESTAMP})\]?\s+([^:\[\]]{{1,60}}?):\s*(.*)$")
+_NAME_PAREN_TIME = re.compile(rf"^\s*([^:()\[\]]{{1,60}}?)\s*\(({_TIMESTAMP})\):\s*(.*)$")
+_HEADER_NAME_TIME = re.compile(rf"^\s*([A-Z][^\d:]{{0,60}}?)\s{{2,}}({_TIMESTAMP})\s*$")
+_NAME_COLON = re.compile(r"^\s*([A-Z][\w.'-]*(?:\s+[A-Z][\w.'-]*){0,3}(?:\s+\d{1,3})?):\s+(.*)$")
+_SKIP_LINE = re.compile(r"^\s*(WEBVTT|NOTE\b|\d+\s*$)")
+
+# Hesitation sounds are never content
+_HESITATION = re.compile(r",?\s*\b(?:um+|uh+|erm|hmm+|mm+-?hmm)\b\s*,?\s*", re.IGNORECASE)
+# Phrases that are filler only as interjections set off by commas ("So, you know,
+# we need" or "it works, you know."), never inside a clause ("Do you know the
+# deadline?", "What kind of data?")
+_FILLER_PHRASE = r"(?:you know|i mean|kind of|sort of|basically|literally|like)"
+_FILLER = re.compile(
+    rf"(?:,\s*|(?<=[.?!;])\s*|^\s*){_FILLER_PHRASE}\s*,\s*"
+    rf"|,\s*{_FILLER_PHRASE}\s*(?=[.?!;]|$)",
+    re.IGNORECASE,
+)
+# Meeting logistics sentences carry nothing for the digest
+_LOGISTICS = re.compile(
+    r"[^.?!]*\b(?:share my screen|see my screen|you see it|on mute|hear me|you're muted|"
+    r"dropped off|bad connection|give (?:it|people) a (?:minute|few minutes))\b[^.?!]*[.?!]?",
+    re.IGNORECASE,
+)
+# Stutters ("we we need"): words only, so "2, 2 GPUs" keeps both numbers
+_REPEATED_WORD = re.compile(r"\b([A-Za-z']+)(?:[\s,]+\1\b)+", re.IGNORECASE)
+# Words that are correctly doubled in ordinary speech ("I think that that is fine")
+_DOUBLED_WORDS = frozenset({"that", "had", "is", "do", "very", "really", "so", "no"})
+# Acknowledgements with no content. Yes/no-type answers are not here: a one-word
+# reply to a question is content.
+_BACKCHANNEL = frozenset("""
+yeah ok okay right sure great cool nice good perfect awesome
+totally mm mhm mmhmm hmm uh huh oh ah wow thanks thank you
+got it makes sense sounds good i see gotcha alright all
+""".split())
+
+_MONTHS = ("january february march april may june july august september october november december "
+           "jan feb mar apr jun jul aug sep sept oct nov dec")
+_DATE = re.compile(
+    rf"\b(?:(?:{'|'.join(_MONTHS.split())})\.?\s+\d{{1,2}}(?:st|nd|rd|th)?(?:,?\s+\d{{4}})?"
+    r"|\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}(?:/\d{2,4})?"
+    r"|(?:next|this)\s+(?:monday|tuesday|wednesday|thursday|friday|week|month)"
+    r"|(?:monday|tuesday|wednesday|thursday|friday)(?:\s+the\s+\d{1,2}(?:st|nd|rd|th)?)?)\b",
+    re.IGNORECASE,
+)
+_TIME = re.compile(
+    r"\b(?:\d{1,2}(?::\d{2})?\s?(?:am|pm|a\.m\.|p\.m\.)"
+    r"|\d{1,2}(?::\d{2})?\s?(?:to|-|until)\s?\d{1,2}(?::\d{2})?\s?(?:am|pm)?"
+    r"|half[- ]day|full[- ]day|(?:one|two|three|\d)[- ]day|\d+\s?(?:minutes|mins|hours?))\b",
+    re.IGNORECASE,
+)
+# Capitalized multi-word phrases ("Copilot Studio", "Azure OpenAI Service")
+_PHRASE = re.compile(r"\b([A-Z][a-zA-Z0-9]+(?:\s+(?:[A-Z][a-zA-Z0-9]+|AI|ML|API|SDK)){1,3})\b")
+_ACRONYM = re.compile(r"\b([A-Z]{2,6}s?|[A-Z][a-z]+[A-Z][A-Za-z]+)\b")   # ERP, APIs, FedRAMP, OpenAI
+_CUE_WORDS = re.compile(
+    r"\b(?:agenda|next steps?|action items?|follow[- ]up|decid\w*|agree\w*|priority|priorities|"
+    r"goal|outcome|requirement\w*|blocker\w*|timeline|deadline|demo|workshop|session|"
+    r"prototype|pilot|architecture|use cases?|budget|owner)\b",
+    re.IGNORECASE,
+)
+_COMMON_PHRASES = frozenset({"Thank You", "Good Morning", "Good Afternoon", "Of Course", "Okay So"})
+_COMMON_ACRONYMS = frozenset({"OK", "AM", "PM", "I", "US", "IT"})
+
+
+def _seconds(timestamp):
+    parts = timestamp.replace(",", ".").split(":")
+    seconds = 0.0
+    for part in parts:
+        seconds = seconds * 60 + float(part)
+    return int(seconds)
+
+
+def format_timestamp(seconds):
+    if seconds is None:
+        return "--:--:--"
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def estimate_tokens(text):
+    return max(1, len(text) // CHARS_PER_TOKEN) if text else 0
+
+
+class _SpeakerNames:
+    """Canonical speaker names: "JANE DOE", "Jane Doe (Contoso)" and "jane.doe@x.com" are one person."""
+
+    def __init__(self):
+        self._names = {}
+
+    def normalize(self, raw):
+        name = re.sub(r"\s*\([^)]*\)\s*$", "", raw).strip()   # "(Contoso)", "(Guest)"
+        if "@" in name:
+            name = re.sub(r"[._]", " ", name.split("@")[0])
+        name = re.sub(r"\s+", " ", name).strip(" -:")
+        if name.isupper() or name.islower():
+            name = name.title()
+        key = re.sub(r"[^a-z0-9]", "", name.lower())   # "Speaker 1" and "Speaker 2" stay apart
+        return self._names.setdefault(key, name) if key else "Unknown"
+
+
+def iter_turns(lines, clean=None):
+    """
+    Parse transcript lines into (speaker, seconds or None, text) turns.
+
+    Consecutive lines from one speaker are merged (up to MAX_TURN_CHARS), so
+    memory stays bounded by one turn whatever the transcript length.
+
+    Args:
+        lines: Iterable of transcript lines
+        clean: Optional text -> text function applied to each line's text
+               before merging; lines it empties are dropped
+    """
+    names = _SpeakerNames()
+    speaker, start, parts, size = None, None, [], 0
+    cue_time = None
+
+    def flush():
+        text = " ".join(parts).strip()
+        return (speaker or "Unknown", start, text) if text else None
+
+    for raw in lines:
+        line = raw.rstrip("\n").strip()
+        if not line or _SKIP_LINE.match(line):
+            continue
+        new_speaker, new_time, text = None, None, None
+        cue = _VTT_CUE.match(line)
+        if cue:
+            cue_time = _seconds(cue.group(1))
+            continue
+        voice = _VTT_VOICE.match(line)
+        if voice:
+            new_speaker, new_time, text = voice.group(1), cue_time, voice.group(2)
+        else:
+            for pattern, order in ((_BRACKETED, (2, 1, 3)), (_NAME_PAREN_TIME, (1, 2, 3))):
+                match = pattern.match(line)
+                if match:
+                    new_speaker, new_time, text = (match.group(i) for i in order)
+                    new_time = _seconds(new_time)
+                    break
+            else:
+                header = _HEADER_NAME_TIME.match(line)
+                named = _NAME_COLON.match(line)
+                if header:
+                    new_speaker, new_time, text = header.group(1), _seconds(header.group(2)), ""
+                elif named:
+                    new_speaker, text = named.group(1), named.group(2)
+                else:
+                    text = line
+        text = re.sub(r"</?[^>]+>", "", text or "")   # leftover VTT markup
+        if text and clean:
+            text = clean(text)
+            if not text:
+                # A dropped "yeah" should not split the other speaker's turn
+                continue
+
+        if new_speaker is not None:
+            new_speaker = names.normalize(new_speaker)
+            if new_speaker != speaker or size >= MAX_TURN_CHARS:
+                turn = flush()
+                if turn:
+                    yield turn
+                speaker, start, parts, size = new_speaker, new_time, [], 0
+        elif size >= MAX_TURN_CHARS:
+            turn = flush()
+            if turn:
+                yield turn
+            parts, size = [], 0
+        if start is None:
+            start = new_time if new_time is not None else cue_time
+        if text and (not parts or parts[-1] != text):
+            parts.append(text)
+            size += len(text) + 1
+    turn = flush()
+    if turn:
+        yield turn
+
+
+def _collapse_stutter(match):
+    word = match.group(1)
+    return match.group(0) if word.lower() in _DOUBLED_WORDS else word
+
+
+def clean_text(text):
+    """Remove filler words, stutters ("we we we need" -> "we need") and logistics chatter."""
+    text = _LOGISTICS.sub("", text)
+    text = _HESITATION.sub(" ", text)
+    text = _FILLER.sub(" ", text)
+    text = _REPEATED_WORD.sub(_collapse_stutter, text)
+    text = re.sub(r"\s+([,.?!])", r"\1", text)
+    text = re.sub(r"^[,.\s]+", "", text)
+    text = re.sub(r"\s{2,}", " ", text).strip()
+    return text[:1].upper() + text[1:]
+
+
+def is_backchannel(text):
+    words = re.findall(r"[a-z']+", text.lower())
+    return len(words) <= 4 and all(word.strip("'") in _BACKCHANNEL for word in words)
+
+
+def _prune(tally):
+    if len(tally) > _MAX_TALLY:
+        keep = tally.most_common(_MAX_TALLY // 2)
+        tally.clear()
+        tally.update(dict(keep))
+
+
+class TranscriptDigester:
+    """
+    Incremental digest builder; feed() turns, then digest().
+
+    Keeps only tallies and a budget-sized heap of candidate turns, so memory
+    does not grow with transcript length.
+    """
+
+    def __init__(self, token_budget=DEFAULT_TOKEN_BUDGET):
+        self.token_budget = token_budget
+        # Room for the key-turns section after the header lists
+        self._turn_budget = max(50, int(token_budget * 0.7))
+        self.dates = Counter()
+        self.times = Counter()
+        self.topics = Counter()
+        self.speakers = Counter()        # words spoken
+        self.speaker_turns = Counter()
+        self.stats = Counter()
+        self.first_time = None
+        self.last_time = None
+        self._heap = []                  # (score, sequence, seconds, speaker, text)
+        self._heap_tokens = 0
+        self._sequence = 0
+        self._last_speaker = None
+
+    def feed_lines(self, lines):
+        for line in lines:
+            self.stats["input_chars"] += len(line)
+            self.stats["input_lines"] += 1
+            yield line
+
+    def clean(self, text):
+        """Per-line cleanup for iter_turns(): filler removed, back-channel lines dropped."""
+        cleaned = clean_text(text)
+        if not cleaned or is_backchannel(cleaned):
+            self.stats["backchannel_dropped"] += 1
+            return ""
+        return cleaned
+
+    def feed(self, speaker, seconds, cleaned):
+        """Add one turn (text already passed through clean())."""
+        self.stats["turns"] += 1
+        if seconds is not None:
+            self.first_time = seconds if self.first_time is None else self.first_time
+            self.last_time = seconds
+        words = len(cleaned.split())
+        self.speakers[speaker] += words
+        self.speaker_turns[speaker] += 1
+
+        signals = 0
+        for match in _DATE.findall(cleaned):
+            date = re.sub(r"\s+", " ", match.strip())
+            self.dates[date[:1].upper() + date[1:]] += 1
+            signals += 2
+        for match in _TIME.findall(cleaned):
+            self.times[re.sub(r"\s+", " ", match.strip()).lower()] += 1
+            signals += 2
+        for phrase in _PHRASE.findall(cleaned):
+            if phrase not in _COMMON_PHRASES and not phrase.startswith(speaker.split()[0] + " "):
+                self.topics[phrase] += 1
+                signals += 1
+        for acronym in _ACRONYM.findall(cleaned):
+            if acronym not in _COMMON_ACRONYMS:
+                self.topics[acronym] += 1
+                signals += 1
+        signals += 2 * len(_CUE_WORDS.findall(cleaned))
+        _prune(self.dates)
+        _prune(self.times)
+        _prune(self.topics)
+        self._keep(speaker, seconds, cleaned, words, signals)
+
+    def _keep(self, speaker, seconds, text, words, signals):
+        if words < 6 and not signals:
+            return
+        if any(entry[4] == text for entry in self._heap):
+            return
+        # Informative turns: signals per word, with a floor so long substantive turns count
+        score = signals / (words ** 0.5) + min(words, 60) / 120
+        tokens = estimate_tokens(f"[{format_timestamp(seconds)}] {speaker}: {text}")
+        self._sequence += 1
+        heapq.heappush(self._heap, (score, self._sequence, seconds, speaker, text, tokens))
+        self._heap_tokens += tokens
+        while self._heap_tokens > self._turn_budget and len(self._heap) > 1:
+            self._heap_tokens -= heapq.heappop(self._heap)[-1]
+
+    def digest(self, title="Transcript digest"):
+        """
+        Build the digest text.
+
+        Returns:
+            {"text": digest markdown, "stats": counts and compression_ratio,
+             "dates", "times", "attendees", "topics": ranked candidate lists}
+        """
+        total_words = sum(self.speakers.values()) or 1
+        attendees = [
+            {"name": name, "turns": self.speaker_turns[name], "share": round(words / total_words, 2)}
+            for name, words in self.speakers.most_common()
+        ]
+        dates = [d for d, _ in self.dates.most_common(8)]
+        times = [t for t, _ in self.times.most_common(8)]
+        topics = [t for t, n in self.topics.most_common(25) if n > 1 or len(self.topics) < 25][:20]
+
+        lines = [f"# {title}", ""]
+        if self.first_time is not None:
+            lines.append(f"Duration: {format_timestamp(self.first_time)} - {format_timestamp(self.last_time)}")
+        lines.append("Attendees: " + ", ".join(
+            f"{a['name']} ({a['turns']} turns, {a['share']:.0%})" for a in attendees
+        ))
+        if dates:
+            lines.append("Candidate dates: " + "; ".join(dates))
+        if times:
+            lines.append("Candidate times: " + "; ".join(times))
+        if topics:
+            lines.append("Topics: " + "; ".join(topics))
+        lines += ["", "## Key turns", ""]
+
+        header_tokens = estimate_tokens("\n".join(lines))
+        budget = self.token_budget - header_tokens
+        kept = sorted(self._heap, key=lambda entry: entry[1])
+        # The header may have used more than its share; drop the weakest turns to fit
+        while kept and sum(entry[-1] for entry in kept) > budget:
+            kept.remove(min(kept))
+        for _, _, seconds, speaker, text, _ in kept:
+            lines.append(f"[{format_timestamp(seconds)}] {speaker}: {text}")
+
+        text = "\n".join(lines) + "\n"
+        input_tokens = max(1, self.stats["input_chars"] // CHARS_PER_TOKEN)
+        output_tokens = estimate_tokens(text)
+        stats = dict(self.stats)
+        stats.update({
+            "turns_kept": len(kept),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "compression_ratio": round(input_tokens / output_tokens, 1),
+        })
+        return {"text": text, "stats": stats, "dates": dates, "times": times,
+                "attendees": attendees, "topics": topics}
+
+
+def digest_transcript(source, token_budget=DEFAULT_TOKEN_BUDGET, title="Transcript digest"):
+    """
+    Digest a transcript file path or any iterable of lines.
+
+    Args:
+        source: Path to a .vtt/.txt/.md transcript, or an iterable of lines
+        token_budget: Approximate size limit of the digest in tokens
+        title: Heading of the digest
+
+    Returns:
+        See TranscriptDigester.digest()
+    """
+    digester = TranscriptDigester(token_budget)
+    if isinstance(source, str):
+        with open(source, "r", encoding="utf-8-sig", errors="replace") as f:
+            for turn in iter_turns(digester.feed_lines(f), digester.clean):
+                digester.feed(*turn)
+    else:
+        for turn in iter_turns(digester.feed_lines(source), digester.clean):
+            digester.feed(*turn)
+    return digester.digest(title)
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Shrink a meeting transcript into a compact digest")
+    parser.add_argument("transcript", help="Transcript file (.vtt, .txt, .md) or - for stdin")
+    parser.add_argument("--budget", type=int, default=DEFAULT_TOKEN_BUDGET, help="Token budget (default: 1500)")
+    parser.add_argument("--title", default="Transcript digest")
+    parser.add_argument("--output", help="Write the digest here instead of stdout")
+    args = parser.parse_args()
+
+    source = sys.stdin if args.transcript == "-" else args.transcript
+    result = digest_transcript(source, args.budget, args.title)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(result["text"])
+    else:
+        sys.stdout.write(result["text"])
+    s = result["stats"]
+    print(
+        f"\n{s.get('input_lines', 0)} lines, {s.get('turns', 0)} turns "
+        f"({s.get('backchannel_dropped', 0)} back-channel lines dropped, {s['turns_kept']} kept): "
+        f"~{s['input_tokens']} -> ~{s['output_tokens']} tokens ({s['compression_ratio']}x)",
+        file=sys.stderr,
+    )
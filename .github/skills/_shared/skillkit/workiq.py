@@ -0,0 +1,459 @@
+"""
+Cached WorkIQ client for meeting transcripts, chat and summaries.
+
+engagement-closeout, followup-email and journey-promoter each ask WorkIQ about
+the same meeting. WorkIQClient puts an on-disk cache in front of the backend,
+keyed by (customer, meeting date, query), so one engagement costs one fetch
+per distinct query no matter how many skills ask:
+
+    from skillkit.workiq import WorkIQClient
+
+    client = WorkIQClient()                      # backend from WORKIQ_COMMAND
+    text = client.query("Contoso", "2026-03-12", "transcript")
+
+The cache is a SQLite file (~/.copilot-skills/workiq_cache.db, or
+WORKIQ_CACHE_DB) holding zlib-compressed responses. Entries expire after a TTL
+(default 7 days) and the least recently used are evicted once the compressed
+total passes max_bytes. Concurrent requests for the same key in one process
+share a single fetch.
+
+Backends are callables fetch(customer, meeting_date, query_text) -> str:
+
+    HttpBackend      posts to a WorkIQ bridge service (WORKIQ_URL)
+    CommandBackend   runs a command (WORKIQ_COMMAND, e.g. 'workiq ask -q {query}')
+    StubBackend      answers from local fixture files, for offline testing
+
+`workiq.py serve --stub fixtures/` runs a StubBackend as a local stand-in
+service that HttpBackend can talk to.
+
+WorkIQ is usually called by the agent as a tool rather than from Python. The
+command line lets the agent share those answers through the same cache:
+
+    python .github/skills/_shared/skillkit/workiq.py get --customer Contoso --date 2026-03-12 --query transcript
+    python .github/skills/_shared/skillkit/workiq.py put --customer Contoso --date 2026-03-12 --query transcript < answer.txt
+
+get exits with status 1 on a miss; query the tool, then put the answer.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shlex
+import sqlite3
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+import zlib
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    "WORKIQ_CACHE_DB", os.path.join(os.path.expanduser("~"), ".copilot-skills", "workiq_cache.db")
+)
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Named queries shared by the skills; anything else is sent as written
+QUERIES = {
+    "transcript": "Give me the full transcript of the {customer} meeting on {date}, with speaker names and timestamps.",
+    "chat": "Give me the meeting chat from the {customer} meeting on {date}.",
+    "summary": (
+        "Give me a detailed summary of the {customer} meeting from {date}. Include the agenda or "
+        "structure, key topics, decisions, outcomes, what worked well, challenges, new opportunities, "
+        "follow-up sessions, action items with owners and timelines, and attendees."
+    ),
+    "recent_meetings": "List my recent meetings with {customer} since {date}, with dates, titles and attendees.",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    customer TEXT NOT NULL,
+    meeting_date TEXT NOT NULL,
+    query TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+CREATE INDEX IF NOT EXISTS responses_customer ON responses (customer, meeting_date);
+"""
+
+
+class WorkIQError(RuntimeError):
+    """The backend failed to answer a query."""
+
+
+class MeetingNotFound(WorkIQError, LookupError):
+    """The backend has no meeting for this customer and date."""
+
+
+def _normalize(text):
+    return re.sub(r"\s+", " ", text.strip().lower())
+
+
+def cache_key(customer, meeting_date, query):
+    raw = "\x1f".join((_normalize(customer), meeting_date.strip(), _normalize(query)))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def query_text(customer, meeting_date, query):
+    """Expand a named query ("transcript", "chat", ...) into the text sent to WorkIQ."""
+    template = QUERIES.get(query, query)
+    return template.format(customer=customer, date=meeting_date)
+
+
+class WorkIQCache:
+    """TTL + LRU cache of compressed WorkIQ responses in SQLite."""
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        path = path or DEFAULT_CACHE_PATH
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(_SCHEMA)
+        self.counters = {"hits": 0, "misses": 0, "expired": 0, "evicted": 0}
+
+    def close(self):
+        self.conn.close()
+
+    def get(self, customer, meeting_date, query, ttl=None):
+        """Cached response text, or None if missing or older than ttl seconds."""
+        key = cache_key(customer, meeting_date, query)
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        with self._lock, self.conn:
+            row = self.conn.execute("SELECT created, data FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.counters["misses"] += 1
+                return None
+            if now - row[0] > ttl:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.counters["expired"] += 1
+                self.counters["misses"] += 1
+                return None
+            self.conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.counters["hits"] += 1
+        return zlib.decompress(row[1]).decode("utf-8")
+
+    def put(self, customer, meeting_date, query, text):
+        """Store a response and evict least recently used entries past max_bytes."""
+        data = zlib.compress(text.encode("utf-8"), 6)
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, customer, meeting_date, query, created, accessed, size, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (cache_key(customer, meeting_date, query), _normalize(customer), meeting_date.strip(),
+                 _normalize(query), now, now, len(data), data),
+            )
+            self._evict()
+
+    def _evict(self):
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+            if total <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.counters["evicted"] += 1
+
+    def invalidate(self, customer=None, meeting_date=None):
+        """Drop cached responses for a customer (and date), or everything."""
+        clauses, params = [], []
+        if customer:
+            clauses.append("customer = ?")
+            params.append(_normalize(customer))
+        if meeting_date:
+            clauses.append("meeting_date = ?")
+            params.append(meeting_date.strip())
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        with self._lock, self.conn:
+            return self.conn.execute(f"DELETE FROM responses{where}", params).rowcount
+
+    def purge_expired(self):
+        with self._lock, self.conn:
+            return self.conn.execute(
+                "DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,)
+            ).rowcount
+
+    def stats(self):
+        with self._lock:
+            entries, stored = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"entries": entries, "stored_bytes": stored, **self.counters}
+
+
+class CommandBackend:
+    """
+    Runs a WorkIQ command line per query.
+
+    The command is a template with {query} (and optionally {customer}, {date}),
+    e.g. 'workiq ask -q {query}'; defaults to the WORKIQ_COMMAND environment variable.
+    """
+
+    def __init__(self, command=None, timeout=120):
+        self.command = command or os.environ.get("WORKIQ_COMMAND")
+        if not self.command:
+            raise WorkIQError("No WorkIQ command configured (set WORKIQ_COMMAND or use StubBackend)")
+        self.timeout = timeout
+
+    def __call__(self, customer, meeting_date, text):
+        argv = [part.format(query=text, customer=customer, date=meeting_date)
+                for part in shlex.split(self.command)]
+        try:
+            result = subprocess.run(argv, capture_output=True, text=True, timeout=self.timeout)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise WorkIQError(f"WorkIQ command failed: {e}") from e
+        if result.returncode != 0:
+            raise WorkIQError(f"WorkIQ command exited {result.returncode}: {result.stderr.strip()[:500]}")
+        return result.stdout
+
+
+def _slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+class StubBackend:
+    """
+    Offline backend answering from fixture files.
+
+    Layout: <root>/<customer-slug>/<date>/<query>.txt, where <query> is the
+    named query ("transcript", "chat", ...) or "default" as a fallback for any
+    query about that meeting. Missing meetings raise MeetingNotFound.
+
+    Args:
+        root: Fixture folder
+        latency: Seconds to sleep per call, to imitate the real service
+    """
+
+    def __init__(self, root, latency=0.0):
+        self.root = root
+        self.latency = latency
+        self.calls = 0
+
+    def __call__(self, customer, meeting_date, text):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        folder = os.path.join(self.root, _slug(customer), meeting_date)
+        named = next((name for name in QUERIES
+                      if query_text(customer, meeting_date, name) == text), None)
+        for name in filter(None, (named, _slug(text)[:80], "default")):
+            path = os.path.join(folder, name + ".txt")
+            if os.path.isfile(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    return f.read()
+        raise MeetingNotFound(f"No {customer} meeting on {meeting_date} in {self.root}")
+
+
+class HttpBackend:
+    """
+    Posts {"customer", "date", "query"} as JSON to a WorkIQ bridge service.
+
+    The service answers 200 with the response text, 404 for an unknown
+    meeting. `timeout` bounds each request, so a hung service frees the
+    caller instead of holding it.
+    """
+
+    def __init__(self, url=None, timeout=60):
+        self.url = url or os.environ.get("WORKIQ_URL")
+        if not self.url:
+            raise WorkIQError("No WorkIQ service configured (set WORKIQ_URL)")
+        self.timeout = timeout
+
+    def __call__(self, customer, meeting_date, text):
+        body = json.dumps({"customer": customer, "date": meeting_date, "query": text}).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.read().decode("utf-8")
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                raise MeetingNotFound(f"No {customer} meeting on {meeting_date}") from e
+            raise WorkIQError(f"WorkIQ service returned {e.code}") from e
+        except (urllib.error.URLError, OSError) as e:
+            raise WorkIQError(f"WorkIQ service unreachable: {e}") from e
+
+
+def default_backend():
+    """HttpBackend if WORKIQ_URL is set, else CommandBackend from WORKIQ_COMMAND."""
+    if os.environ.get("WORKIQ_URL"):
+        return HttpBackend()
+    return CommandBackend()
+
+
+def serve(backend, host="127.0.0.1", port=8765):
+    """Serve a backend over HTTP in HttpBackend's protocol (blocks; one thread per request)."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            try:
+                status, text = 200, backend(request["customer"], request["date"], request["query"])
+            except MeetingNotFound as e:
+                status, text = 404, str(e)
+            except WorkIQError as e:
+                status, text = 502, str(e)
+            payload = text.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 128  # Fan-out clients connect all at once
+
+    return Server((host, port), Handler)
+
+
+class WorkIQClient:
+    """WorkIQ queries through the shared cache."""
+
+    def __init__(self, backend=None, cache=None):
+        """
+        Args:
+            backend: fetch(customer, meeting_date, query_text) callable
+                     (default: default_backend(), created on first fetch)
+            cache: WorkIQCache (default: the shared on-disk cache)
+        """
+        self._backend = backend
+        self.cache = cache or WorkIQCache()
+        self.fetches = 0
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = default_backend()
+        return self._backend
+
+    def query(self, customer, meeting_date, query="transcript", ttl=None, refresh=False):
+        """
+        Answer a query about one meeting, from cache when possible.
+
+        Args:
+            customer: Customer name (case and spacing do not matter)
+            meeting_date: Meeting date, YYYY-MM-DD
+            query: Named query from QUERIES or free text
+            ttl: Maximum age in seconds of a cached answer (default: cache TTL)
+            refresh: Skip the cache and fetch again
+
+        Raises:
+            MeetingNotFound, WorkIQError: From the backend; failures are not cached
+        """
+        if not refresh:
+            cached = self.cache.get(customer, meeting_date, query, ttl)
+            if cached is not None:
+                return cached
+        key = cache_key(customer, meeting_date, query)
+        with self._inflight_lock:
+            lock = self._inflight.setdefault(key, threading.Lock())
+        try:
+            with lock:
+                # Another thread may have fetched it while this one waited
+                if not refresh:
+                    cached = self.cache.get(customer, meeting_date, query, ttl)
+                    if cached is not None:
+                        return cached
+                text = self.backend(customer, meeting_date, query_text(customer, meeting_date, query))
+                self.fetches += 1
+                self.cache.put(customer, meeting_date, query, text)
+        finally:
+            # Also after a cache hit or a failed fetch, so failing keys leave no lock behind
+            with self._inflight_lock:
+                if self._inflight.get(key) is lock:
+                    del self._inflight[key]
+        return text
+
+    def transcript(self, customer, meeting_date, **options):
+        return self.query(customer, meeting_date, "transcript", **options)
+
+    def chat(self, customer, meeting_date, **options):
+        return self.query(customer, meeting_date, "chat", **options)
+
+    def summary(self, customer, meeting_date, **options):
+        return self.query(customer, meeting_date, "summary", **options)
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="WorkIQ response cache")
+    parser.add_argument("--cache", help=f"Cache database (default: {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--ttl", type=float, help="Maximum age in hours (default: 168)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("get", "Print a cached answer (exit 1 on miss)"),
+                            ("put", "Store an answer read from stdin"),
+                            ("fetch", "Answer from cache, else from the backend")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--customer", required=True)
+        p.add_argument("--date", required=True, help="Meeting date, YYYY-MM-DD")
+        p.add_argument("--query", default="transcript",
+                       help=f"Named query ({', '.join(QUERIES)}) or free text")
+        if name == "fetch":
+            p.add_argument("--stub", help="Answer from this fixture folder instead of WORKIQ_URL / WORKIQ_COMMAND")
+            p.add_argument("--refresh", action="store_true")
+    p = sub.add_parser("invalidate", help="Drop cached answers")
+    p.add_argument("--customer")
+    p.add_argument("--date")
+    sub.add_parser("stats", help="Cache size and counters")
+    sub.add_parser("purge", help="Delete expired entries")
+    p = sub.add_parser("serve", help="Run a stub fixture folder as a local WorkIQ stand-in service")
+    p.add_argument("--stub", required=True, help="Fixture folder")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--latency", type=float, default=0.0, help="Seconds per answer")
+
+    args = parser.parse_args()
+    ttl = args.ttl * 3600 if args.ttl is not None else DEFAULT_TTL
+    cache = WorkIQCache(args.cache, ttl=ttl)
+
+    if args.command == "get":
+        text = cache.get(args.customer, args.date, args.query)
+        if text is None:
+            sys.exit(1)
+        sys.stdout.write(text)
+    elif args.command == "put":
+        cache.put(args.customer, args.date, args.query, sys.stdin.read())
+        print("✅ Cached", file=sys.stderr)
+    elif args.command == "fetch":
+        client = WorkIQClient(StubBackend(args.stub) if args.stub else None, cache)
+        try:
+            sys.stdout.write(client.query(args.customer, args.date, args.query, refresh=args.refresh))
+        except WorkIQError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            sys.exit(2)
+        print(f"\n({'fetched' if client.fetches else 'from cache'})", file=sys.stderr)
+    elif args.command == "invalidate":
+        print(f"Removed {cache.invalidate(args.customer, args.date)} entries")
+    elif args.command == "serve":
+        server = serve(StubBackend(args.stub, latency=args.latency), port=args.port)
+        print(f"✅ Serving {args.stub} at http://127.0.0.1:{args.port}/ (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.server_close()
+    elif args.command == "purge":
+        print(f"Removed {cache.purge_expired()} expired entries")
+    else:
+        for key, value in cache.stats().items():
+            print(f"{key}: {value}")
@@ -0,0 +1,167 @@
+"""
+Agenda rendering benchmarks.
+
+Usage (from the agenda-builder folder):
+    python -m scripts.benchmark postprocess [--rows 100 1000 5000 20000] [--tables 4] [--legacy]
+    python -m scripts.benchmark load [--docs 32] [--concurrency 1 2 4 8] [--kind process]
+
+postprocess: times post_process_tables() on synthetic multi-table agendas
+(several tables sharing the row count, 5 grid columns each, so the
+first-column removal path runs). Per-row cost should stay flat as rows
+grow. --legacy also times the previous python-docx proxy implementation on
+the first table for comparison.
+
+load: renders --docs agendas through the async API (agenda_async) at each
+concurrency level and reports documents per second. With the process
+executor, throughput should rise with concurrency up to the CPU count.
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+
+from lxml import etree
+
+from . import agenda_async
+from .core import post_process_tables
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _synthetic_document(total_rows, tables, columns=5):
+    """Build a document element with `tables` agenda tables sharing total_rows rows."""
+    w = "{%s}" % _W_NS
+    document = etree.Element(w + "document", nsmap={"w": _W_NS})
+    body = etree.SubElement(document, w + "body")
+    per_table = max(2, total_rows // tables)
+    for t in range(tables):
+        tbl = etree.SubElement(body, w + "tbl")
+        grid = etree.SubElement(tbl, w + "tblGrid")
+        for _ in range(columns):
+            etree.SubElement(grid, w + "gridCol").set(w + "w", "1440")
+        for r in range(per_table):
+            tr = etree.SubElement(tbl, w + "tr")
+            for c in range(columns):
+                tc = etree.SubElement(tr, w + "tc")
+                run = etree.SubElement(etree.SubElement(tc, w + "p"), w + "r")
+                etree.SubElement(run, w + "t").text = f"Day {t + 1} row {r} col {c}"
+    return document
+
+
+def _legacy_post_process(document):
+    """The previous python-docx implementation, first table only."""
+    from docx import Document
+    from docx.shared import Inches
+
+    doc = Document()
+    body = doc.element.body
+    for tbl in document.find("{%s}body" % _W_NS):
+        body.append(tbl)
+    for table in doc.tables:
+        if len(table.rows) > 1:
+            if len(table.columns) > 3:
+                for row in table.rows:
+                    if row._tr.tc_lst:
+                        row._tr.remove(row._tr.tc_lst[0])
+            if len(table.columns) >= 3:
+                table.columns[0].width = Inches(0.8)
+                table.columns[1].width = Inches(1.2)
+                table.columns[2].width = Inches(4.0)
+            break
+
+
+def bench_postprocess(row_counts, tables, legacy):
+    print(f"{'rows':>8} {'tables':>6} {'xpath ms':>10} {'us/row':>8}" + (f" {'legacy ms':>10}" if legacy else ""))
+    for rows in row_counts:
+        document = _synthetic_document(rows, tables)
+        start = time.perf_counter()
+        post_process_tables(document)
+        elapsed = time.perf_counter() - start
+        line = f"{rows:>8} {tables:>6} {elapsed * 1000:>10.2f} {elapsed * 1e6 / rows:>8.2f}"
+        if legacy:
+            document = _synthetic_document(rows, tables)
+            start = time.perf_counter()
+            _legacy_post_process(document)
+            line += f" {(time.perf_counter() - start) * 1000:>10.2f}"
+        print(line)
+
+
+def _sample_agenda(index):
+    return {
+        "customer": f"Customer {index}",
+        "date": "March 3, 2026",
+        "title": "Architecture Design Session",
+        "summary": "Load test agenda",
+        "primaries": [{"name": "Avery Lee", "role": "CTO"}],
+        "supporting": [{"name": "Sam Ortiz", "role": "Architect"}],
+        "agenda_items": [
+            {"time": f"{9 + i}:00", "owner": "Avery Lee", "topic": f"Session {i}",
+             "description": "Discussion and next steps"}
+            for i in range(8)
+        ],
+    }
+
+
+async def _render_batch(template_path, output_dir, docs, concurrency, kind):
+    agenda_async.configure(max_concurrency=concurrency, kind=kind)
+    try:
+        # Warm the workers (imports, template cache) so only rendering is timed
+        await asyncio.gather(*(
+            agenda_async.create_agenda_doc(_sample_agenda(-1), template_path,
+                                           os.path.join(output_dir, f"warm-{i}.docx"))
+            for i in range(concurrency)
+        ))
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            agenda_async.create_agenda_doc(_sample_agenda(i), template_path,
+                                           os.path.join(output_dir, f"agenda-{i}.docx"))
+            for i in range(docs)
+        ))
+        return time.perf_counter() - start
+    finally:
+        agenda_async.shutdown()
+
+
+def bench_load(docs, levels, kind, template_path):
+    print(f"{os.cpu_count()} CPUs, {kind} executor, {docs} documents per level")
+    print(f"{'concurrency':>11} {'seconds':>8} {'docs/s':>8} {'speedup':>8}")
+    output_dir = tempfile.mkdtemp(prefix="agenda-load-")
+    baseline = None
+    try:
+        for concurrency in levels:
+            elapsed = asyncio.run(_render_batch(template_path, output_dir, docs, concurrency, kind))
+            rate = docs / elapsed
+            baseline = baseline or rate
+            print(f"{concurrency:>11} {elapsed:>8.2f} {rate:>8.1f} {rate / baseline:>7.2f}x")
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    import logging
+
+    logging.getLogger("scripts.core").setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description="Agenda rendering benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    post = sub.add_parser("postprocess", help="Table post-processing scaling")
+    post.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    post.add_argument("--tables", type=int, default=4, help="Agenda tables (e.g. days/tracks)")
+    post.add_argument("--legacy", action="store_true", help="Also time the python-docx implementation")
+
+    load = sub.add_parser("load", help="Async rendering throughput by concurrency")
+    load.add_argument("--docs", type=int, default=32)
+    load.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8])
+    load.add_argument("--kind", choices=["process", "thread"], default="process")
+    load.add_argument("--template", default=os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "assets", "agenda_template.docx"))
+
+    args = parser.parse_args()
+    if args.command == "postprocess":
+        bench_postprocess(args.rows, args.tables, args.legacy)
+    elif args.command == "load":
+        bench_load(args.docs, args.concurrency, args.kind, args.template)
@@ -1,30 +1,32 @@
-import importlib
+import importlib.util
+import os
 import subprocess
 import sys
 
 def _ensure_dependencies():
-    """Auto-install required packages if missing. Eliminates the need for separate pip install steps."""
+    """Auto-install required packages if missing. Eliminates the need for separate pip install steps.
+
+    Only checks that the modules can be found (nothing is imported). Installs
+    use the repo wheelhouse (see setup.py --build-wheelhouse) when present.
+    """
     deps = [
         ("docxtpl", "docxtpl", "docxtpl>=0.16.0"),
         ("docx", "python-docx", "python-docx>=1.1.0"),
         ("PIL", "Pillow", "Pillow>=10.0.0"),
     ]
-    missing = []
-    for import_name, pkg_name, pip_spec in deps:
-        try:
-            importlib.import_module(import_name)
-        except ImportError:
-            missing.append(pip_spec)
+    missing = [pip_spec for import_name, pkg_name, pip_spec in deps
+               if importlib.util.find_spec(import_name) is None]
     if missing:
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "--quiet"] + missing
-        )
+        command = [sys.executable, "-m", "pip", "install", "--quiet"]
+        wheelhouse = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", ".wheelhouse")
+        if os.path.isdir(wheelhouse):
+            command += ["--find-links", os.path.abspath(wheelhouse)]
+        subprocess.check_call(command + missing)
 
 _ensure_dependencies()
 
 from docxtpl import DocxTemplate, InlineImage
 import json
-import os
 import base64
 import uuid
 import glob
@@ -32,8 +34,12 @@ import logging
 from difflib import get_close_matches
 from datetime import datetime
 from docx.shared import Mm, Inches
-from docx import Document
 from io import BytesIO
+from lxml import etree
+
+from .docx_package import DEFAULT_COMPRESSION, read_member, rewrite_members, write_docx
+from .schema import build_context, template_variables, validate_agenda
+from .tracing import span
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -85,7 +91,20 @@ def find_best_matching_logo(logo_path):
     match_idx = logo_basenames.index(matches[0])
     return all_logo_files[match_idx]
 
-def create_agenda_doc(data, template_path, output_path=None, logo_path=None):
+DOCUMENT_PART = "word/document.xml"
+_NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+_W_WIDTH = "{%s}w" % _NS["w"]
+# Compiled once; top-level tables only, nested layout tables are left alone
+_AGENDA_TABLES = etree.XPath(".//w:tbl[not(ancestor::w:tbl)][count(w:tr) > 1]", namespaces=_NS)
+_GRID_COLS = etree.XPath("w:tblGrid/w:gridCol", namespaces=_NS)
+_FIRST_CELLS = etree.XPath("w:tr/w:tc[1]", namespaces=_NS)
+_ROW_COUNT = etree.XPath("count(w:tr)", namespaces=_NS)
+
+# Template file bytes keyed by absolute path -> (mtime, bytes); DocxTemplate
+# instances are single-use, so renders start from these instead of re-reading disk
+_template_cache = {}
+
+def create_agenda_doc(data, template_path, output_path=None, logo_path=None, validate=True, compression=None):
     """
     Core function to create an agenda document from JSON data
     
@@ -94,234 +113,338 @@ def create_agenda_doc(data, template_path, output_path=None, logo_path=None):
         template_path: Path to the template DOCX file
         output_path: Path to save the output (generated if None)
         logo_path: Path to logo file, URL, or base64 encoded image from frontend
+        validate: Check data against the agenda schema and the template's
+                  variables before rendering (raises AgendaValidationError)
+        compression: DOCX compression - "store", "fast", "deflate" or "max"
+                     (default: AGENDA_DOCX_COMPRESSION env var or "deflate").
+                     Output is deterministic: identical inputs give identical bytes.
     
     Returns:
         Path to the generated document
     """
-    # Parse JSON if string was provided
-    if isinstance(data, str):
-        data = json.loads(data)
-    
-    logger.info(f"Creating document from template: {template_path}")
-    logger.info(f"Output will be saved to: {output_path}")
+    with span("create_agenda_doc", template=str(template_path)):
+        data = _parse_agenda_data(data)
+        
+        # Reject malformed input before any template work starts
+        if validate:
+            with span("validate"):
+                validate_agenda(data, template_path)
+        
+        logger.info("Creating document from template: %s", template_path)
+        logger.info("Output will be saved to: %s", output_path)
+        
+        logo_bytes = None
+        if logo_path:
+            with span("logo"):
+                logo_bytes = _load_logo(logo_path)
+        
+        if not output_path:
+            output_path = _default_output_path(data)
+        
+        return _render_variant(build_context(data), template_path, output_path, logo_bytes,
+                               compression=compression)
+
+def create_agenda_variants(data, variants, logo_path=None, parallel=False, max_workers=None, validate=True,
+                           compression=None):
+    """
+    Render several documents (e.g. customer-facing agenda and internal run-of-show)
+    from one agenda payload in a single call.
     
-    # Make sure output directory exists
-    if output_path:
-        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    The payload is parsed, validated and mapped to a context once, the logo is
+    decoded once, and each distinct template file is read from disk once.
     
-    # Load the template
-    doc = DocxTemplate(template_path)
+    Args:
+        data: Dictionary or JSON string of agenda data
+        variants: List of variant specs, each either a (template_path, output_path)
+                  tuple or a dict with keys:
+                    template (required), output (optional, generated if missing),
+                    name (optional label), context (optional dict merged over
+                    the shared context, e.g. {"internal_notes": [...]})
+        logo_path: Path to logo file or base64 encoded image, shared by all variants
+        parallel: Render variants concurrently on a thread pool
+        max_workers: Thread pool size when parallel (default: one per variant)
+        validate: Check data against the schema and every variant's template first
+        compression: DOCX compression, as for create_agenda_doc
     
-    # Prepare context with more detailed structure
-    context = {
-        "customer": data.get("customer", ""),
-        "date": data.get("date", ""),
-        "title": data.get("title", ""),
-        "summary": data.get("summary", ""),
-        "primaries": data.get("primaries", []),
-        "supporting": data.get("supporting", []),
-        "agenda_items": data.get("agenda_items", []),
-        "attendees": data.get("attendees", []),
-        "has_logo": False  # Default to no logo
+    Returns:
+        List of generated document paths, in the same order as variants
+    """
+    with span("create_agenda_variants", variants=len(variants), parallel=bool(parallel)):
+        data = _parse_agenda_data(data)
+        specs = [_normalize_variant(v, i) for i, v in enumerate(variants)]
+        
+        if validate:
+            with span("validate"):
+                for template_path in dict.fromkeys(spec["template"] for spec in specs):
+                    validate_agenda(data, template_path)
+        
+        logo_bytes = None
+        if logo_path:
+            with span("logo"):
+                logo_bytes = _load_logo(logo_path)
+        
+        base_context = build_context(data)
+        jobs = []
+        for spec in specs:
+            context = dict(base_context)
+            context.update(spec["context"])
+            output_path = spec["output"] or _default_output_path(data, spec["name"])
+            jobs.append((context, spec["template"], output_path, logo_bytes, spec["name"], compression))
+        
+        if parallel and len(jobs) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=max_workers or len(jobs)) as pool:
+                return list(pool.map(lambda job: _render_variant(*job), jobs))
+        return [_render_variant(*job) for job in jobs]
+
+def _normalize_variant(variant, index):
+    if isinstance(variant, (tuple, list)):
+        template_path, output_path = variant
+        variant = {"template": template_path, "output": output_path}
+    return {
+        "template": variant["template"],
+        "output": variant.get("output"),
+        "name": variant.get("name") or f"variant{index + 1}",
+        "context": variant.get("context") or {},
     }
-    
-    # Handle logo
-    temp_logo_path = None
-    if logo_path:
-        logger.info(f"Processing logo: {logo_path[:30]}{'...' if len(logo_path) > 30 else ''}")
+
+def _parse_agenda_data(data):
+    # Parse JSON if string was provided
+    if isinstance(data, str):
+        with span("parse_json"):
+            data = json.loads(data)
+    return data
+
+def _default_output_path(data, suffix=None):
+    os.makedirs('output', exist_ok=True)
+    current_date = datetime.now().strftime("%Y%m%d")
+    customer = data.get('customer', 'Customer').replace(' ', '_')
+    topic = data.get('topic', data.get('title', 'Meeting')).replace(' ', '_')
+    variant = f"-{suffix}" if suffix else ""
+    filename = f"{current_date}-{customer}-{topic}Agenda{variant}-{uuid.uuid4()}.docx"
+    return os.path.join('output', filename)
+
+def _template_bytes(template_path):
+    key = os.path.abspath(template_path)
+    mtime = os.path.getmtime(key)
+    cached = _template_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        with open(key, 'rb') as f:
+            cached = (mtime, f.read())
+        _template_cache[key] = cached
+    return cached[1]
+
+def _render_variant(context, template_path, output_path, logo_bytes=None, name=None, compression=None):
+    """Render, save and post-process one document from a prepared context."""
+    with span("render_variant", variant=name, output=str(output_path)):
+        # Make sure output directory exists
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        
+        # Load the template
+        with span("load_template"):
+            template_data = _template_bytes(template_path)
+            doc = DocxTemplate(BytesIO(template_data))
         
-        # Create logos directory if it doesn't exist
-        temp_dir = os.path.abspath(os.path.dirname(output_path) if output_path else os.path.join(os.getcwd(), 'temp'))
-        os.makedirs(temp_dir, exist_ok=True)
+        if logo_bytes:
+            _attach_logo(doc, context, logo_bytes)
         
+        # Inspect the template variables to better understand what's expected
+        with span("inspect_variables"):
+            try:
+                # Extract template variables to see what it expects (cached per template)
+                template_vars = template_variables(template_path)
+                logger.info("Template variables: %s", template_vars)
+                
+                # Check if template expects specific logo-related variables
+                logo_related_vars = [var for var in template_vars if 'logo' in var.lower()]
+                if logo_related_vars and context.get("has_logo"):
+                    logger.info("Logo-related variables in template: %s", logo_related_vars)
+                    # Ensure all logo-related variables are set
+                    for var in logo_related_vars:
+                        if var not in context:
+                            context[var] = context.get("logo")
+            except Exception as e:
+                logger.warning("Could not inspect template variables: %s", e)
+        
+        # Render the template with the context
         try:
-            # Check if it's a base64 encoded image
-            if isinstance(logo_path, str) and logo_path.startswith('data:image'):
-                try:
-                    # Extract the actual base64 data after the comma
-                    base64_data = logo_path.split(',')[1]
-                    image_data = base64.b64decode(base64_data)
-                    
-                    # Save the temporary logo file
-                    temp_logo_path = os.path.join(temp_dir, f'temp_logo_{uuid.uuid4()}.png')
-                    with open(temp_logo_path, 'wb') as f:
-                        f.write(image_data)
-                    
-                    logo_path = temp_logo_path
-                    logger.info(f"Converted base64 logo to file: {logo_path}")
-                except Exception as e:
-                    logger.error(f"Error processing base64 logo: {str(e)}")
-                    context["has_logo"] = False
-            
-            # At this point, logo_path should be a file path
-            if os.path.exists(logo_path):
-                try:
-                    # Check if file is readable
-                    with open(logo_path, 'rb') as test_read:
-                        _ = test_read.read(1)
-                    
-                    # Add multiple logo format options to increase template compatibility
-                    # The template might be expecting any of these formats
-                    context["logo"] = InlineImage(doc, logo_path, width=Mm(50))
-                    context["company_logo"] = context["logo"]  # Alternative name
-                    context["logo_image"] = context["logo"]    # Another alternative
-                    context["has_logo"] = True
-                    logger.info(f"Using file path logo: {logo_path}")
-                except Exception as e:
-                    logger.error(f"Error creating InlineImage from file: {str(e)}")
-                    context["has_logo"] = False
-            else:
-                logger.warning(f"Logo path not valid or file not found: {logo_path}")
+            with span("render", agenda_items=len(context["agenda_items"])):
+                doc.render(context)
+            logger.info("Template rendered successfully")
         except Exception as e:
-            logger.error(f"Unexpected error in logo processing: {str(e)}")
-            context["has_logo"] = False
-    
-    # Inspect the template variables to better understand what's expected
-    try:
-        # Extract template variables to see what it expects
-        template_vars = doc.get_undeclared_template_variables()
-        logger.info(f"Template variables: {template_vars}")
+            logger.error("Error rendering template:")
+            logger.exception(e)  # <-- log the full traceback
+            logger.error("Context keys: %s", list(context.keys()))
+            logger.error("has_logo value: %s", context.get('has_logo'))
+            logger.info("Check if your DOCX template has a placeholder like {{ logo }} or {{ company_logo }}")
+            
+            # Without a logo the fallback would repeat the same render, so fail fast
+            if not context.get("has_logo"):
+                raise
+            
+            # Try rendering without the logo as a fallback
+            try:
+                logger.info("Attempting to render template without logo as fallback")
+                fallback_context = context.copy()
+                # Remove logo-related keys
+                for key in list(fallback_context.keys()):
+                    if 'logo' in key.lower():
+                        del fallback_context[key]
+                fallback_context["has_logo"] = False
+                
+                with span("render_fallback"):
+                    doc = DocxTemplate(BytesIO(template_data))  # Create fresh template
+                    doc.render(fallback_context)
+                logger.info("Template rendered successfully without logo")
+            except Exception as fallback_error:
+                logger.error("Fallback rendering also failed:")
+                logger.exception(fallback_error)
+                raise e  # Raise the original error
         
-        # Check if template expects specific logo-related variables
-        logo_related_vars = [var for var in template_vars if 'logo' in var.lower()]
-        if logo_related_vars and context.get("has_logo"):
-            logger.info(f"Logo-related variables in template: {logo_related_vars}")
-            # Ensure all logo-related variables are set
-            for var in logo_related_vars:
-                if var not in context:
-                    context[var] = context.get("logo")
-    except Exception as e:
-        logger.warning(f"Could not inspect template variables: {str(e)}")
-    
-    # Render the template with the context
-    try:
-        doc.render(context)
-        logger.info("Template rendered successfully")
-    except Exception as e:
-        logger.error("Error rendering template:")
-        logger.exception(e)  # <-- log the full traceback
-        logger.error(f"Context keys: {list(context.keys())}")
-        logger.error(f"has_logo value: {context.get('has_logo')}")
-        logger.info("Check if your DOCX template has a placeholder like {{ logo }} or {{ company_logo }}")
+        # Post-process tables in memory so the document is written once
+        with span("post_process"):
+            try:
+                tables_processed = post_process_tables(doc.docx.element)
+                logger.info("Post-processing completed: %s tables", tables_processed)
+            except Exception as e:
+                # Don't fail if post-processing has issues
+                logger.error("Error during post-processing: %s", e)
         
-        # Try rendering without the logo as a fallback
+        # Save the document
         try:
-            logger.info("Attempting to render template without logo as fallback")
-            fallback_context = context.copy()
-            # Remove logo-related keys
-            for key in list(fallback_context.keys()):
-                if 'logo' in key.lower():
-                    del fallback_context[key]
-            fallback_context["has_logo"] = False
-            
-            doc = DocxTemplate(template_path)  # Create fresh template
-            doc.render(fallback_context)
-            logger.info("Template rendered successfully without logo")
-        except Exception as fallback_error:
-            logger.error("Fallback rendering also failed:")
-            logger.exception(fallback_error)
-            raise e  # Raise the original error
-    
-    # Make sure we have an output path
-    if not output_path:
-        os.makedirs('output', exist_ok=True)
-        current_date = datetime.now().strftime("%Y%m%d")
-        customer = data.get('customer', 'Customer').replace(' ', '_')
-        topic = data.get('topic', data.get('title', 'Meeting')).replace(' ', '_')
-        filename = f"{current_date}-{customer}-{topic}Agenda-{uuid.uuid4()}.docx"
-        output_path = os.path.join('output', filename)
-    
-    # Save the document
-    try:
-        doc.save(output_path)
-        logger.info(f"Document saved to: {output_path}")
+            with span("save", compression=compression or DEFAULT_COMPRESSION):
+                write_docx(doc, output_path, compression)
+            logger.info("Document saved to: %s", output_path)
+        except Exception as e:
+            logger.error("Error saving document: %s", e)
+            raise
         
-        # Explicitly call post-processing with additional logging
-        logger.info("Calling post-processing function...")
-        post_process_result = post_process_document(output_path)
-        logger.info(f"Post-processing completed: {post_process_result}")
-    except Exception as e:
-        logger.error(f"Error saving document: {str(e)}")
-        raise
+        return output_path
+
+def _load_logo(logo_path):
+    """
+    Resolves logo_path (file path or base64 data URI) to image bytes.
     
-    # Clean up temporary logo file if it exists
-    if temp_logo_path and os.path.exists(temp_logo_path):
+    Returns:
+        Image bytes, or None when the logo could not be read
+    """
+    logger.info("Processing logo: %s%s", logo_path[:30], '...' if len(logo_path) > 30 else '')
+    
+    # Check if it's a base64 encoded image
+    if isinstance(logo_path, str) and logo_path.startswith('data:image'):
         try:
-            os.remove(temp_logo_path)
+            # Extract the actual base64 data after the comma
+            base64_data = logo_path.split(',')[1]
+            image_data = base64.b64decode(base64_data)
+            logger.info("Decoded base64 logo (%d bytes)", len(image_data))
+            return image_data
         except Exception as e:
-            logger.warning(f"Could not remove temporary logo file: {str(e)}")
+            logger.error("Error processing base64 logo: %s", e)
+            return None
     
-    return output_path
+    # Otherwise logo_path should be a file path
+    if not os.path.exists(logo_path):
+        logger.warning("Logo path not valid or file not found: %s", logo_path)
+        return None
+    try:
+        with open(logo_path, 'rb') as f:
+            image_data = f.read()
+        logger.info("Using file path logo: %s", logo_path)
+        return image_data
+    except Exception as e:
+        logger.error("Error reading logo file: %s", e)
+        return None
 
-def post_process_document(docx_path):
+def _attach_logo(doc, context, logo_bytes):
+    """Adds InlineImage entries for the logo to context, bound to this template instance."""
+    try:
+        # Add multiple logo format options to increase template compatibility
+        # The template might be expecting any of these formats
+        context["logo"] = InlineImage(doc, BytesIO(logo_bytes), width=Mm(50))
+        context["company_logo"] = context["logo"]  # Alternative name
+        context["logo_image"] = context["logo"]    # Another alternative
+        context["has_logo"] = True
+    except Exception as e:
+        logger.error("Error creating InlineImage from logo: %s", e)
+        context["has_logo"] = False
+
+# Column widths in twentieths of a point (the unit of w:gridCol/@w:w)
+_THREE_COLUMN_WIDTHS = (Inches(0.8).twips,   # Time column
+                        Inches(1.2).twips,   # Owner column
+                        Inches(4.0).twips)   # Topic/Description column
+_TWO_COLUMN_WIDTHS = (Inches(1.5).twips,     # Time/Owner column
+                      Inches(4.5).twips)     # Topic/Description column
+
+def post_process_document(docx_path, compression=None):
     """
     Post-processes the generated DOCX file to:
-    1. Remove the first column from agenda items table (if needed)
+    1. Remove the first column from agenda items tables (if needed)
     2. Adjust column widths for better appearance
+    
+    Only word/document.xml is parsed and rewritten; other package members
+    are copied as-is. create_agenda_doc applies the same table pass in memory
+    before its single save, so this is for documents rendered elsewhere.
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.info(f"Post-processing document: {docx_path}")
+    with span("post_process"):
+        logger.info("Post-processing document: %s", docx_path)
+        try:
+            with span("post_process.open"):
+                root = etree.fromstring(read_member(docx_path, DOCUMENT_PART))
+            
+            if not post_process_tables(root):
+                return False
+            
+            with span("post_process.save"):
+                document_xml = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+                rewrite_members(docx_path, {DOCUMENT_PART: document_xml}, compression=compression)
+            logger.info("Document post-processed successfully: %s", docx_path)
+            return True
+        except Exception as e:
+            logger.error("Error during post-processing: %s", e)
+            # Don't fail if post-processing has issues
+            return False
+
+def post_process_tables(root):
+    """
+    Fixes up every agenda table (any top-level table with more than one row)
+    under root, using XPath on the table XML rather than python-docx proxies,
+    so the cost is linear in the number of rows.
     
-    try:
-        # Open the document
-        doc = Document(docx_path)
-        
-        # Log how many tables exist
-        logger.info(f"Document has {len(doc.tables)} tables")
-        
-        # Find the first table with more than one row (header + content)
-        agenda_table = None
-        for i, table in enumerate(doc.tables):
-            if len(table.rows) > 1:  # More than just header row
-                agenda_table = table
-                logger.info(f"Using table #{i+1} with {len(table.rows)} rows and {len(table.columns)} columns")
-                break
-        
-        if agenda_table:
-            # Count columns before modification
-            original_column_count = len(agenda_table.columns)
-            logger.info(f"Table originally has {original_column_count} columns")
+    Args:
+        root: lxml element of the document (or its body)
+    
+    Returns:
+        Number of tables processed
+    """
+    with span("post_process.find_tables"):
+        tables = _AGENDA_TABLES(root)
+    logger.info("Found %d agenda table(s)", len(tables))
+    if not tables:
+        logger.warning("No suitable table found with more than one row")
+        return 0
+    
+    with span("post_process.tables", tables=len(tables)) as current:
+        rows = 0
+        for table in tables:
+            grid_cols = _GRID_COLS(table)
             
             # Optional: Remove the first column if there are more than 3 columns
             # This is only needed if your template generates an extra column
-            if original_column_count > 3:
-                logger.info("Removing first column from table")
-                try:
-                    for row in agenda_table.rows:
-                        # Get the XML element for the row
-                        xml_row = row._tr
-                        # Remove the first cell if it exists
-                        if xml_row.tc_lst:
-                            xml_row.remove(xml_row.tc_lst[0])
-                    logger.info("First column removed successfully")
-                except Exception as e:
-                    logger.error(f"Error removing first column: {str(e)}")
+            if len(grid_cols) > 3:
+                for first_cell in _FIRST_CELLS(table):
+                    first_cell.getparent().remove(first_cell)
             
             # Adjust the remaining columns to appropriate widths
-            # The number of columns might have changed if we removed the first one
-            current_columns = len(agenda_table.columns)
-            logger.info(f"Adjusting widths for {current_columns} columns")
-            
-            if current_columns >= 3:
-                agenda_table.columns[0].width = Inches(0.8)   # Time column
-                agenda_table.columns[1].width = Inches(1.2)   # Owner column
-                agenda_table.columns[2].width = Inches(4.0)   # Topic/Description column
-                logger.info("Column widths adjusted successfully")
-            elif current_columns == 2:
-                agenda_table.columns[0].width = Inches(1.5)   # Time/Owner column
-                agenda_table.columns[1].width = Inches(4.5)   # Topic/Description column
-                logger.info("Column widths adjusted for 2-column table")
-            
-            # Save the modified document
-            doc.save(docx_path)
-            logger.info(f"Document post-processed successfully: {docx_path}")
-            return True
-        else:
-            logger.warning("No suitable table found with more than one row")
-            return False
-            
-    except Exception as e:
-        logger.error(f"Error during post-processing: {str(e)}")
-        # Don't fail if post-processing has issues
-        return False
\ No newline at end of file
+            if len(grid_cols) >= 3:
+                widths = _THREE_COLUMN_WIDTHS
+            elif len(grid_cols) == 2:
+                widths = _TWO_COLUMN_WIDTHS
+            else:
+                widths = ()
+            for grid_col, width in zip(grid_cols, widths):
+                grid_col.set(_W_WIDTH, str(width))
+            rows += int(_ROW_COUNT(table))
+        if current is not None:
+            current.set(rows=rows)
+    logger.info("Post-processed %d table(s) with %d rows", len(tables), rows)
+    return len(tables)
@@ -0,0 +1,205 @@
+"""
+Low-level DOCX (zip) package helpers.
+
+A DOCX is a zip of XML parts. write_docx() saves a rendered document with a
+selectable compression level and deterministic packaging: members in a fixed
+order with fixed timestamps and attributes, so identical agendas produce
+byte-identical files that sync clients and caches can skip.
+
+Packages are assembled in memory and handed to skillkit.atomic.write_bytes(),
+which skips the write when the file on disk already has identical bytes and
+otherwise replaces it atomically, so a synced folder never sees a partial
+DOCX and an unchanged re-render causes no upload.
+
+When only one part changes, rewriting the whole package through python-docx
+recompresses every member; rewrite_members() instead copies unchanged
+members' compressed bytes verbatim and only compresses the replaced parts.
+
+Compression is one of:
+    "store"    no compression, fastest to write
+    "fast"     deflate level 1
+    "deflate"  deflate level 6 (zlib default, what Word and python-docx produce)
+    "max"      deflate level 9, smallest files
+The default can be set with the AGENDA_DOCX_COMPRESSION environment variable.
+"""
+
+import copy
+import io
+import os
+import struct
+import sys
+import zipfile
+
+_SHARED = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "_shared"))
+if _SHARED not in sys.path:
+    sys.path.insert(0, _SHARED)
+
+from skillkit.atomic import write_bytes
+
+COMPRESSION_LEVELS = {
+    "store": (zipfile.ZIP_STORED, None),
+    "fast": (zipfile.ZIP_DEFLATED, 1),
+    "deflate": (zipfile.ZIP_DEFLATED, 6),
+    "max": (zipfile.ZIP_DEFLATED, 9),
+}
+DEFAULT_COMPRESSION = os.environ.get("AGENDA_DOCX_COMPRESSION", "deflate")
+
+# Earliest timestamp a zip entry can hold; used for every member
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+CONTENT_TYPES = "[Content_Types].xml"
+# Already-compressed media gains nothing from deflate; always stored
+_STORED_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif")
+
+# Local file header: signature(4) ... filename length at offset 26, extra length at 28
+_LOCAL_HEADER_SIZE = 30
+_DATA_DESCRIPTOR_FLAG = 0x08
+# zipfile has no public raw-copy API; appending compressed bytes relies on
+# ZipFile internals (fp, filelist, NameToInfo, start_dir, _didModify) that are
+# unchanged in the CPython versions below. Elsewhere members are recompressed.
+_RAW_COPY = (3, 8) <= sys.version_info[:2] < (3, 15)
+_RAW_COPY_ATTRIBUTES = ("fp", "filelist", "NameToInfo", "start_dir", "_didModify")
+
+
+def read_member(docx_path, name):
+    """Return the uncompressed bytes of one package member."""
+    with zipfile.ZipFile(docx_path) as package:
+        return package.read(name)
+
+
+def _raw_member_bytes(raw, info):
+    """Read a member's compressed payload straight from the source file."""
+    raw.seek(info.header_offset)
+    header = raw.read(_LOCAL_HEADER_SIZE)
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    raw.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_len + extra_len)
+    return raw.read(info.compress_size)
+
+
+def _can_copy_raw(dest):
+    return _RAW_COPY and all(hasattr(dest, name) for name in _RAW_COPY_ATTRIBUTES)
+
+
+def _write_raw_member(dest, info, payload):
+    """
+    Append an already-compressed member to an open ZipFile.
+
+    Writes the local header and payload itself and registers the entry for
+    the central directory that ZipFile.close() emits; only call it when
+    _can_copy_raw(dest).
+    """
+    entry = copy.copy(info)
+    # Sizes and CRC go in the local header, so no trailing data descriptor
+    entry.flag_bits &= ~_DATA_DESCRIPTOR_FLAG
+    entry.header_offset = dest.fp.tell()
+    dest.fp.write(entry.FileHeader())
+    dest.fp.write(payload)
+    dest.filelist.append(entry)
+    dest.NameToInfo[entry.filename] = entry
+    dest.start_dir = dest.fp.tell()
+    dest._didModify = True
+
+
+def _compression(name):
+    if name is None:
+        name = DEFAULT_COMPRESSION
+    try:
+        return COMPRESSION_LEVELS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown compression {name!r} (expected one of: {', '.join(COMPRESSION_LEVELS)})"
+        ) from None
+
+
+def _member_info(name, compress_type):
+    """ZipInfo with every platform- and time-dependent field pinned."""
+    info = zipfile.ZipInfo(name, date_time=FIXED_DATE_TIME)
+    info.compress_type = compress_type
+    info.create_system = 0
+    info.external_attr = 0
+    return info
+
+
+def _member_order(names):
+    # [Content_Types].xml first (as Word writes it), everything else sorted
+    return sorted(names, key=lambda name: (name != CONTENT_TYPES, name))
+
+
+def write_package(members, dest_path, compression=None):
+    """
+    Write a DOCX from a {member name: bytes} mapping, deterministically.
+
+    The package is built in memory, then written atomically (or not at all if
+    dest_path already holds the same bytes).
+    """
+    compress_type, level = _compression(compression)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as dest:
+        for name in _member_order(members):
+            if name.lower().endswith(_STORED_EXTENSIONS):
+                dest.writestr(_member_info(name, zipfile.ZIP_STORED), members[name])
+            else:
+                dest.writestr(_member_info(name, compress_type), members[name], compresslevel=level)
+    write_bytes(dest_path, buffer.getvalue())
+    return dest_path
+
+
+def write_docx(doc, output_path, compression=None):
+    """
+    Save a DocxTemplate / python-docx Document deterministically.
+
+    The document is serialized to memory once, then repacked with fixed member
+    order and timestamps at the requested compression.
+
+    Args:
+        doc: Object with a save(file) method producing a DOCX
+        output_path: Destination path
+        compression: "store", "fast", "deflate" or "max" (default DEFAULT_COMPRESSION)
+
+    Returns:
+        output_path
+    """
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    with zipfile.ZipFile(buffer) as package:
+        members = {info.filename: package.read(info) for info in package.infolist()}
+    return write_package(members, output_path, compression)
+
+
+def rewrite_members(src_path, replacements, dest_path=None, compression=None):
+    """
+    Rewrite a DOCX replacing only the given members.
+
+    Unchanged members are copied without decompressing or recompressing them
+    (on Python versions whose zipfile internals allow it; elsewhere they are
+    recompressed with their original method). The result is written
+    atomically, so readers never see a half-written package.
+
+    Args:
+        src_path: Existing DOCX
+        replacements: Dict of member name -> new uncompressed bytes
+        dest_path: Output path (defaults to overwriting src_path)
+        compression: Compression for replaced members (see module docstring)
+
+    Returns:
+        Path written
+    """
+    compress_type, level = _compression(compression)
+    dest_path = dest_path or src_path
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(src_path) as src, open(src_path, "rb") as raw, \
+            zipfile.ZipFile(buffer, "w") as dest:
+        copy_raw = _can_copy_raw(dest)
+        for info in src.infolist():
+            if info.filename in replacements:
+                entry = _member_info(info.filename, compress_type)
+                entry.date_time = info.date_time
+                dest.writestr(entry, replacements[info.filename], compresslevel=level)
+            elif copy_raw:
+                _write_raw_member(dest, info, _raw_member_bytes(raw, info))
+            else:
+                entry = _member_info(info.filename, info.compress_type)
+                entry.date_time = info.date_time
+                dest.writestr(entry, src.read(info), compresslevel=level)
+    write_bytes(dest_path, buffer.getvalue())
+    return dest_path
@@ -0,0 +1,319 @@
+"""
+Incremental agenda updates.
+
+update_agenda_doc() keeps a small render record next to the output
+(<output stem>.render.json holding the agenda JSON, template and logo used).
+On the next call it diffs the new agenda against that record and, when the
+change is a text edit (a moved time slot, a reworded description, a renamed
+attendee, a title or date paragraph), patches just those runs in word/document.xml and rewrites only
+that zip member; every other member is copied without recompression.
+
+Anything the patcher cannot map safely (items added or removed, a different
+template or logo file content, a value it cannot locate in the document or
+that shares its paragraph with other text) falls back to a full
+create_agenda_doc render.
+
+Usage:
+    from scripts.incremental import update_agenda_doc
+    update_agenda_doc(agenda_data, template_path, output_docx)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+
+from lxml import etree
+
+_SHARED = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "_shared"))
+if _SHARED not in sys.path:
+    sys.path.insert(0, _SHARED)
+
+from skillkit.atomic import write_json
+
+from .core import create_agenda_doc
+from .docx_package import read_member, rewrite_members
+from .schema import template_variables, validate_agenda
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_PART = "word/document.xml"
+RENDER_RECORD_SUFFIX = ".render.json"
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# Scalar fields rendered as their own paragraph text; patched only where a paragraph is exactly the value
+SCALAR_FIELDS = ("title", "customer", "date", "summary")
+PEOPLE_FIELDS = ("primaries", "supporting")
+ITEM_FIELDS = ("time", "owner", "topic", "description")
+# Context keys whose changes never need a document patch
+_COMPUTED = {"logo", "company_logo", "logo_image", "has_logo"}
+
+
+class PatchNotPossible(Exception):
+    """The change cannot be applied in place; a full render is required."""
+
+
+def render_record_path(output_path):
+    return os.path.splitext(output_path)[0] + RENDER_RECORD_SUFFIX
+
+
+def _fingerprint(logo_path):
+    """Hash of the logo: the file's bytes when logo_path is a file, else the string (a base64 data URI)."""
+    if not logo_path:
+        return None
+    if not os.path.isfile(logo_path):
+        return hashlib.sha256(logo_path.encode("utf-8")).hexdigest()
+    digest = hashlib.sha256()
+    with open(logo_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_record(output_path):
+    path = render_record_path(output_path)
+    if not os.path.exists(path) or not os.path.exists(output_path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable render record %s: %s", path, e)
+        return None
+
+
+def _save_record(output_path, data, template_path, logo_path):
+    record = {
+        "template": os.path.abspath(template_path),
+        "template_mtime": os.path.getmtime(template_path),
+        "logo": _fingerprint(logo_path),
+        "data": data,
+    }
+    write_json(render_record_path(output_path), record)
+
+
+def update_agenda_doc(data, template_path, output_path, logo_path=None, validate=True, compression=None):
+    """
+    Bring output_path up to date with data, patching in place when possible.
+
+    Args:
+        data: Dictionary or JSON string of agenda data
+        template_path: Path to the template DOCX file
+        output_path: Existing (or new) agenda DOCX path
+        logo_path: Path to logo file or base64 encoded image
+        validate: Check data against the agenda schema first
+        compression: DOCX compression for rewritten parts, as for create_agenda_doc
+
+    Returns:
+        Tuple of (output_path, mode) where mode is "unchanged", "patched" or "full"
+    """
+    if isinstance(data, str):
+        data = json.loads(data)
+
+    with span("update_agenda_doc") as current:
+        if validate:
+            validate_agenda(data, template_path)
+
+        record = _load_record(output_path)
+        mode = "full"
+        if record is not None and _same_inputs(record, template_path, logo_path):
+            try:
+                changed = _patch_document(output_path, record["data"], data, template_path, compression)
+                mode = "patched" if changed else "unchanged"
+            except PatchNotPossible as e:
+                logger.info("Incremental update not possible (%s); rendering in full", e)
+
+        if mode == "full":
+            create_agenda_doc(data, template_path, output_path, logo_path, validate=False,
+                              compression=compression)
+        if mode != "unchanged" or record["data"] != data:
+            _save_record(output_path, data, template_path, logo_path)
+
+        if current is not None:
+            current.set(mode=mode)
+        logger.info("Agenda %s: %s", mode, output_path)
+        return output_path, mode
+
+
+def _same_inputs(record, template_path, logo_path):
+    return (
+        record.get("template") == os.path.abspath(template_path)
+        and record.get("template_mtime") == os.path.getmtime(template_path)
+        and record.get("logo") == _fingerprint(logo_path)
+    )
+
+
+def diff_agenda(old, new, template_path=None):
+    """
+    Describe the text edits turning old agenda data into new.
+
+    Returns:
+        List of (scope, old_text, new_text) where scope is ("scalar", field),
+        ("person", index) or ("item", index, field)
+
+    Raises:
+        PatchNotPossible: for structural changes (list lengths, non-text fields)
+    """
+    edits = []
+    rendered = template_variables(template_path) if template_path else None
+    handled = set(SCALAR_FIELDS) | set(PEOPLE_FIELDS) | {"agenda_items"}
+
+    for key in set(old) | set(new):
+        if key in handled or key in _COMPUTED or old.get(key) == new.get(key):
+            continue
+        if rendered is not None and key in rendered:
+            raise PatchNotPossible(f"template field '{key}' changed")
+
+    for field in SCALAR_FIELDS:
+        before, after = old.get(field, ""), new.get(field, "")
+        if before != after:
+            if not before:
+                raise PatchNotPossible(f"'{field}' was empty in the previous render")
+            edits.append((("scalar", field), before, after))
+
+    old_people = [p for f in PEOPLE_FIELDS for p in old.get(f, [])]
+    new_people = [p for f in PEOPLE_FIELDS for p in new.get(f, [])]
+    for field in PEOPLE_FIELDS:
+        if len(old.get(field, [])) != len(new.get(field, [])):
+            raise PatchNotPossible(f"'{field}' entries added or removed")
+    for index, (before, after) in enumerate(zip(old_people, new_people)):
+        before_text = f"{before.get('name', '')}, {before.get('role', '')}"
+        after_text = f"{after.get('name', '')}, {after.get('role', '')}"
+        if before_text != after_text:
+            edits.append((("person", index), before_text, after_text))
+
+    old_items, new_items = old.get("agenda_items", []), new.get("agenda_items", [])
+    if len(old_items) != len(new_items):
+        raise PatchNotPossible("agenda items added or removed")
+    for index, (before, after) in enumerate(zip(old_items, new_items)):
+        for field in ITEM_FIELDS:
+            if before.get(field, "") != after.get(field, ""):
+                if not before.get(field, "").strip():
+                    raise PatchNotPossible(f"agenda_items[{index}].{field} was empty")
+                edits.append((("item", index, field), before.get(field, ""), after.get(field, "")))
+    return edits
+
+
+def _paragraph_text(paragraph):
+    return "".join(t.text or "" for t in paragraph.iter(_W + "t"))
+
+
+def _replace_in_paragraph(paragraph, old, new):
+    """Replace the first occurrence of old in a paragraph, splicing across runs."""
+    nodes = list(paragraph.iter(_W + "t"))
+    texts = [t.text or "" for t in nodes]
+    joined = "".join(texts)
+    start = joined.find(old)
+    if start < 0:
+        return False
+    end = start + len(old)
+
+    position = 0
+    first = None
+    for node, text in zip(nodes, texts):
+        node_start, node_end = position, position + len(text)
+        position = node_end
+        if node_end <= start or node_start >= end:
+            continue
+        if first is None:
+            # The run where the match begins carries the replacement text
+            first = node
+            tail = text[end - node_start:] if end <= node_end else ""
+            node.text = text[:start - node_start] + new + tail
+        else:
+            node.text = text[end - node_start:] if end < node_end else ""
+        node.set(_XML_SPACE, "preserve")
+    return first is not None
+
+
+def _match_rows(body, items):
+    """Map agenda items (in order) to table rows whose cells show all their fields."""
+    rows = []
+    for row in body.iter(_W + "tr"):
+        texts = [_paragraph_text(p).strip() for p in row.iter(_W + "p")]
+        rows.append((row, texts))
+
+    mapping = {}
+    cursor = 0
+    for index, item in enumerate(items):
+        wanted = [str(item.get(field, "")).strip() for field in ITEM_FIELDS]
+        for position in range(cursor, len(rows)):
+            texts = rows[position][1]
+            if all(value in texts for value in wanted):
+                mapping[index] = rows[position][0]
+                cursor = position + 1
+                break
+        else:
+            raise PatchNotPossible(f"could not locate the row for agenda_items[{index}]")
+    return mapping
+
+
+def _match_people(body, people_texts):
+    paragraphs = [p for p in body.iter(_W + "p")]
+    mapping = {}
+    cursor = 0
+    for index, text in enumerate(people_texts):
+        for position in range(cursor, len(paragraphs)):
+            if _paragraph_text(paragraphs[position]).strip() == text:
+                mapping[index] = paragraphs[position]
+                cursor = position + 1
+                break
+        else:
+            raise PatchNotPossible(f"could not locate team member '{text}'")
+    return mapping
+
+
+def _apply_edits(root, old_data, edits):
+    body = root.find(_W + "body")
+    item_edits = [e for e in edits if e[0][0] == "item"]
+    person_edits = [e for e in edits if e[0][0] == "person"]
+    scalar_edits = [e for e in edits if e[0][0] == "scalar"]
+
+    if item_edits:
+        rows = _match_rows(body, old_data.get("agenda_items", []))
+        for (_, index, field), before, after in item_edits:
+            target = before.strip()
+            for paragraph in rows[index].iter(_W + "p"):
+                if _paragraph_text(paragraph).strip() == target:
+                    _replace_in_paragraph(paragraph, target, after.strip())
+                    break
+            else:
+                raise PatchNotPossible(f"agenda_items[{index}].{field} not found in its row")
+
+    if person_edits:
+        people = [f"{p.get('name', '')}, {p.get('role', '')}"
+                  for f in PEOPLE_FIELDS for p in old_data.get(f, [])]
+        paragraphs = _match_people(body, people)
+        for (_, index), before, after in person_edits:
+            _replace_in_paragraph(paragraphs[index], before, after)
+
+    # Only whole-paragraph matches: the same words inside other text (a customer
+    # name in a description) may not come from this field
+    for (_, field), before, after in scalar_edits:
+        targets = [p for p in body.iter(_W + "p") if _paragraph_text(p).strip() == before.strip()]
+        if not targets:
+            raise PatchNotPossible(f"'{field}' is not a paragraph of its own in the document")
+        for paragraph in targets:
+            _replace_in_paragraph(paragraph, before.strip(), after)
+
+
+def _patch_document(output_path, old_data, new_data, template_path, compression=None):
+    """Apply text edits to output_path in place. Returns the number of edits applied."""
+    with span("diff"):
+        edits = diff_agenda(old_data, new_data, template_path)
+    if not edits:
+        return 0
+
+    with span("patch_xml", edits=len(edits)):
+        root = etree.fromstring(read_member(output_path, DOCUMENT_PART))
+        _apply_edits(root, old_data, edits)
+        document_xml = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+    with span("rewrite_package"):
+        rewrite_members(output_path, {DOCUMENT_PART: document_xml}, compression=compression)
+    logger.info("Patched %d field(s) in %s", len(edits), output_path)
+    return len(edits)
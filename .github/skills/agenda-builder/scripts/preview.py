@@ -0,0 +1,187 @@
+"""
+HTML / Markdown agenda preview.
+
+Renders the same context create_agenda_doc feeds the DOCX template (customer,
+title, primaries, supporting, agenda_items, logo) with Jinja templates compiled
+once at import. No DOCX is loaded, saved or post-processed, so a preview takes
+well under a millisecond and can be shown inline in chat; the DOCX render is
+kept for the final artifact.
+
+Usage (from the agenda-builder folder):
+    python -m scripts.preview ENGAGEMENT_PATH/agenda_data.json              # Markdown to stdout
+    python -m scripts.preview ENGAGEMENT_PATH/agenda_data.json -o preview.html
+"""
+
+import base64
+import json
+import mimetypes
+import os
+import sys
+
+from jinja2 import Environment
+
+_SHARED = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "_shared"))
+if _SHARED not in sys.path:
+    sys.path.insert(0, _SHARED)
+
+from skillkit.atomic import write_text
+
+from .schema import build_context, validate_agenda
+
+_MARKDOWN_TEMPLATE = """\
+{% if logo_src %}![{{ customer }} logo]({{ logo_src }})
+
+{% endif %}# {{ title }}
+
+**Customer:** {{ customer }} · **Date:** {{ date }}{% if time %} · **Time:** {{ time }}{% endif %}
+
+{% if summary %}{{ summary }}
+
+{% endif %}{% if primaries or supporting %}## Microsoft Team
+
+{% for person in primaries %}- **{{ person.name }}**, {{ person.role }}
+{% endfor %}{% for person in supporting %}- {{ person.name }}, {{ person.role }}
+{% endfor %}
+{% endif %}## Agenda
+
+| Time | Topic | Owner |
+|------|-------|-------|
+{% for item in agenda_items %}| {{ item.time | md_cell }} | **{{ item.topic | md_cell }}**<br>{{ item.description | md_cell }} | {{ item.owner | md_cell }} |
+{% endfor %}"""
+
+_HTML_TEMPLATE = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{{ customer }} - {{ title }}</title>
+<style>
+body { font-family: "Segoe UI", Arial, sans-serif; color: #222; max-width: 820px; margin: 2em auto; }
+.logo { max-height: 60px; float: right; }
+h1 { font-size: 1.5em; margin-bottom: 0.2em; }
+.meta { color: #555; margin-bottom: 1em; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border-bottom: 1px solid #ddd; padding: 6px 8px; text-align: left; vertical-align: top; }
+th { background: #0078d4; color: #fff; }
+td.time { white-space: nowrap; width: 9em; }
+td.owner { width: 10em; }
+.topic { font-weight: 600; }
+</style>
+</head>
+<body>
+{% if logo_src %}<img class="logo" src="{{ logo_src }}" alt="{{ customer }} logo">
+{% endif %}<h1>{{ title }}</h1>
+<div class="meta"><strong>{{ customer }}</strong> &middot; {{ date }}{% if time %} &middot; {{ time }}{% endif %}</div>
+{% if summary %}<p>{{ summary }}</p>
+{% endif %}{% if primaries or supporting %}<h2>Microsoft Team</h2>
+<ul>
+{% for person in primaries %}<li><strong>{{ person.name }}</strong>, {{ person.role }}</li>
+{% endfor %}{% for person in supporting %}<li>{{ person.name }}, {{ person.role }}</li>
+{% endfor %}</ul>
+{% endif %}<h2>Agenda</h2>
+<table>
+<tr><th>Time</th><th>Topic</th><th>Owner</th></tr>
+{% for item in agenda_items %}<tr><td class="time">{{ item.time }}</td><td><div class="topic">{{ item.topic }}</div>{{ item.description }}</td><td class="owner">{{ item.owner }}</td></tr>
+{% endfor %}</table>
+</body>
+</html>
+"""
+
+
+def _md_cell(value):
+    """Keep a value inside one Markdown table cell."""
+    return str(value).replace("|", "\\|").replace("\r", "").replace("\n", "<br>")
+
+
+_markdown_env = Environment(autoescape=False, keep_trailing_newline=True)
+_markdown_env.filters["md_cell"] = _md_cell
+_html_env = Environment(autoescape=True, keep_trailing_newline=True)
+
+# Compiled once; render() only walks the already-built template code
+_TEMPLATES = {
+    "markdown": _markdown_env.from_string(_MARKDOWN_TEMPLATE),
+    "html": _html_env.from_string(_HTML_TEMPLATE),
+}
+
+
+def _logo_source(logo_path, fmt):
+    """
+    Resolve a logo to something the preview can reference.
+
+    HTML embeds file logos as a data URI so the preview is self-contained;
+    Markdown links to the file path. Base64 data URIs pass through unchanged.
+    """
+    if not logo_path:
+        return None
+    if logo_path.startswith("data:image"):
+        return logo_path
+    if not os.path.exists(logo_path):
+        return None
+    if fmt == "markdown":
+        return logo_path.replace(os.sep, "/")
+    mime = mimetypes.guess_type(logo_path)[0] or "image/png"
+    with open(logo_path, "rb") as f:
+        encoded = base64.b64encode(f.read()).decode("ascii")
+    return f"data:{mime};base64,{encoded}"
+
+
+def render_agenda_preview(data, fmt="markdown", logo_path=None, validate=True):
+    """
+    Render agenda data to a Markdown or HTML preview string.
+
+    Args:
+        data: Dictionary or JSON string of agenda data
+        fmt: "markdown" or "html"
+        logo_path: Optional logo file path or base64 data URI
+        validate: Check data against the agenda schema first (raises AgendaValidationError)
+
+    Returns:
+        Rendered preview text
+    """
+    if fmt not in _TEMPLATES:
+        raise ValueError(f"Unknown preview format: {fmt!r} (expected 'markdown' or 'html')")
+    if isinstance(data, str):
+        data = json.loads(data)
+    if validate:
+        validate_agenda(data)
+
+    context = build_context(data)
+    context["time"] = data.get("time", "")
+    context["logo_src"] = _logo_source(logo_path, fmt)
+    return _TEMPLATES[fmt].render(context)
+
+
+def save_agenda_preview(data, output_path, logo_path=None, validate=True):
+    """
+    Render a preview and write it next to the agenda. Format follows the
+    extension: .html/.htm for HTML, anything else for Markdown.
+
+    Returns:
+        output_path
+    """
+    ext = os.path.splitext(output_path)[1].lower()
+    fmt = "html" if ext in (".html", ".htm") else "markdown"
+    content = render_agenda_preview(data, fmt, logo_path, validate)
+    write_text(output_path, content)
+    return output_path
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Render an agenda preview without building the DOCX")
+    parser.add_argument("agenda_json", help="Path to agenda_data.json")
+    parser.add_argument("--format", "-f", choices=sorted(_TEMPLATES), default="markdown",
+                        help="Preview format when printing to stdout (default: markdown)")
+    parser.add_argument("--output", "-o", help="Write to this file (.html or .md) instead of stdout")
+    parser.add_argument("--logo", help="Logo file path or base64 data URI")
+    args = parser.parse_args()
+
+    with open(args.agenda_json, encoding="utf-8") as f:
+        agenda = json.load(f)
+
+    if args.output:
+        save_agenda_preview(agenda, args.output, args.logo)
+        print(f"✅ Preview saved to: {args.output}")
+    else:
+        print(render_agenda_preview(agenda, args.format, args.logo))
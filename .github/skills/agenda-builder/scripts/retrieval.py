@@ -0,0 +1,493 @@
+"""
+Ranked retrieval over past engagement artifacts.
+
+Finding sessions similar to a new one used to mean rereading whole engagement
+folders. This module keeps an on-disk inverted index (SQLite) of the artifacts
+other skills leave in each engagement folder:
+
+    agenda_data.json          agenda (title/summary, one passage per agenda item)
+    closeout_summary_*.md     closeout (one passage per section/paragraph)
+    followup_email_*.html     followup (one passage per paragraph, tags stripped)
+
+Passages are ranked with BM25; a document scores the sum of its best three
+passages, and results carry only those passages as snippets. A long query such
+as a whole transcript is reduced to its most distinctive terms first.
+
+update() is incremental: files are compared by size and mtime and only new,
+changed or deleted files touch the index.
+
+Usage (from the agenda-builder folder):
+    python -m scripts.retrieval update [--base PATH]
+    python -m scripts.retrieval search --file transcript.txt --kind agenda -k 5
+    python -m scripts.retrieval search "zero trust identity architecture review"
+
+    from scripts.retrieval import RetrievalIndex
+    with RetrievalIndex() as index:
+        index.update(engagements_base_path)
+        for hit in index.search(transcript, kind="agenda", k=5):
+            print(hit["score"], hit["path"], hit["snippets"])
+
+The index defaults to ~/.copilot-skills/retrieval.db (or SKILLS_RETRIEVAL_DB),
+outside the synced engagements folder.
+"""
+
+import fnmatch
+import heapq
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import sys
+from collections import Counter
+from html.parser import HTMLParser
+
+_SHARED = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "_shared"))
+if _SHARED not in sys.path:
+    sys.path.insert(0, _SHARED)
+
+from skillkit.config import load_base_path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = os.environ.get(
+    "SKILLS_RETRIEVAL_DB", os.path.join(os.path.expanduser("~"), ".copilot-skills", "retrieval.db")
+)
+
+# File name pattern -> artifact kind
+ARTIFACTS = (
+    ("agenda_data.json", "agenda"),
+    ("closeout_summary_*.md", "closeout"),
+    ("followup_email_*.html", "followup"),
+)
+
+# BM25 parameters (the usual defaults)
+K1 = 1.2
+B = 0.75
+# Document score = sum of its best passages
+PASSAGES_PER_DOCUMENT = 3
+# Terms kept from a long query (e.g. a transcript)
+MAX_QUERY_TERMS = 32
+# Longer paragraphs are split so snippets stay short
+MAX_PASSAGE_CHARS = 700
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.-]*[a-z0-9+#]|[a-z0-9]")
+_STOPWORDS = frozenset("""
+a about above after again all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further had has
+have having he her here hers herself him himself his how i if in into is it its itself just let
+like me more most my myself no nor not now of off on once only or other our ours ourselves out
+over own really right same she should so some such than that the their theirs them themselves
+then there these they this those through to too um uh under until up very was we well were what
+when where which while who whom why will with would yeah yes you your yours yourself yourselves
+okay ok gonna going get got know think mean kind sort thing things one two just actually
+""".split())
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    engagement TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS passages (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL REFERENCES files (path) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS passages_path ON passages (path);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    passage INTEGER NOT NULL REFERENCES passages (id) ON DELETE CASCADE,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, passage)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_passage ON postings (passage);
+"""
+
+
+def tokenize(text):
+    """Lowercased terms without stopwords, with a light plural strip."""
+    terms = []
+    for token in _TOKEN.findall(text.lower()):
+        if token in _STOPWORDS or len(token) < 2:
+            continue
+        if len(token) > 4 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+def _split_long(text):
+    """Split a paragraph at sentence boundaries into MAX_PASSAGE_CHARS pieces."""
+    if len(text) <= MAX_PASSAGE_CHARS:
+        return [text]
+    pieces, current = [], ""
+    for sentence in re.split(r"(?<=[.!?])\s+", text):
+        if current and len(current) + len(sentence) > MAX_PASSAGE_CHARS:
+            pieces.append(current)
+            current = ""
+        current = f"{current} {sentence}".strip()
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _paragraphs(text):
+    return [re.sub(r"\s+", " ", p).strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+
+
+def _agenda_passages(raw):
+    data = json.loads(raw)
+    if not isinstance(data, dict):
+        raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+    heading = " - ".join(str(data[k]) for k in ("customer", "title", "date") if data.get(k))
+    passages = [f"{heading}. {data.get('summary', '')}".strip()]
+    items = data.get("agenda_items")
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        topic = item.get("topic", "")
+        owner = item.get("owner", "")
+        passages.append(f"{item.get('time', '')} {topic} ({owner}): {item.get('description', '')}".strip())
+    return passages
+
+
+def _markdown_passages(raw):
+    passages, heading = [], ""
+    for block in _paragraphs(raw):
+        if block.startswith("#"):
+            # Keep the section title with the paragraphs that follow it
+            heading = block.lstrip("#").strip()
+            continue
+        text = f"{heading}: {block}" if heading else block
+        passages.extend(_split_long(text))
+    return passages
+
+
+class _TextExtractor(HTMLParser):
+    _BLOCKS = {"p", "div", "br", "li", "tr", "h1", "h2", "h3", "h4", "table", "ul", "ol"}
+
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("style", "script"):
+            self._skip += 1
+        elif tag in self._BLOCKS:
+            self.parts.append("\n\n")
+
+    def handle_endtag(self, tag):
+        if tag in ("style", "script"):
+            self._skip = max(0, self._skip - 1)
+        elif tag in self._BLOCKS:
+            self.parts.append("\n\n")
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def _html_passages(raw):
+    extractor = _TextExtractor()
+    extractor.feed(raw)
+    passages = []
+    for paragraph in _paragraphs("".join(extractor.parts)):
+        passages.extend(_split_long(paragraph))
+    return passages
+
+
+_EXTRACTORS = {"agenda": _agenda_passages, "closeout": _markdown_passages, "followup": _html_passages}
+
+
+def artifact_kind(filename):
+    for pattern, kind in ARTIFACTS:
+        if fnmatch.fnmatch(filename, pattern):
+            return kind
+    return None
+
+
+def _snippet(text, query_terms, width=240):
+    """Window of the passage around its first query term."""
+    if len(text) <= width:
+        return text
+    lowered = text.lower()
+    hits = [lowered.find(term) for term in query_terms]
+    first = min((h for h in hits if h >= 0), default=0)
+    start = max(0, min(first - width // 4, len(text) - width))
+    snippet = text[start:start + width]
+    return ("…" if start else "") + snippet + ("…" if start + width < len(text) else "")
+
+
+class RetrievalIndex:
+    """On-disk BM25 index of engagement artifacts. Use as a context manager or call close()."""
+
+    def __init__(self, path=None):
+        path = path or DEFAULT_INDEX_PATH
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # --- Indexing ---------------------------------------------------------
+
+    def _scan(self, base_path):
+        found = {}
+        for root, dirs, files in os.walk(base_path):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            for name in files:
+                kind = artifact_kind(name)
+                if not kind:
+                    continue
+                path = os.path.abspath(os.path.join(root, name))
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                engagement = os.path.relpath(root, base_path).split(os.sep)[0]
+                found[path] = (kind, engagement, st.st_mtime_ns, st.st_size)
+        return found
+
+    def _index_file(self, path, kind, engagement, mtime_ns, size):
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            raw = f.read()
+        passages = [p for p in _EXTRACTORS[kind](raw) if p.strip()]
+        self.conn.execute(
+            "INSERT INTO files (path, kind, engagement, mtime_ns, size) VALUES (?, ?, ?, ?, ?)",
+            (path, kind, engagement, mtime_ns, size),
+        )
+        for position, text in enumerate(passages):
+            terms = tokenize(text)
+            cursor = self.conn.execute(
+                "INSERT INTO passages (path, position, length, text) VALUES (?, ?, ?, ?)",
+                (path, position, len(terms), text),
+            )
+            self.conn.executemany(
+                "INSERT INTO postings (term, passage, tf) VALUES (?, ?, ?)",
+                [(term, cursor.lastrowid, tf) for term, tf in Counter(terms).items()],
+            )
+
+    def _remove_file(self, path):
+        self.conn.execute(
+            "DELETE FROM postings WHERE passage IN (SELECT id FROM passages WHERE path = ?)", (path,)
+        )
+        self.conn.execute("DELETE FROM passages WHERE path = ?", (path,))
+        self.conn.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def update(self, base_path):
+        """
+        Bring the index in line with the artifacts under base_path.
+
+        Returns:
+            Dict with counts of added, updated, removed and unchanged files
+        """
+        found = self._scan(base_path)
+        base_prefix = os.path.join(os.path.abspath(base_path), "")
+        indexed = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in self.conn.execute("SELECT path, mtime_ns, size FROM files")
+            if path.startswith(base_prefix)
+        }
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        with self.conn:
+            for path in indexed.keys() - found.keys():
+                self._remove_file(path)
+                counts["removed"] += 1
+            for path, (kind, engagement, mtime_ns, size) in found.items():
+                previous = indexed.get(path)
+                if previous == (mtime_ns, size):
+                    counts["unchanged"] += 1
+                    continue
+                if previous is not None:
+                    self._remove_file(path)
+                try:
+                    self._index_file(path, kind, engagement, mtime_ns, size)
+                except (OSError, ValueError, TypeError, AttributeError) as e:
+                    # One malformed artifact must not block indexing the rest
+                    logger.warning("Skipping %s: %s", path, e)
+                    continue
+                counts["updated" if previous else "added"] += 1
+        logger.info("Index update: %s", counts)
+        return counts
+
+    # --- Search -----------------------------------------------------------
+
+    def _collection_stats(self):
+        count, avg_length = self.conn.execute("SELECT COUNT(*), AVG(length) FROM passages").fetchone()
+        return count, avg_length or 1.0
+
+    def _document_frequencies(self, terms):
+        placeholders = ",".join("?" * len(terms))
+        return dict(self.conn.execute(
+            f"SELECT term, COUNT(*) FROM postings WHERE term IN ({placeholders}) GROUP BY term", terms
+        ))
+
+    def query_terms(self, text, max_terms=MAX_QUERY_TERMS):
+        """
+        Weighted query terms for text: {term: weight}.
+
+        Short queries keep every term. Long ones (a transcript) keep the
+        max_terms terms with the highest tf * idf against the index, so filler
+        and words common to every engagement drop out.
+        """
+        counts = Counter(tokenize(text))
+        if not counts:
+            return {}
+        count, _ = self._collection_stats()
+        df = self._document_frequencies(list(counts))
+        weights = {}
+        for term, tf in counts.items():
+            if term not in df:
+                continue
+            idf = math.log(1 + (count - df[term] + 0.5) / (df[term] + 0.5))
+            weights[term] = (1 + math.log(tf), idf)
+        top = heapq.nlargest(max_terms, weights.items(), key=lambda item: item[1][0] * item[1][1])
+        return {term: query_weight for term, (query_weight, _) in top}
+
+    def search(self, text, kind=None, k=5, snippets=2, exclude_engagement=None):
+        """
+        Top-k artifacts for a query or a whole transcript.
+
+        Args:
+            text: Query text (a few words or a full transcript)
+            kind: Restrict to "agenda", "closeout" or "followup"
+            k: Documents to return
+            snippets: Passages returned per document
+            exclude_engagement: Engagement folder name to leave out (the current one)
+
+        Returns:
+            List of {"path", "engagement", "kind", "score", "snippets"}, best first
+        """
+        weights = self.query_terms(text)
+        if not weights:
+            return []
+        count, avg_length = self._collection_stats()
+        df = self._document_frequencies(list(weights))
+        idf = {term: math.log(1 + (count - n + 0.5) / (n + 0.5)) for term, n in df.items()}
+
+        placeholders = ",".join("?" * len(weights))
+        sql = (
+            "SELECT p.term, p.tf, s.id, s.length, s.path, f.kind, f.engagement "
+            "FROM postings p JOIN passages s ON s.id = p.passage JOIN files f ON f.path = s.path "
+            f"WHERE p.term IN ({placeholders})"
+        )
+        params = list(weights)
+        if kind:
+            sql += " AND f.kind = ?"
+            params.append(kind)
+        if exclude_engagement:
+            sql += " AND f.engagement != ?"
+            params.append(exclude_engagement)
+
+        passage_scores = Counter()
+        passage_docs = {}
+        for term, tf, passage, length, path, file_kind, engagement in self.conn.execute(sql, params):
+            norm = tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avg_length))
+            passage_scores[passage] += weights[term] * idf[term] * norm
+            passage_docs[passage] = (path, file_kind, engagement)
+
+        documents = {}
+        for passage, score in passage_scores.items():
+            documents.setdefault(passage_docs[passage], []).append((score, passage))
+        ranked = []
+        for (path, file_kind, engagement), scored in documents.items():
+            best = heapq.nlargest(PASSAGES_PER_DOCUMENT, scored)
+            ranked.append((sum(score for score, _ in best), path, file_kind, engagement, best))
+        ranked = heapq.nlargest(k, ranked)
+
+        results = []
+        for score, path, file_kind, engagement, best in ranked:
+            ids = [passage for _, passage in best[:snippets]]
+            texts = dict(self.conn.execute(
+                f"SELECT id, text FROM passages WHERE id IN ({','.join('?' * len(ids))})", ids
+            ))
+            results.append({
+                "path": path,
+                "engagement": engagement,
+                "kind": file_kind,
+                "score": round(score, 3),
+                "snippets": [_snippet(texts[passage], list(weights)) for passage in ids],
+            })
+        return results
+
+    def stats(self):
+        row = self.conn.execute(
+            "SELECT (SELECT COUNT(*) FROM files), (SELECT COUNT(*) FROM passages), "
+            "(SELECT COUNT(DISTINCT term) FROM postings)"
+        ).fetchone()
+        return {"files": row[0], "passages": row[1], "terms": row[2]}
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="BM25 index over past engagement artifacts")
+    parser.add_argument("--index", default=None, help=f"Index path (default: {DEFAULT_INDEX_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    upd = sub.add_parser("update", help="Index new and changed artifacts")
+    upd.add_argument("--base", help="Engagements folder (default: engagements_base_path in config.json)")
+
+    find = sub.add_parser("search", help="Rank artifacts for a query or transcript")
+    find.add_argument("query", nargs="?", help="Query text (or use --file)")
+    find.add_argument("--file", help="Read the query from a file, e.g. a planning transcript")
+    find.add_argument("--kind", choices=["agenda", "closeout", "followup"])
+    find.add_argument("-k", type=int, default=5)
+    find.add_argument("--snippets", type=int, default=2)
+    find.add_argument("--exclude", help="Engagement folder to leave out")
+    find.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    sub.add_parser("stats", help="Index size")
+
+    args = parser.parse_args()
+    with RetrievalIndex(args.index) as index:
+        if args.command == "update":
+            base = args.base or load_base_path()
+            if not base or not os.path.isdir(base):
+                print("❌ Engagements folder not found; pass --base or set engagements_base_path in config.json")
+                sys.exit(1)
+            start = time.perf_counter()
+            counts = index.update(base)
+            print(f"✅ {counts} in {time.perf_counter() - start:.2f}s")
+        elif args.command == "stats":
+            print(index.stats())
+        else:
+            if args.file:
+                with open(args.file, "r", encoding="utf-8", errors="replace") as f:
+                    query = f.read()
+            elif args.query:
+                query = args.query
+            else:
+                parser.error("search needs a query or --file")
+            start = time.perf_counter()
+            results = index.search(query, args.kind, args.k, args.snippets, args.exclude)
+            elapsed = (time.perf_counter() - start) * 1000
+            if args.json:
+                print(json.dumps(results, indent=2))
+            else:
+                for hit in results:
+                    print(f"{hit['score']:>7.2f}  {hit['kind']:<8}  {hit['engagement']}  {os.path.basename(hit['path'])}")
+                    for snippet in hit["snippets"]:
+                        print(f"           {snippet}")
+                print(f"({len(results)} result(s) in {elapsed:.1f} ms)")
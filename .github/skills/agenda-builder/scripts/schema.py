@@ -0,0 +1,236 @@
+"""
+Agenda JSON schema and upfront validation.
+
+Checks agenda data (the shape of assets/example_agenda.json) before any DOCX
+work starts, so malformed input fails in microseconds with field-level errors
+instead of costing a render and a fallback re-render.
+
+The schema is compiled once into a flat list of check functions. Compiling
+against a template additionally makes every data field the template references
+required, so a render only starts when the template's variables are covered.
+
+Usage:
+    python scripts/schema.py agenda_data.json [--template assets/agenda_template.docx]
+"""
+
+import json
+import os
+import sys
+
+# Field name -> (type, required). Person and agenda item entries are dicts of strings.
+PERSON_FIELDS = {
+    "name": (str, True),
+    "role": (str, True),
+}
+
+AGENDA_ITEM_FIELDS = {
+    "time": (str, True),
+    "owner": (str, True),
+    "topic": (str, True),
+    "description": (str, True),
+}
+
+AGENDA_SCHEMA = {
+    "customer": (str, True),
+    "date": (str, True),
+    "title": (str, True),
+    "summary": (str, False),
+    "time": (str, False),
+    "topic": (str, False),
+    "logo": (str, False),
+    "primaries": ([PERSON_FIELDS], False),
+    "supporting": ([PERSON_FIELDS], False),
+    "agenda_items": ([AGENDA_ITEM_FIELDS], True),
+    "attendees": (list, False),
+}
+
+# Template variables filled in by create_agenda_doc rather than taken from the JSON
+COMPUTED_VARIABLES = {"logo", "company_logo", "logo_image", "has_logo"}
+
+_TYPE_NAMES = {str: "string", list: "array", dict: "object", int: "integer", float: "number", bool: "boolean"}
+
+
+class AgendaValidationError(ValueError):
+    """Raised when agenda data does not match the schema. `errors` holds (path, message) pairs."""
+
+    def __init__(self, errors):
+        self.errors = errors
+        lines = [f"{path}: {message}" for path, message in errors]
+        super().__init__(f"Invalid agenda data ({len(errors)} error(s)):\n  " + "\n  ".join(lines))
+
+    def __reduce__(self):
+        # Rebuild from errors, not the message, when raised in a worker process
+        return (type(self), (self.errors,))
+
+
+def _type_name(value):
+    return _TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+def _compile_fields(fields, prefix):
+    """Compile a {name: (type, required)} mapping into a list of check(obj, errors) callables."""
+    checks = []
+    for name, (expected, required) in fields.items():
+        path = f"{prefix}.{name}" if prefix else name
+        if isinstance(expected, list):
+            checks.append(_compile_array(name, path, expected[0], required))
+        else:
+            checks.append(_compile_scalar(name, path, expected, required))
+    return checks
+
+
+def _compile_scalar(name, path, expected, required):
+    expected_name = _TYPE_NAMES[expected]
+
+    def check(obj, errors, path_prefix=""):
+        if name not in obj:
+            if required:
+                errors.append((path_prefix + path, "required field is missing"))
+            return
+        value = obj[name]
+        if not isinstance(value, expected):
+            errors.append((path_prefix + path, f"expected {expected_name}, got {_type_name(value)}"))
+        elif expected is str and required and not value.strip():
+            errors.append((path_prefix + path, "must not be empty"))
+
+    return check
+
+
+def _compile_array(name, path, item_fields, required):
+    item_checks = _compile_fields(item_fields, "")
+
+    def check(obj, errors, path_prefix=""):
+        if name not in obj:
+            if required:
+                errors.append((path_prefix + path, "required field is missing"))
+            return
+        items = obj[name]
+        if not isinstance(items, list):
+            errors.append((path_prefix + path, f"expected array, got {_type_name(items)}"))
+            return
+        for index, item in enumerate(items):
+            item_path = f"{path_prefix}{path}[{index}]"
+            if not isinstance(item, dict):
+                errors.append((item_path, f"expected object, got {_type_name(item)}"))
+                continue
+            for item_check in item_checks:
+                item_check(item, errors, item_path + ".")
+
+    return check
+
+
+def compile_schema(schema=AGENDA_SCHEMA, required_variables=()):
+    """
+    Compile a schema into a validator function.
+
+    Args:
+        schema: Field mapping, defaults to AGENDA_SCHEMA
+        required_variables: Template variables that must be present in the data
+                            (fields the template renders become required)
+
+    Returns:
+        Callable(data) -> list of (path, message) errors, empty when valid
+    """
+    fields = dict(schema)
+    errors_upfront = []
+    for var in sorted(required_variables):
+        if var in COMPUTED_VARIABLES:
+            continue
+        if var in fields:
+            expected, _ = fields[var]
+            fields[var] = (expected, True)
+        else:
+            errors_upfront.append((var, "template variable is not defined by the agenda schema"))
+    checks = _compile_fields(fields, "")
+
+    def validate(data):
+        if not isinstance(data, dict):
+            return [("$", f"expected object, got {_type_name(data)}")]
+        errors = list(errors_upfront)
+        for check in checks:
+            check(data, errors)
+        return errors
+
+    return validate
+
+
+_default_validator = compile_schema()
+_template_validators = {}
+
+
+def build_context(data):
+    """Map agenda data to the template context shared by the DOCX and preview renderers."""
+    return {
+        "customer": data.get("customer", ""),
+        "date": data.get("date", ""),
+        "title": data.get("title", ""),
+        "summary": data.get("summary", ""),
+        "primaries": data.get("primaries", []),
+        "supporting": data.get("supporting", []),
+        "agenda_items": data.get("agenda_items", []),
+        "attendees": data.get("attendees", []),
+        "has_logo": False  # Default to no logo
+    }
+
+
+def template_variables(template_path):
+    """Undeclared Jinja variables of a DOCX template, cached per (path, mtime)."""
+    return _template_entry(template_path)[0]
+
+
+def _template_entry(template_path):
+    key = os.path.abspath(template_path)
+    mtime = os.path.getmtime(key)
+    entry = _template_validators.get(key)
+    if entry is None or entry[2] != mtime:
+        from docxtpl import DocxTemplate
+
+        variables = frozenset(DocxTemplate(template_path).get_undeclared_template_variables())
+        entry = (variables, compile_schema(AGENDA_SCHEMA, variables), mtime)
+        _template_validators[key] = entry
+    return entry
+
+
+def agenda_errors(data, template_path=None):
+    """
+    Return (path, message) validation errors for agenda data.
+
+    Args:
+        data: Parsed agenda dictionary
+        template_path: Optional DOCX template; its variables become required fields
+    """
+    validator = _template_entry(template_path)[1] if template_path else _default_validator
+    return validator(data)
+
+
+def validate_agenda(data, template_path=None):
+    """
+    Validate agenda data, raising AgendaValidationError listing every problem found.
+
+    Args:
+        data: Parsed agenda dictionary
+        template_path: Optional DOCX template to check the data against
+    """
+    errors = agenda_errors(data, template_path)
+    if errors:
+        raise AgendaValidationError(errors)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate agenda JSON before rendering")
+    parser.add_argument("agenda_json", help="Path to agenda_data.json")
+    parser.add_argument("--template", help="DOCX template to check variables against")
+    args = parser.parse_args()
+
+    with open(args.agenda_json, encoding="utf-8") as f:
+        agenda = json.load(f)
+
+    problems = agenda_errors(agenda, args.template)
+    if problems:
+        print(f"✗ {len(problems)} problem(s) in {args.agenda_json}:")
+        for field_path, message in problems:
+            print(f"  {field_path}: {message}")
+        sys.exit(1)
+    print(f"✓ {args.agenda_json} is valid")
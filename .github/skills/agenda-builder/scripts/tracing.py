@@ -0,0 +1,231 @@
+"""
+Phase tracing for agenda rendering.
+
+Wraps the phases of create_agenda_doc / post_process_document in named spans
+and emits one structured record per span to a configurable sink. Tracing is
+off by default; while disabled, span() returns a shared no-op context manager
+so the instrumented code pays a single global lookup per phase.
+
+Enable from code:
+    from scripts.tracing import configure_tracing
+    configure_tracing("agenda_trace.jsonl")            # JSON lines
+    configure_tracing("agenda_trace.json", "chrome")   # chrome://tracing / Perfetto
+
+or from the environment (picked up on import):
+    AGENDA_TRACE=agenda_trace.jsonl
+    AGENDA_TRACE_FORMAT=chrome   # optional, default "jsonl"
+"""
+
+import atexit
+import cProfile
+import contextlib
+import io
+import json
+import os
+import pstats
+import threading
+import time
+
+_sink = None
+_local = threading.local()
+_NOOP = contextlib.nullcontext()
+
+
+class JsonLinesSink:
+    """Writes each finished span as one JSON object per line."""
+
+    def __init__(self, target):
+        self._lock = threading.Lock()
+        if isinstance(target, (str, os.PathLike)):
+            self._stream = open(target, "a", encoding="utf-8")
+            self._owns_stream = True
+        else:
+            self._stream = target
+            self._owns_stream = False
+
+    def emit(self, record):
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def close(self):
+        if self._owns_stream:
+            self._stream.close()
+
+
+class ChromeTraceSink:
+    """
+    Buffers spans as Chrome "complete" events (ph="X") and writes a
+    {"traceEvents": [...]} document on close(), loadable in chrome://tracing
+    or https://ui.perfetto.dev.
+    """
+
+    def __init__(self, target):
+        self._target = target
+        self._events = []
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        event = {
+            "name": record["name"],
+            "ph": "X",
+            "ts": record["start_us"],
+            "dur": record["duration_us"],
+            "pid": record["pid"],
+            "tid": record["tid"],
+            "args": record.get("attrs", {}),
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def close(self):
+        with self._lock:
+            document = {"traceEvents": self._events, "displayTimeUnit": "ms"}
+            if isinstance(self._target, (str, os.PathLike)):
+                with open(self._target, "w", encoding="utf-8") as f:
+                    json.dump(document, f, default=str)
+            else:
+                json.dump(document, self._target, default=str)
+            self._events = []
+
+
+class CallbackSink:
+    """Hands each span record to a callable (useful for tests and in-process collectors)."""
+
+    def __init__(self, callback):
+        self._callback = callback
+
+    def emit(self, record):
+        self._callback(record)
+
+    def close(self):
+        pass
+
+
+class _Span:
+    __slots__ = ("name", "attrs", "_start", "_parent")
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+
+    def set(self, **attrs):
+        """Attach extra attributes discovered while the span is open."""
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self._parent = stack[-1] if stack else None
+        stack.append(self.name)
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        _local.stack.pop()
+        sink = _sink
+        if sink is None:
+            return False
+        record = {
+            "name": self.name,
+            "parent": self._parent,
+            "start_us": self._start // 1000,
+            "duration_us": (end - self._start) // 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "status": "error" if exc_type else "ok",
+        }
+        if self.attrs:
+            record["attrs"] = self.attrs
+        if exc_type:
+            record["error"] = exc_type.__name__
+        sink.emit(record)
+        return False
+
+
+def span(name, **attrs):
+    """
+    Context manager timing one named phase.
+
+    Returns a shared no-op when tracing is disabled. When enabled, the
+    yielded span supports .set(key=value) for attributes known only
+    after the phase starts (e.g. row counts).
+    """
+    if _sink is None:
+        return _NOOP
+    return _Span(name, attrs)
+
+
+def tracing_enabled():
+    return _sink is not None
+
+
+def configure_tracing(target=None, fmt="jsonl"):
+    """
+    Enable tracing to a sink, or disable it when target is None.
+
+    Args:
+        target: File path, writable text stream, or callable receiving each record
+        fmt: "jsonl" for one JSON record per span, "chrome" for Chrome trace format
+             (ignored when target is a callable)
+
+    Returns:
+        The active sink, or None when tracing was disabled
+    """
+    global _sink
+    if _sink is not None:
+        _sink.close()
+        _sink = None
+    if target is None:
+        return None
+    if callable(target):
+        _sink = CallbackSink(target)
+    elif fmt == "chrome":
+        _sink = ChromeTraceSink(target)
+    elif fmt == "jsonl":
+        _sink = JsonLinesSink(target)
+    else:
+        raise ValueError(f"Unknown trace format: {fmt!r} (expected 'jsonl' or 'chrome')")
+    return _sink
+
+
+def flush_tracing():
+    """Write out buffered spans (Chrome format) and disable tracing."""
+    configure_tracing(None)
+
+
+@contextlib.contextmanager
+def capture_profile(output_path=None, sort_by="cumulative", limit=30):
+    """
+    Run the enclosed block (typically one create_agenda_doc call) under cProfile.
+
+    Args:
+        output_path: If given, raw stats are dumped here (open with snakeviz or pstats)
+        sort_by: pstats sort key for the text summary
+        limit: Number of rows in the text summary
+
+    Yields:
+        A dict that receives "stats" (pstats.Stats) and "summary" (str) on exit
+    """
+    result = {}
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield result
+    finally:
+        profiler.disable()
+        if output_path:
+            profiler.dump_stats(output_path)
+        buffer = io.StringIO()
+        stats = pstats.Stats(profiler, stream=buffer)
+        stats.sort_stats(sort_by).print_stats(limit)
+        result["stats"] = stats
+        result["summary"] = buffer.getvalue()
+
+
+if os.environ.get("AGENDA_TRACE"):
+    configure_tracing(os.environ["AGENDA_TRACE"], os.environ.get("AGENDA_TRACE_FORMAT", "jsonl"))
+    atexit.register(flush_tracing)
@@ -0,0 +1,395 @@
+"""
+Cold-storage archiving of closed engagements and journeys.
+
+Every scan, sync and search of the live Engagements folder pays for each
+folder in it, including years of finished work. After closeout, archive.py
+packs finished folders into one compressed bundle each and removes them from
+the live tree:
+
+  - the bundle is a zip (deflate; already-compressed files such as .docx,
+    .pptx, .pdf and images are stored as-is) in the archive folder, with a
+    manifest.json member: folder metadata, file list, sizes, mtimes, SHA-256
+  - archive_index.json in the engagements folder lists every bundle with the
+    customer, dates and counts, so archived work is still findable
+  - single files are read straight out of a bundle through the zip central
+    directory, without extracting the rest
+  - restore unpacks a bundle back into the live tree, checking every hash
+
+A folder is archived only after its bundle has been written, reread and
+verified against the manifest.
+
+Eligible folders: journeys with journey_status completed or closed, and
+engagements that have been closed out (closeout_generated or a
+closeout_summary_*.md) at least --older-than days ago (default 30, leaving
+time for a journey promotion). "archive_hold": true in the metadata keeps a
+folder live.
+
+Usage:
+    python scripts/archive.py run --dry-run
+    python scripts/archive.py run --older-than 60
+    python scripts/archive.py folder Keller-Group-PLC-2026-Customer-Journey
+    python scripts/archive.py list [customer]
+    python scripts/archive.py ls Keller-Group-PLC-2026-Customer-Journey
+    python scripts/archive.py cat Keller-Group-PLC-2026-Customer-Journey closeout_summary_2026-01-29.md
+    python scripts/archive.py restore Keller-Group-PLC-2026-Customer-Journey
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import zipfile
+
+_SHARED = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "_shared"))
+if _SHARED not in sys.path:
+    sys.path.insert(0, _SHARED)
+
+from skillkit.atomic import write_json
+from skillkit.config import load_config
+
+INDEX_NAME = "archive_index.json"
+MANIFEST_NAME = "manifest.json"
+METADATA_NAME = "engagement_metadata.json"
+BUNDLE_VERSION = 1
+DEFAULT_OLDER_THAN = 30
+
+# Formats that are already compressed; deflating them again only costs time
+_STORED_EXTENSIONS = {
+    ".docx", ".xlsx", ".pptx", ".zip", ".pdf", ".png", ".jpg", ".jpeg", ".gif", ".mp4", ".m4a", ".gz",
+}
+_DATE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_CHUNK_SIZE = 1 << 20
+
+
+class ArchiveError(RuntimeError):
+    """A bundle is missing, damaged or does not match its manifest."""
+
+
+def default_archive_path(base_path, config=None):
+    """archive_base_path from config.json, else Engagements-Archive next to the engagements folder."""
+    configured = (config or {}).get("archive_base_path")
+    if configured:
+        return configured
+    return os.path.join(os.path.dirname(os.path.abspath(base_path)), "Engagements-Archive")
+
+
+def _read_metadata(folder):
+    path = os.path.join(folder, METADATA_NAME)
+    if not os.path.isfile(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _iso_date(value):
+    """value as YYYY-MM-DD, or None if it is not an ISO date."""
+    try:
+        return datetime.date.fromisoformat(value).isoformat()
+    except (TypeError, ValueError):
+        return None
+
+
+def last_activity(folder_name, metadata):
+    """Latest date known for a folder: sessions, engagement date or the date in its name (ISO dates only)."""
+    dates = [s.get("date") for s in metadata.get("sessions") or [] if isinstance(s, dict)]
+    dates += [metadata.get(k) for k in ("engagement_date", "date")]
+    match = _DATE.search(folder_name)
+    if match:
+        dates.append(match.group(1))
+    dates = [d for d in map(_iso_date, dates) if d]
+    return max(dates) if dates else None
+
+
+def archive_reason(folder, today=None, older_than=DEFAULT_OLDER_THAN):
+    """Why a folder may be archived, or None if it must stay live."""
+    metadata = _read_metadata(folder)
+    if metadata.get("archive_hold"):
+        return None
+    if metadata.get("journey_status") in ("completed", "closed"):
+        return f"journey {metadata['journey_status']}"
+    if metadata.get("sessions") or metadata.get("journey_status"):
+        return None  # Active journey
+    closed_out = metadata.get("closeout_generated") or any(
+        name.startswith("closeout_summary_") for name in os.listdir(folder)
+    )
+    if not closed_out:
+        return None
+    last = last_activity(os.path.basename(folder), metadata)
+    today = today or datetime.date.today()
+    if last and (today - datetime.date.fromisoformat(last)).days < older_than:
+        return None
+    return f"closed out, last activity {last or 'unknown'}"
+
+
+def find_candidates(base_path, today=None, older_than=DEFAULT_OLDER_THAN):
+    """(folder path, reason) for every folder that can be archived."""
+    candidates = []
+    for entry in sorted(os.scandir(base_path), key=lambda e: e.name):
+        if entry.is_dir() and not entry.name.startswith("."):
+            try:
+                reason = archive_reason(entry.path, today, older_than)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Skipping {entry.name}: {e}")
+                continue
+            if reason:
+                candidates.append((entry.path, reason))
+    return candidates
+
+
+class Archive:
+    """Bundles in an archive folder plus the stub index in the live engagements folder."""
+
+    def __init__(self, base_path, archive_path=None):
+        self.base_path = base_path
+        self.archive_path = archive_path or default_archive_path(base_path, load_config())
+        self.index_path = os.path.join(base_path, INDEX_NAME)
+
+    # --- Index ------------------------------------------------------------
+
+    def load_index(self):
+        if not os.path.isfile(self.index_path):
+            return {"version": BUNDLE_VERSION, "bundles": {}}
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_index(self, index):
+        write_json(self.index_path, index)
+
+    def bundle_path(self, folder_name):
+        return os.path.join(self.archive_path, folder_name + ".zip")
+
+    def entries(self, customer=None):
+        bundles = self.load_index()["bundles"]
+        needle = (customer or "").lower().replace(" ", "-")
+        return {name: entry for name, entry in sorted(bundles.items())
+                if not needle or needle in name.lower() or needle in (entry.get("customer") or "").lower()}
+
+    # --- Packing ----------------------------------------------------------
+
+    def _manifest(self, folder):
+        files = []
+        for root, dirs, names in os.walk(folder):
+            dirs.sort()
+            for name in sorted(names):
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                files.append({
+                    "path": os.path.relpath(path, folder).replace(os.sep, "/"),
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime,
+                    "sha256": _sha256(path),
+                })
+        return {
+            "version": BUNDLE_VERSION,
+            "folder": os.path.basename(folder),
+            "archived": datetime.datetime.now().isoformat(timespec="seconds"),
+            "metadata": _read_metadata(folder),
+            "files": files,
+        }
+
+    def pack(self, folder, remove=True):
+        """
+        Bundle a folder, verify the bundle and (by default) remove the live folder.
+
+        Returns the index entry. Raises ArchiveError if verification fails; the
+        live folder is then left untouched.
+        """
+        folder = os.path.abspath(folder)
+        name = os.path.basename(folder)
+        manifest = self._manifest(folder)
+        os.makedirs(self.archive_path, exist_ok=True)
+        destination = self.bundle_path(name)
+        partial = destination + ".partial"
+        with zipfile.ZipFile(partial, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as bundle:
+            bundle.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2, ensure_ascii=False))
+            for item in manifest["files"]:
+                stored = os.path.splitext(item["path"])[1].lower() in _STORED_EXTENSIONS
+                bundle.write(os.path.join(folder, *item["path"].split("/")), item["path"],
+                             compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED)
+        os.replace(partial, destination)
+        self.verify(name)
+
+        metadata = manifest["metadata"]
+        entry = {
+            "customer": metadata.get("customer"),
+            "engagement_type": metadata.get("engagement_type"),
+            "last_activity": last_activity(name, metadata),
+            "journey_status": metadata.get("journey_status"),
+            "archived": manifest["archived"],
+            "bundle": os.path.abspath(destination),
+            "files": len(manifest["files"]),
+            "bytes": sum(item["size"] for item in manifest["files"]),
+            "bundle_bytes": os.path.getsize(destination),
+            "bundle_sha256": _sha256(destination),
+        }
+        index = self.load_index()
+        index["bundles"][name] = entry
+        self._save_index(index)
+        if remove:
+            shutil.rmtree(folder)
+        return entry
+
+    # --- Reading ----------------------------------------------------------
+
+    def _open(self, folder_name):
+        path = self.bundle_path(folder_name)
+        if not os.path.isfile(path):
+            entry = self.load_index()["bundles"].get(folder_name)
+            path = entry["bundle"] if entry else path
+        if not os.path.isfile(path):
+            raise ArchiveError(f"No bundle for {folder_name} in {self.archive_path}")
+        return zipfile.ZipFile(path, "r")
+
+    def manifest(self, folder_name):
+        with self._open(folder_name) as bundle:
+            return json.loads(bundle.read(MANIFEST_NAME))
+
+    def read(self, folder_name, member):
+        """One file's bytes from a bundle, checked against the manifest hash."""
+        with self._open(folder_name) as bundle:
+            manifest = json.loads(bundle.read(MANIFEST_NAME))
+            expected = {item["path"]: item["sha256"] for item in manifest["files"]}
+            if member not in expected:
+                raise ArchiveError(f"{member} is not in the {folder_name} bundle")
+            data = bundle.read(member)
+        if hashlib.sha256(data).hexdigest() != expected[member]:
+            raise ArchiveError(f"{member} in the {folder_name} bundle does not match its manifest hash")
+        return data
+
+    def verify(self, folder_name):
+        """Check every member of a bundle against its manifest; raises ArchiveError."""
+        with self._open(folder_name) as bundle:
+            manifest = json.loads(bundle.read(MANIFEST_NAME))
+            for item in manifest["files"]:
+                digest = hashlib.sha256()
+                with bundle.open(item["path"]) as member:
+                    for chunk in iter(lambda: member.read(_CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                if digest.hexdigest() != item["sha256"]:
+                    raise ArchiveError(f"{item['path']} in the {folder_name} bundle is damaged")
+        return manifest
+
+    def restore(self, folder_name, destination=None, keep_bundle=True):
+        """Unpack a bundle into the live tree (or destination) and drop it from the index."""
+        target = os.path.join(destination or self.base_path, folder_name)
+        if os.path.exists(target):
+            raise ArchiveError(f"{target} already exists")
+        partial = target + ".restoring"
+        if os.path.exists(partial):
+            shutil.rmtree(partial)
+        with self._open(folder_name) as bundle:
+            manifest = json.loads(bundle.read(MANIFEST_NAME))
+            bundle_file = bundle.filename
+            for item in manifest["files"]:
+                path = os.path.join(partial, *item["path"].split("/"))
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with bundle.open(item["path"]) as source, open(path, "wb") as out:
+                    shutil.copyfileobj(source, out, _CHUNK_SIZE)
+                if _sha256(path) != item["sha256"]:
+                    raise ArchiveError(f"{item['path']} failed its hash check while restoring")
+                os.utime(path, (item["mtime"], item["mtime"]))
+        os.replace(partial, target)
+        if destination is None:
+            index = self.load_index()
+            if index["bundles"].pop(folder_name, None) is not None:
+                self._save_index(index)
+            if not keep_bundle:
+                os.remove(bundle_file)
+        return target
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Archive closed engagements into compressed bundles")
+    parser.add_argument("--base", help="Engagements folder (default: engagements_base_path in config.json)")
+    parser.add_argument("--archive-dir", help="Bundle folder (default: archive_base_path in config.json, "
+                                              "else Engagements-Archive next to the engagements folder)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("run", help="Archive every eligible folder")
+    p.add_argument("--older-than", type=int, default=DEFAULT_OLDER_THAN,
+                   help="Days since last activity before a closed-out engagement is archived")
+    p.add_argument("--dry-run", action="store_true", help="List what would be archived")
+    p = sub.add_parser("folder", help="Archive one folder regardless of eligibility")
+    p.add_argument("name")
+    p = sub.add_parser("list", help="List archived folders")
+    p.add_argument("customer", nargs="?")
+    p = sub.add_parser("ls", help="List the files in a bundle")
+    p.add_argument("name")
+    p = sub.add_parser("cat", help="Print or extract one file from a bundle")
+    p.add_argument("name")
+    p.add_argument("path", help="File path inside the folder")
+    p.add_argument("-o", "--output", help="Write to this file instead of stdout")
+    p = sub.add_parser("verify", help="Check a bundle against its manifest")
+    p.add_argument("name")
+    p = sub.add_parser("restore", help="Unpack a bundle back into the engagements folder")
+    p.add_argument("name")
+    p.add_argument("--to", help="Restore under this folder instead (index unchanged)")
+    p.add_argument("--delete-bundle", action="store_true")
+    args = parser.parse_args()
+
+    config = load_config()
+    base = args.base or config.get("engagements_base_path")
+    if not base or not os.path.isdir(base):
+        print("❌ Engagements folder not found (use --base or set engagements_base_path in config.json)")
+        sys.exit(1)
+    archive = Archive(base, args.archive_dir or default_archive_path(base, config))
+
+    try:
+        if args.command == "run":
+            candidates = find_candidates(base, older_than=args.older_than)
+            if not candidates:
+                print("Nothing to archive")
+            for folder, reason in candidates:
+                if args.dry_run:
+                    print(f"  would archive {os.path.basename(folder)}  ({reason})")
+                    continue
+                entry = archive.pack(folder)
+                print(f"  ✅ {os.path.basename(folder)}: {entry['files']} files, "
+                      f"{entry['bytes'] / 1024:.0f} KB → {entry['bundle_bytes'] / 1024:.0f} KB")
+            if candidates and not args.dry_run:
+                print(f"✅ Archived {len(candidates)} folders to {archive.archive_path}")
+        elif args.command == "folder":
+            folder = os.path.join(base, args.name)
+            if not os.path.isdir(folder):
+                print(f"❌ Folder not found: {folder}")
+                sys.exit(1)
+            entry = archive.pack(folder)
+            print(f"✅ Archived {args.name}: {entry['files']} files → {entry['bundle']}")
+        elif args.command == "list":
+            entries = archive.entries(args.customer)
+            for name, entry in entries.items():
+                print(f"  {entry.get('last_activity') or '----------'}  {name:<50} {entry['files']:>4} files  "
+                      f"{entry['bundle_bytes'] / 1024:>8.0f} KB")
+            print(f"{len(entries)} archived folders")
+        elif args.command == "ls":
+            for item in archive.manifest(args.name)["files"]:
+                print(f"  {item['size']:>10}  {item['path']}")
+        elif args.command == "cat":
+            data = archive.read(args.name, args.path)
+            if args.output:
+                with open(args.output, "wb") as f:
+                    f.write(data)
+                print(f"✅ Wrote {args.output} ({len(data)} bytes)")
+            else:
+                sys.stdout.buffer.write(data)
+        elif args.command == "verify":
+            manifest = archive.verify(args.name)
+            print(f"✅ {args.name}: {len(manifest['files'])} files match the manifest")
+        elif args.command == "restore":
+            target = archive.restore(args.name, args.to, keep_bundle=not args.delete_bundle)
+            print(f"✅ Restored {target}")
+    except ArchiveError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
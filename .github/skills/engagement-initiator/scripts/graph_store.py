@@ -0,0 +1,706 @@
+#!/usr/bin/env python3
+"""
+Embedded SQLite knowledge graph for engagement history.
+
+Implements the Customer / Engagement / Topic / Pattern schema from
+references/knowledge_graph_guide.md in a local SQLite file, so the questions
+the guide asks ("engagements with DoD customers scoring above 7", "topics that
+work for Discovery sessions") are indexed queries instead of a scan of the
+memory graph.
+
+Entities keep the memory server's shape (name, entityType, observations) plus
+typed properties. "Key: value" observations such as "Industry: Government" or
+"Success score: 8" become properties, and properties passed explicitly are
+written back as observations, so import and export round-trip with the
+memory format. Only schema properties are single-valued; repeated labels
+like "Effectiveness: 9" keep every observation. customer, industry,
+agency_type, engagement_type, date and success_score are stored in indexed
+columns.
+
+Usage:
+    from graph_store import GraphStore
+
+    with GraphStore() as graph:
+        graph.import_memory("memory.jsonl")
+        graph.upsert_entities([{"name": "FBI", "entityType": "Customer",
+                                "properties": {"agency_type": "Law Enforcement"}}])
+        graph.find_engagements(agency_type="DoD", min_score=7)
+
+Command line:
+    python scripts/graph_store.py import memory.jsonl
+    python scripts/graph_store.py export memory.jsonl
+    python scripts/graph_store.py engagements --agency-type DoD --min-score 7
+    python scripts/graph_store.py topics --engagement-type Discovery --min-score 7
+    python scripts/graph_store.py neighbors "FBI" --depth 2
+    python scripts/graph_store.py bench --customers 150 --engagements 1000
+
+The database defaults to ~/.copilot-skills/knowledge_graph.db (override with
+--db or SKILLS_GRAPH_DB). Keep it out of the OneDrive-synced engagements
+folder: sync clients and SQLite journals do not mix.
+"""
+
+import json
+import os
+import re
+import sqlite3
+
+DEFAULT_DB_PATH = os.environ.get(
+    "SKILLS_GRAPH_DB", os.path.join(os.path.expanduser("~"), ".copilot-skills", "knowledge_graph.db")
+)
+
+# Properties mirrored into indexed columns
+INDEXED_PROPERTIES = ("customer", "industry", "agency_type", "engagement_type", "date", "success_score")
+
+# Properties holding lists ("Solution areas: AI, Security" <-> ["AI", "Security"])
+LIST_PROPERTIES = {
+    "solution_areas", "hub_priorities", "topics_covered", "effectiveness",
+    "prerequisites", "related_technologies", "examples",
+}
+NUMERIC_PROPERTIES = {"success_score", "success_rate"}
+
+# Schema properties with one current value: a new "Success score: 8" replaces
+# the old observation. Other "Key: value" observations ("Effectiveness: 9",
+# "What didn't work: ...") accumulate like plain observations.
+SINGLE_VALUED_PROPERTIES = set(INDEXED_PROPERTIES) | {
+    "solution_areas", "hub_priorities", "topics_covered", "duration",
+    "description", "typical_duration", "success_rate",
+}
+
+# Observation labels used by the skills that name a schema property differently
+PROPERTY_ALIASES = {
+    "customer_type": "agency_type",
+    "type": "engagement_type",
+    "score": "success_score",
+}
+
+# "Key: value" with a short label; longer prose containing a colon stays a plain observation
+_OBSERVATION_PROPERTY = re.compile(r"^\s*([A-Za-z][A-Za-z _/'’-]{0,40}?)\s*:\s*(.+?)\s*$")
+_MAX_LABEL_WORDS = 4
+# SQLite's default limit on host parameters is 999 in older builds
+_BATCH = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    type TEXT NOT NULL,
+    properties TEXT NOT NULL DEFAULT '{}',
+    observations TEXT NOT NULL DEFAULT '[]',
+    customer TEXT,
+    industry TEXT,
+    agency_type TEXT,
+    engagement_type TEXT,
+    date TEXT,
+    success_score REAL
+);
+CREATE INDEX IF NOT EXISTS entities_type ON entities (type);
+CREATE INDEX IF NOT EXISTS entities_customer ON entities (customer, date);
+CREATE INDEX IF NOT EXISTS entities_industry ON entities (industry);
+CREATE INDEX IF NOT EXISTS entities_agency_type ON entities (agency_type);
+CREATE INDEX IF NOT EXISTS entities_engagement_type ON entities (engagement_type, success_score);
+CREATE INDEX IF NOT EXISTS entities_score ON entities (type, success_score);
+
+CREATE TABLE IF NOT EXISTS relations (
+    source INTEGER NOT NULL REFERENCES entities (id) ON DELETE CASCADE,
+    type TEXT NOT NULL,
+    target INTEGER NOT NULL REFERENCES entities (id) ON DELETE CASCADE,
+    PRIMARY KEY (source, type, target)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS relations_target ON relations (target, type, source);
+"""
+
+
+def _property_key(label):
+    key = re.sub(r"[\s/-]+", "_", re.sub(r"['’]", "", label.strip().lower()))
+    return PROPERTY_ALIASES.get(key, key)
+
+
+def _property_label(key):
+    return key.replace("_", " ").capitalize()
+
+
+def _parse_value(key, text):
+    if key in LIST_PROPERTIES:
+        return [part.strip() for part in text.split(",") if part.strip()]
+    if key in NUMERIC_PROPERTIES:
+        try:
+            return float(text.split("/")[0])  # "8" or "8/10"
+        except ValueError:
+            return text
+    return text
+
+
+def _format_value(value):
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def parse_observation(observation):
+    """Return (property, value) for a "Key: value" observation, else None."""
+    match = _OBSERVATION_PROPERTY.match(observation)
+    if not match or len(match.group(1).split()) > _MAX_LABEL_WORDS:
+        return None
+    key = _property_key(match.group(1))
+    return key, _parse_value(key, match.group(2))
+
+
+def _merge(properties, observations, new_observations=(), new_properties=None):
+    """
+    Merge observations and properties into an entity, in place.
+
+    An observation for a single-valued schema property replaces the earlier
+    one for the same property (a new "Success score" supersedes the old).
+    Every other observation is appended once, unchanged; repeated list
+    properties such as "Effectiveness" collect all their values.
+    """
+    by_key = {}
+    for index, observation in enumerate(observations):
+        parsed = parse_observation(observation)
+        if parsed and parsed[0] in SINGLE_VALUED_PROPERTIES:
+            by_key[parsed[0]] = index
+
+    def put(key, value, line):
+        if key in SINGLE_VALUED_PROPERTIES:
+            properties[key] = value
+            if key in by_key:
+                observations[by_key[key]] = line
+            else:
+                by_key[key] = len(observations)
+                observations.append(line)
+            return
+        if line in observations:
+            return
+        if key in LIST_PROPERTIES and isinstance(properties.get(key), list):
+            properties[key] = properties[key] + [v for v in value if v not in properties[key]]
+        else:
+            properties[key] = value
+        observations.append(line)
+
+    for observation in new_observations:
+        parsed = parse_observation(observation)
+        if parsed:
+            put(parsed[0], parsed[1], observation)
+        elif observation not in observations:
+            observations.append(observation)
+    for key, value in (new_properties or {}).items():
+        if value is None:
+            continue
+        put(key, value, f"{_property_label(key)}: {_format_value(value)}")
+
+
+def _indexed_values(properties):
+    values = []
+    for key in INDEXED_PROPERTIES:
+        value = properties.get(key)
+        if key == "success_score":
+            value = value if isinstance(value, (int, float)) else None
+        elif isinstance(value, (list, dict)):
+            value = None
+        values.append(value)
+    return values
+
+
+def _chunks(items, size=_BATCH):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class GraphStore:
+    """SQLite-backed knowledge graph. Use as a context manager or call close()."""
+
+    def __init__(self, path=None):
+        path = path or DEFAULT_DB_PATH
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # --- Writes -----------------------------------------------------------
+
+    def _existing(self, names):
+        rows = {}
+        for chunk in _chunks(names):
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.conn.execute(
+                f"SELECT name, type, properties, observations FROM entities WHERE name IN ({placeholders})",
+                chunk,
+            ):
+                rows[row["name"]] = row
+        return rows
+
+    def _ids(self, names):
+        ids = {}
+        for chunk in _chunks(names):
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.conn.execute(
+                f"SELECT name, id FROM entities WHERE name IN ({placeholders})", chunk
+            ):
+                ids[row["name"]] = row["id"]
+        return ids
+
+    def upsert_entities(self, entities):
+        """
+        Insert or merge entities in one transaction.
+
+        Each entity is a dict with name, entityType (or type), and optional
+        observations (list of strings) and properties (dict). Merging keeps
+        existing observations, replaces "Key: value" observations for the same
+        key and updates properties.
+
+        Returns:
+            Number of entities written
+        """
+        merged = {}
+        for entity in entities:
+            name = entity["name"]
+            current = merged.get(name)
+            if current is None:
+                current = merged[name] = {
+                    "type": entity.get("entityType") or entity.get("type"),
+                    "properties": {},
+                    "observations": [],
+                }
+            elif entity.get("entityType") or entity.get("type"):
+                current["type"] = entity.get("entityType") or entity.get("type")
+            _merge(current["properties"], current["observations"],
+                   entity.get("observations", ()), entity.get("properties"))
+
+        with self.conn:
+            existing = self._existing(merged)
+            rows = []
+            for name, entity in merged.items():
+                row = existing.get(name)
+                if row is not None:
+                    properties = json.loads(row["properties"])
+                    observations = json.loads(row["observations"])
+                    _merge(properties, observations, entity["observations"], entity["properties"])
+                    entity_type = entity["type"] or row["type"]
+                else:
+                    properties, observations = entity["properties"], entity["observations"]
+                    entity_type = entity["type"]
+                if not entity_type:
+                    raise ValueError(f"Entity {name!r} has no entityType")
+                rows.append([name, entity_type, json.dumps(properties), json.dumps(observations)]
+                            + _indexed_values(properties))
+            self.conn.executemany(
+                """
+                INSERT INTO entities (name, type, properties, observations, customer, industry,
+                                      agency_type, engagement_type, date, success_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET
+                    type = excluded.type, properties = excluded.properties,
+                    observations = excluded.observations,
+                    customer = COALESCE(excluded.customer, entities.customer),
+                    industry = excluded.industry, agency_type = excluded.agency_type,
+                    engagement_type = excluded.engagement_type, date = excluded.date,
+                    success_score = excluded.success_score
+                """,
+                rows,
+            )
+        return len(rows)
+
+    def add_observations(self, name, observations):
+        """Append observations to one existing entity (memory:add_observations)."""
+        if not self.get(name):
+            raise KeyError(f"Unknown entity: {name}")
+        self.upsert_entities([{"name": name, "observations": list(observations)}])
+
+    def upsert_relations(self, relations):
+        """
+        Insert relations ({from, to, relationType}) in one transaction.
+
+        Relations whose endpoints do not exist are skipped. A conducted_for
+        relation also records the customer on the engagement for indexed lookups.
+
+        Returns:
+            (inserted, skipped) counts
+        """
+        relations = [(r["from"], r["relationType"], r["to"]) for r in relations]
+        with self.conn:
+            ids = self._ids({name for source, _, target in relations for name in (source, target)})
+            rows = [(ids[s], t, ids[d]) for s, t, d in relations if s in ids and d in ids]
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO relations (source, type, target) VALUES (?, ?, ?)", rows
+            )
+            inserted = self.conn.total_changes - before
+            self.conn.executemany(
+                "UPDATE entities SET customer = (SELECT name FROM entities WHERE id = ?) "
+                "WHERE id = ? AND customer IS NULL",
+                [(target, source) for source, rel_type, target in rows if rel_type == "conducted_for"],
+            )
+        return inserted, len(relations) - len(rows)
+
+    def delete_entities(self, names):
+        """Delete entities and their relations."""
+        with self.conn:
+            for chunk in _chunks(names):
+                placeholders = ",".join("?" * len(chunk))
+                self.conn.execute(f"DELETE FROM entities WHERE name IN ({placeholders})", chunk)
+
+    # --- Reads ------------------------------------------------------------
+
+    @staticmethod
+    def _entity(row):
+        return {
+            "name": row["name"],
+            "entityType": row["type"],
+            "properties": json.loads(row["properties"]),
+            "observations": json.loads(row["observations"]),
+        }
+
+    def get(self, name):
+        row = self.conn.execute("SELECT * FROM entities WHERE name = ?", (name,)).fetchone()
+        return self._entity(row) if row else None
+
+    def find_entities(self, entity_type=None, **filters):
+        """
+        Entities matching equality filters on indexed columns.
+
+        Example: find_entities("Customer", agency_type="DoD")
+        """
+        clauses, params = [], []
+        if entity_type:
+            clauses.append("type = ?")
+            params.append(entity_type)
+        for key, value in filters.items():
+            if key not in INDEXED_PROPERTIES:
+                raise ValueError(f"{key!r} is not indexed (one of: {', '.join(INDEXED_PROPERTIES)})")
+            clauses.append(f"{key} = ?")
+            params.append(value)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        rows = self.conn.execute(f"SELECT * FROM entities{where} ORDER BY name", params)
+        return [self._entity(row) for row in rows]
+
+    def _engagement_filter(self, customer=None, industry=None, agency_type=None, engagement_type=None,
+                           min_score=None, since=None, until=None, solution_area=None):
+        clauses, params = ["e.type = 'Engagement'"], []
+        for column, value in (("e.customer", customer), ("c.industry", industry),
+                              ("c.agency_type", agency_type), ("e.engagement_type", engagement_type)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if min_score is not None:
+            clauses.append("e.success_score > ?")
+            params.append(min_score)
+        if since:
+            clauses.append("e.date >= ?")
+            params.append(since)
+        if until:
+            clauses.append("e.date <= ?")
+            params.append(until)
+        if solution_area:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM json_each(c.properties, '$.solution_areas') WHERE value = ?)"
+            )
+            params.append(solution_area)
+        return " AND ".join(clauses), params
+
+    def find_engagements(self, customer=None, industry=None, agency_type=None, engagement_type=None,
+                         min_score=None, since=None, until=None, solution_area=None, limit=None):
+        """
+        Engagements filtered on their own and their customer's attributes.
+
+        Args:
+            customer: Customer name
+            industry, agency_type, solution_area: Customer attributes
+            engagement_type: Engagement attribute
+            min_score: Only engagements with success_score above this
+            since, until: Date range (YYYY-MM-DD, inclusive)
+            limit: Maximum rows
+
+        Returns:
+            Engagement entities, best scoring first
+        """
+        where, params = self._engagement_filter(customer, industry, agency_type, engagement_type,
+                                                min_score, since, until, solution_area)
+        sql = (
+            "SELECT e.* FROM entities e "
+            "LEFT JOIN entities c ON c.name = e.customer AND c.type = 'Customer' "
+            f"WHERE {where} ORDER BY e.success_score DESC, e.date DESC"
+        )
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._entity(row) for row in self.conn.execute(sql, params)]
+
+    def topics_for(self, relation_type="covered_topic", limit=None, **engagement_filters):
+        """
+        Topics covered by matching engagements, most frequent first.
+
+        Takes the same filters as find_engagements().
+
+        Returns:
+            List of {"topic", "engagements", "avg_score"} dicts
+        """
+        where, params = self._engagement_filter(**engagement_filters)
+        sql = (
+            "SELECT t.name AS topic, COUNT(*) AS engagements, AVG(e.success_score) AS avg_score "
+            "FROM entities e "
+            "LEFT JOIN entities c ON c.name = e.customer AND c.type = 'Customer' "
+            "JOIN relations r ON r.source = e.id AND r.type = ? "
+            "JOIN entities t ON t.id = r.target "
+            f"WHERE {where} GROUP BY t.id ORDER BY engagements DESC, avg_score DESC"
+        )
+        params = [relation_type] + params
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def neighbors(self, name, relation_type=None, direction="both"):
+        """
+        Directly related entities.
+
+        Returns:
+            List of (relationType, direction, entity) with direction "out" or "in"
+        """
+        results = []
+        queries = []
+        if direction in ("out", "both"):
+            queries.append(("out", "r.source", "r.target"))
+        if direction in ("in", "both"):
+            queries.append(("in", "r.target", "r.source"))
+        for label, this_end, other_end in queries:
+            sql = (
+                f"SELECT r.type AS rel, o.* FROM entities s JOIN relations r ON {this_end} = s.id "
+                f"JOIN entities o ON o.id = {other_end} WHERE s.name = ?"
+            )
+            params = [name]
+            if relation_type:
+                sql += " AND r.type = ?"
+                params.append(relation_type)
+            for row in self.conn.execute(sql, params):
+                results.append((row["rel"], label, self._entity(row)))
+        return results
+
+    def traverse(self, name, max_depth=2, relation_types=None):
+        """
+        Entities reachable from name within max_depth hops (either direction).
+
+        Returns:
+            List of (depth, entity), nearest first
+        """
+        type_filter, params = "", [name]
+        if relation_types:
+            type_filter = f"AND r.type IN ({','.join('?' * len(relation_types))})"
+        sql = f"""
+            WITH RECURSIVE edges (a, b, type) AS (
+                SELECT source, target, type FROM relations
+                UNION ALL SELECT target, source, type FROM relations
+            ),
+            walk (id, depth) AS (
+                SELECT id, 0 FROM entities WHERE name = ?
+                UNION
+                SELECT r.b, w.depth + 1 FROM walk w JOIN edges r ON r.a = w.id
+                WHERE w.depth < ? {type_filter}
+            )
+            SELECT e.*, MIN(w.depth) AS depth FROM walk w JOIN entities e ON e.id = w.id
+            WHERE w.depth > 0 GROUP BY e.id ORDER BY depth, e.name
+        """
+        params.append(max_depth)
+        params.extend(relation_types or ())
+        return [(row["depth"], self._entity(row)) for row in self.conn.execute(sql, params)]
+
+    # --- Memory format ----------------------------------------------------
+
+    def import_memory(self, source):
+        """
+        Load a memory graph: a read_graph JSON document ({"entities", "relations"}),
+        the memory server's JSONL file, or a dict of that shape.
+
+        Returns:
+            (entities, relations) written
+        """
+        if isinstance(source, dict):
+            graph = source
+        else:
+            with open(source, "r", encoding="utf-8") as f:
+                text = f.read()
+            try:
+                graph = json.loads(text)
+            except json.JSONDecodeError:
+                graph = None
+            if not isinstance(graph, dict) or not ({"entities", "relations"} & graph.keys()):
+                graph = {"entities": [], "relations": []}
+                for line in text.splitlines():
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    key = "relations" if record.get("type") == "relation" else "entities"
+                    graph[key].append(record)
+        entities = self.upsert_entities(graph.get("entities", []))
+        relations, _ = self.upsert_relations(graph.get("relations", []))
+        return entities, relations
+
+    def export_memory(self, dest=None, fmt="jsonl"):
+        """
+        Export in the memory server's format.
+
+        Args:
+            dest: File path, or None to return the graph as a dict
+            fmt: "jsonl" (memory server file) or "json" (read_graph shape)
+        """
+        entities = [
+            {"name": row["name"], "entityType": row["type"], "observations": json.loads(row["observations"])}
+            for row in self.conn.execute("SELECT name, type, observations FROM entities ORDER BY id")
+        ]
+        relations = [
+            {"from": row["source"], "to": row["target"], "relationType": row["type"]}
+            for row in self.conn.execute(
+                "SELECT s.name AS source, r.type, t.name AS target FROM relations r "
+                "JOIN entities s ON s.id = r.source JOIN entities t ON t.id = r.target "
+                "ORDER BY s.id, r.type, t.id"
+            )
+        ]
+        graph = {"entities": entities, "relations": relations}
+        if dest is None:
+            return graph
+        with open(dest, "w", encoding="utf-8") as f:
+            if fmt == "json":
+                json.dump(graph, f, indent=2, ensure_ascii=False)
+            else:
+                for entity in entities:
+                    f.write(json.dumps({"type": "entity", **entity}, ensure_ascii=False) + "\n")
+                for relation in relations:
+                    f.write(json.dumps({"type": "relation", **relation}, ensure_ascii=False) + "\n")
+        return dest
+
+    def stats(self):
+        counts = dict(self.conn.execute("SELECT type, COUNT(*) FROM entities GROUP BY type").fetchall())
+        counts["relations"] = self.conn.execute("SELECT COUNT(*) FROM relations").fetchone()[0]
+        return counts
+
+
+def _synthetic_history(customers, engagements, topics_per_engagement=6):
+    """A year of made-up history in memory format, for benchmarking bulk loads."""
+    import random
+
+    rng = random.Random(7)
+    agency_types = ["Civilian", "DoD", "Intelligence", "Contractor", "Law Enforcement"]
+    industries = ["Government", "Financial Services", "Healthcare", "Manufacturing"]
+    engagement_types = ["Discovery", "Architecture", "POC", "Executive", "Deep Dive"]
+    topics = [f"Topic {i}" for i in range(300)]
+    entities, relations = [], []
+    for i in range(customers):
+        entities.append({"name": f"Customer {i}", "entityType": "Customer", "observations": [
+            f"Industry: {rng.choice(industries)}",
+            f"Agency type: {rng.choice(agency_types)}",
+            "Solution areas: " + ", ".join(rng.sample(["AI", "Security", "Cloud", "Data"], 2)),
+        ]})
+    for topic in topics:
+        entities.append({"name": topic, "entityType": "Topic", "observations": ["Typical duration: 45min"]})
+    for i in range(engagements):
+        customer = f"Customer {rng.randrange(customers)}"
+        name = f"{customer} Engagement - 2025-{1 + i % 12:02d}-{1 + i % 28:02d} #{i}"
+        entities.append({"name": name, "entityType": "Engagement", "observations": [
+            f"Date: 2025-{1 + i % 12:02d}-{1 + i % 28:02d}",
+            f"Engagement type: {rng.choice(engagement_types)}",
+            f"Success score: {rng.randint(3, 10)}",
+            "What worked well: customer-led discovery, early demo",
+        ]})
+        relations.append({"from": name, "to": customer, "relationType": "conducted_for"})
+        for topic in rng.sample(topics, topics_per_engagement):
+            relations.append({"from": name, "to": topic, "relationType": "covered_topic"})
+    return {"entities": entities, "relations": relations}
+
+
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+    import time
+
+    parser = argparse.ArgumentParser(description="Local knowledge graph store")
+    parser.add_argument("--db", default=None, help=f"Database path (default: {DEFAULT_DB_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("import", help="Load memory JSON/JSONL")
+    p.add_argument("file")
+    p = sub.add_parser("export", help="Write memory JSONL (or JSON with --format json)")
+    p.add_argument("file")
+    p.add_argument("--format", choices=["jsonl", "json"], default="jsonl")
+    for command in ("engagements", "topics"):
+        p = sub.add_parser(command, help=f"Query {command} by customer/engagement attributes")
+        p.add_argument("--customer")
+        p.add_argument("--industry")
+        p.add_argument("--agency-type")
+        p.add_argument("--engagement-type")
+        p.add_argument("--solution-area")
+        p.add_argument("--min-score", type=float)
+        p.add_argument("--since")
+        p.add_argument("--until")
+        p.add_argument("--limit", type=int, default=20)
+    p = sub.add_parser("neighbors", help="Entities related to NAME")
+    p.add_argument("name")
+    p.add_argument("--depth", type=int, default=1)
+    sub.add_parser("stats", help="Entity and relation counts")
+    p = sub.add_parser("bench", help="Bulk-load synthetic history into a temporary database")
+    p.add_argument("--customers", type=int, default=150)
+    p.add_argument("--engagements", type=int, default=1000)
+
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        graph_data = _synthetic_history(args.customers, args.engagements)
+        with tempfile.TemporaryDirectory() as tmp, GraphStore(os.path.join(tmp, "bench.db")) as graph:
+            start = time.perf_counter()
+            graph.import_memory(graph_data)
+            load = time.perf_counter() - start
+            start = time.perf_counter()
+            rows = graph.find_engagements(agency_type="DoD", min_score=7)
+            query = time.perf_counter() - start
+            start = time.perf_counter()
+            topics = graph.topics_for(agency_type="DoD", min_score=7, limit=10)
+            topic_query = time.perf_counter() - start
+            print(f"Loaded {len(graph_data['entities'])} entities, {len(graph_data['relations'])} relations "
+                  f"in {load:.2f}s")
+            print(f"DoD engagements scoring > 7: {len(rows)} in {query * 1000:.1f} ms")
+            print(f"Top topics for them: {len(topics)} in {topic_query * 1000:.1f} ms")
+        raise SystemExit(0)
+
+    with GraphStore(args.db) as graph:
+        if args.command == "import":
+            entities, relations = graph.import_memory(args.file)
+            print(f"✅ Imported {entities} entities, {relations} relations into {graph.path}")
+        elif args.command == "export":
+            graph.export_memory(args.file, args.format)
+            print(f"✅ Exported to {args.file}")
+        elif args.command == "stats":
+            for key, value in graph.stats().items():
+                print(f"{key}: {value}")
+        elif args.command == "neighbors":
+            for depth, entity in graph.traverse(args.name, args.depth):
+                print(f"{'  ' * (depth - 1)}{entity['entityType']}: {entity['name']}")
+        else:
+            filters = dict(
+                customer=args.customer, industry=args.industry, agency_type=args.agency_type,
+                engagement_type=args.engagement_type, min_score=args.min_score, since=args.since,
+                until=args.until, solution_area=args.solution_area,
+            )
+            if args.command == "engagements":
+                for entity in graph.find_engagements(limit=args.limit, **filters):
+                    props = entity["properties"]
+                    print(f"{props.get('date', '?'):<10}  {_format_value(props.get('success_score', '-')):>3}  "
+                          f"{props.get('engagement_type', '-'):<12}  {entity['name']}")
+            else:
+                for row in graph.topics_for(limit=args.limit, **filters):
+                    print(f"{row['engagements']:>4}  avg {row['avg_score'] or 0:.1f}  {row['topic']}")
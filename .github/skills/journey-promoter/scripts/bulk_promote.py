@@ -0,0 +1,510 @@
+"""
+Batch journey promotion with a write-ahead journal.
+
+Promotes many engagement folders in one run. The plan is built up front:
+dated folders ({Customer}-{YYYY-MM-DD}) are grouped by the journey they
+become: the customer's existing {Customer}-{Year}-Customer-Journey folder
+whatever its year, or a new one named for the year of the first engagement.
+Each group is a list of steps:
+
+    rename     first folder → journey folder (or merge into an existing journey)
+    merge      move a later folder's files into the journey; name clashes get
+               the session date appended (README_2026-02-10.md)
+    metadata   write the migrated engagement_metadata.json (sessions[],
+               milestones[], journey_health), or log new sessions when the
+               journey already has a session log
+    log        start the journey session log (journey_log.py)
+    readme     render the journey README, keeping the old README under Notes;
+               an already rendered or existing journey README only gets its
+               Sessions Timeline table updated
+
+Groups touch disjoint folders, so they run in parallel. Every step is
+journaled ("begin" then "done", fsynced) before and after it runs, and every
+step is idempotent, so `resume` replays an interrupted run: done steps are
+skipped, a step that began but never finished is simply run again.
+
+Usage:
+    python scripts/bulk_promote.py run --all --dry-run
+    python scripts/bulk_promote.py run --customer "Keller Group" --customer "Booz Allen"
+    python scripts/bulk_promote.py resume ~/.copilot-skills/migrations/<plan>.jsonl
+    python scripts/bulk_promote.py status ~/.copilot-skills/migrations/<plan>.jsonl
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_SHARED = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "_shared"))
+if _SHARED not in sys.path:
+    sys.path.insert(0, _SHARED)
+
+from skillkit.atomic import write_json, write_text
+from skillkit.config import load_base_path
+
+from journey_log import LOG_NAME, METADATA_NAME, JourneyLog, assign_session_ids
+
+JOURNAL_DIR = os.environ.get(
+    "SKILLS_MIGRATION_DIR", os.path.join(os.path.expanduser("~"), ".copilot-skills", "migrations")
+)
+DEFAULT_WORKERS = 8
+
+_DATED = re.compile(r"^(?P<customer>.+)-(?P<date>\d{4}-\d{2}-\d{2})$")
+_JOURNEY = re.compile(r"^(?P<customer>.+)-(?P<year>\d{4})-Customer-Journey$")
+_SUMMARY_PATTERNS = ("engagement_summary_{date}.md", "closeout_summary_{date}.md")
+
+
+def _read_json(path):
+    if not os.path.isfile(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# --- Planning -------------------------------------------------------------
+
+def plan_promotions(base_path, customers=None, today=None):
+    """
+    Plan promotion of dated engagement folders.
+
+    Args:
+        base_path: Engagements folder
+        customers: Names to promote (matched against folder names, spaces as
+                   hyphens); None promotes every dated folder
+        today: YYYY-MM-DD used for promoted_to_journey (new journeys) and session status
+
+    Returns:
+        Plan dict: base, today, groups (each with journey, customer and steps)
+    """
+    today = today or datetime.date.today().isoformat()
+    needles = [re.sub(r"[\s_]+", "-", c.strip()).lower() for c in customers] if customers else None
+    dated, journeys = {}, {}
+    for entry in sorted(os.scandir(base_path), key=lambda e: e.name):
+        if not entry.is_dir():
+            continue
+        journey = _JOURNEY.match(entry.name)
+        if journey:
+            # Sorted by name, so a customer's latest journey wins
+            journeys[journey.group("customer")] = entry.name
+            continue
+        match = _DATED.match(entry.name)
+        if not match or (needles and not any(n in entry.name.lower() for n in needles)):
+            continue
+        dated.setdefault(match.group("customer"), []).append((match.group("date"), entry.name))
+
+    groups = []
+    for customer, folders in sorted(dated.items()):
+        folders.sort()
+        existing = customer in journeys
+        journey = journeys[customer] if existing else f"{customer}-{folders[0][0][:4]}-Customer-Journey"
+        sources = []
+        for date, name in folders:
+            folder = os.path.join(base_path, name)
+            sources.append({
+                "folder": name,
+                "date": date,
+                "metadata": _read_json(os.path.join(folder, METADATA_NAME)) or {},
+                "files": sorted(os.listdir(folder)),
+                "bytes": sum(e.stat().st_size for e in os.scandir(folder) if e.is_file()),
+            })
+        primary = _read_json(os.path.join(base_path, journey, METADATA_NAME)) if existing else None
+        steps = []
+        first, rest = (None, sources) if existing else (sources[0], sources[1:])
+        if first:
+            steps.append({"op": "rename", "src": first["folder"], "dst": journey})
+        steps += [{"op": "merge", "src": s["folder"], "dst": journey, "date": s["date"]} for s in rest]
+        steps += [{"op": "metadata"}, {"op": "log"}, {"op": "readme"}]
+        groups.append({
+            "journey": journey,
+            "customer": (primary or sources[0]["metadata"]).get("customer") or customer.replace("-", " "),
+            "existing": existing,
+            "primary": primary,
+            "sources": sources,
+            "steps": steps,
+        })
+    return {"base": os.path.abspath(base_path), "today": today, "groups": groups}
+
+
+def plan_id(plan):
+    digest = hashlib.sha256(json.dumps(plan, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+    return f"{plan['today']}-{digest}"
+
+
+# --- Content --------------------------------------------------------------
+
+def _summary_file(source):
+    return next((p.format(date=source["date"]) for p in _SUMMARY_PATTERNS
+                 if p.format(date=source["date"]) in source["files"]), None)
+
+
+def session_from_source(source, today):
+    metadata = source["metadata"]
+    session = {
+        "date": source["date"],
+        "type": metadata.get("engagement_type") or "Engagement",
+        "status": "completed" if source["date"] <= today else "scheduled",
+    }
+    if _summary_file(source):
+        session["summary_file"] = _summary_file(source)
+    outcomes = metadata.get("engagement_outcomes")
+    if isinstance(outcomes, list):
+        session["key_outcomes"] = outcomes
+    if isinstance(metadata.get("action_items"), list):
+        session["action_items_count"] = len(metadata["action_items"])
+    return session
+
+
+def migrate_metadata(group, today):
+    """Journey metadata for a group: the first folder's fields plus journey fields."""
+    metadata = dict(group["primary"] or group["sources"][0]["metadata"])
+    metadata.setdefault("customer", group["customer"])
+    metadata.setdefault("journey_status", "active")
+    if not group["existing"]:
+        metadata.setdefault("promoted_to_journey", today)
+    sessions = [dict(s) for s in metadata.get("sessions") or []]
+    known = {s.get("date") for s in sessions}
+    sessions += [session_from_source(s, today) for s in group["sources"] if s["date"] not in known]
+    assign_session_ids(sessions)
+    sessions.sort(key=lambda s: s.get("date") or "")
+    metadata["sessions"] = sessions
+    if "milestones" not in metadata:
+        types = [s.get("type") for s in sessions]
+        metadata["milestones"] = [
+            {"name": s["type"] if types.count(s.get("type")) == 1 else f"{s['type']} ({s['date']})",
+             "date": s["date"], "status": "completed" if s["status"] == "completed" else "scheduled", "notes": ""}
+            for s in sessions
+        ]
+    held = [s["date"] for s in sessions if s.get("status") == "completed"]
+    upcoming = [s["date"] for s in sessions if s.get("status") == "scheduled"]
+    health = dict(metadata.get("journey_health") or {})
+    health.setdefault("momentum", "steady")
+    health.setdefault("blockers", [])
+    if held:
+        health["last_customer_contact"] = max(held)
+        health["days_since_contact"] = (
+            datetime.date.fromisoformat(today) - datetime.date.fromisoformat(max(held))
+        ).days
+    if upcoming:
+        health["next_touchpoint"] = min(upcoming)
+    health.setdefault("open_action_items", sum(s.get("action_items_count", 0) for s in sessions))
+    metadata["journey_health"] = health
+    metadata["updated"] = today
+    return metadata
+
+
+def _sessions_table(sessions):
+    status_icons = {"completed": "✅ Completed", "scheduled": "📅 Scheduled", "cancelled": "❌ Cancelled"}
+    lines = ["| Date | Type | Status | Summary |", "|------|------|--------|---------|"]
+    for s in sessions:
+        summary = f"[Summary]({s['summary_file']})" if s.get("summary_file") else (
+            "Upcoming" if s.get("status") == "scheduled" else "-")
+        lines.append(f"| {s['date']} | {s.get('type', '')} | {status_icons.get(s.get('status'), s.get('status', ''))} "
+                     f"| {summary} |")
+    return lines
+
+
+def update_sessions_timeline(readme, metadata):
+    """A journey README with its Sessions Timeline table redrawn from metadata (appended if missing)."""
+    table = "\n".join(_sessions_table(metadata.get("sessions", [])))
+    section = re.search(r"^## Sessions Timeline[ \t]*\n(?:[ \t]*\n)*((?:\|.*(?:\n|$))*)", readme, re.MULTILINE)
+    if not section:
+        return f"{readme.rstrip()}\n\n---\n\n## Sessions Timeline\n\n{table}\n"
+    old_table = section.group(1)
+    ending = "\n" if old_table.endswith("\n") or not old_table else ""
+    return readme[:section.start(1)] + table + ending + readme[section.end(1):]
+
+
+def render_readme(metadata, files, previous=None):
+    """Journey README (journey_readme_template.md layout) from migrated metadata."""
+    sessions = metadata.get("sessions", [])
+    health = metadata.get("journey_health", {})
+    lines = [
+        f"# {metadata.get('customer')} - Customer Journey",
+        "",
+        "**Status:** 🟢 Active  ",
+        f"**Journey Type:** {metadata.get('engagement_type', 'Customer Journey')}  ",
+        f"**Lead:** {metadata.get('lead_architect', 'TBD')}  ",
+        f"**Started:** {sessions[0]['date'] if sessions else 'TBD'}",
+        "",
+        "---",
+        "",
+        "## Sessions Timeline",
+        "",
+        *_sessions_table(sessions),
+        "",
+        "---",
+        "",
+        "## Current Status",
+        "",
+        f"**Next Touchpoint:** {health.get('next_touchpoint', 'TBD')}  ",
+        f"**Momentum:** {health.get('momentum', 'steady').title()}  ",
+        f"**Days Since Contact:** {health.get('days_since_contact', 'N/A')}",
+        "",
+        "---",
+        "",
+        "## Milestones",
+        "",
+    ]
+    for m in metadata.get("milestones", []):
+        done = m.get("status") == "completed"
+        lines.append(f"- [{'x' if done else ' '}] **{m.get('name')}** - {m.get('date') or 'TBD'} {'✅' if done else '📅'}")
+    lines += ["", "---", "", "## Files", "", "| File | Description |", "|------|-------------|"]
+    descriptions = {METADATA_NAME: "Journey tracking and metadata", LOG_NAME: "Journey session log"}
+    for name in sorted(files):
+        if name == "README.md":
+            continue
+        description = descriptions.get(name, "")
+        if name.startswith(("engagement_summary_", "closeout_summary_")):
+            description = "Session summary"
+        lines.append(f"| `{name}` | {description} |")
+    if previous:
+        # Keep the engagement README, one heading level down
+        body = re.sub(r"^(#+)", r"#\1", previous.strip(), flags=re.MULTILINE)
+        lines += ["", "---", "", "## Notes", "", "From the original engagement README:", "", body]
+    return "\n".join(lines) + "\n"
+
+
+def _clash_name(name, date):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}_{date}{ext}"
+
+
+# --- Execution ------------------------------------------------------------
+
+class Journal:
+    """Append-only, fsynced record of the plan and every step's begin/done."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, plan, directory=None):
+        directory = directory or JOURNAL_DIR
+        os.makedirs(directory, exist_ok=True)
+        journal = cls(os.path.join(directory, plan_id(plan) + ".jsonl"))
+        if not os.path.isfile(journal.path):
+            journal._write({"plan": plan, "created": datetime.datetime.now().isoformat(timespec="seconds")})
+        return journal
+
+    def _write(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def record(self, group, step, state, error=None):
+        entry = {"group": group, "step": step, "state": state,
+                 "ts": datetime.datetime.now().isoformat(timespec="seconds")}
+        if error:
+            entry["error"] = error
+        self._write(entry)
+
+    def load(self):
+        """(plan, set of done (group, step), {(group, step): error} of the last failures)."""
+        plan, done, failed = None, set(), {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break  # Torn final line from a crash; the step will be redone
+                record = json.loads(line)
+                if "plan" in record:
+                    plan = record["plan"]
+                    continue
+                key = (record["group"], record["step"])
+                if record["state"] == "done":
+                    done.add(key)
+                    failed.pop(key, None)
+                elif record["state"] == "failed":
+                    failed[key] = record.get("error")
+        return plan, done, failed
+
+
+def _run_step(plan, group, step):
+    base = plan["base"]
+    journey = os.path.join(base, group["journey"])
+    op = step["op"]
+    if op == "rename":
+        src = os.path.join(base, step["src"])
+        if os.path.isdir(journey) and not os.path.isdir(src):
+            return  # Renamed before an interruption
+        if os.path.exists(journey):
+            raise FileExistsError(f"{group['journey']} already exists")
+        os.rename(src, journey)
+    elif op == "merge":
+        src = os.path.join(base, step["src"])
+        if not os.path.isdir(src):
+            return  # Merged and removed before an interruption
+        for name in sorted(os.listdir(src)):
+            target = os.path.join(journey, name)
+            if os.path.exists(target):
+                target = os.path.join(journey, _clash_name(name, step["date"]))
+                if os.path.exists(target):
+                    raise FileExistsError(f"Cannot merge {step['src']}/{name}: {os.path.basename(target)} exists")
+            os.rename(os.path.join(src, name), target)
+        os.rmdir(src)
+    elif op == "metadata":
+        migrated = migrate_metadata(group, plan["today"])
+        if os.path.isfile(os.path.join(journey, LOG_NAME)):
+            log = JourneyLog(journey)
+            known = {s.get("date") for s in log.sessions()}
+            for session in migrated["sessions"]:
+                if session["date"] not in known:
+                    log.add_session(session)
+            log.write_metadata()
+        else:
+            write_json(os.path.join(journey, METADATA_NAME), migrated)
+    elif op == "log":
+        JourneyLog(journey).initialize()
+    elif op == "readme":
+        readme = os.path.join(journey, "README.md")
+        previous = None
+        if os.path.isfile(readme):
+            with open(readme, "r", encoding="utf-8") as f:
+                previous = f.read()
+        metadata = _read_json(os.path.join(journey, METADATA_NAME))
+        if previous is not None and (
+            group["existing"] or previous.startswith(f"# {group['customer']} - Customer Journey")
+        ):
+            # The journey's own README (or one rendered before an interruption): refresh its sessions
+            write_text(readme, update_sessions_timeline(previous, metadata))
+        else:
+            write_text(readme, render_readme(metadata, os.listdir(journey), previous))
+    else:
+        raise ValueError(f"Unknown step: {op}")
+
+
+def execute(journal, workers=DEFAULT_WORKERS, on_progress=None):
+    """
+    Run (or resume) the journaled plan; groups run in parallel, steps in order.
+
+    A failed step stops its group and is recorded; other groups carry on.
+    Returns {"done": n, "skipped": n, "failed": [(journey, op, error)]}.
+    """
+    plan, done, _ = journal.load()
+    counts = {"done": 0, "skipped": 0, "failed": []}
+    counts_lock = threading.Lock()
+
+    def run_group(index):
+        group = plan["groups"][index]
+        for step_index, step in enumerate(group["steps"]):
+            if (index, step_index) in done:
+                with counts_lock:
+                    counts["skipped"] += 1
+                continue
+            journal.record(index, step_index, "begin")
+            try:
+                _run_step(plan, group, step)
+            except (OSError, ValueError) as e:
+                journal.record(index, step_index, "failed", str(e))
+                with counts_lock:
+                    counts["failed"].append((group["journey"], step["op"], str(e)))
+                return
+            journal.record(index, step_index, "done")
+            with counts_lock:
+                counts["done"] += 1
+        if on_progress:
+            on_progress(group)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(run_group, range(len(plan["groups"]))))
+    return counts
+
+
+def estimate_io(plan):
+    """Folder renames, file moves and new file writes (with bytes) the plan will cause."""
+    estimate = {"groups": len(plan["groups"]), "renames": 0, "moves": 0, "moved_bytes": 0,
+                "writes": 0, "written_bytes": 0}
+    for group in plan["groups"]:
+        estimate["renames"] += sum(1 for s in group["steps"] if s["op"] == "rename")
+        for source in group["sources"][0 if group["existing"] else 1:]:
+            estimate["moves"] += len(source["files"])
+            estimate["moved_bytes"] += source["bytes"]
+        metadata = migrate_metadata(group, plan["today"])
+        size = len(json.dumps(metadata, indent=2, ensure_ascii=False).encode("utf-8")) + 1
+        estimate["writes"] += 3  # metadata, session log and README
+        estimate["written_bytes"] += size * 2
+        files = {f for s in group["sources"] for f in s["files"]}
+        estimate["written_bytes"] += len(render_readme(metadata, files).encode("utf-8"))
+    return estimate
+
+
+def print_plan(plan):
+    for group in plan["groups"]:
+        sessions = ", ".join(s["date"] for s in group["sources"])
+        action = "update existing" if group["existing"] else "create"
+        print(f"  {group['journey']}  ({action}; sessions {sessions})")
+        for step in group["steps"]:
+            if step["op"] == "rename":
+                print(f"      rename  {step['src']} → {step['dst']}")
+            elif step["op"] == "merge":
+                print(f"      merge   {step['src']}")
+    estimate = estimate_io(plan)
+    print(f"Estimated I/O: {estimate['renames']} folder renames, {estimate['moves']} file moves "
+          f"({estimate['moved_bytes'] / 1024:.0f} KB, metadata-only on one volume), "
+          f"{estimate['writes']} files written (~{estimate['written_bytes'] / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Promote many engagements to journeys, resumably")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("run", help="Plan and run promotions")
+    p.add_argument("--base", help="Engagements folder (default: engagements_base_path in config.json)")
+    selection = p.add_mutually_exclusive_group(required=True)
+    selection.add_argument("--customer", action="append", help="Customer to promote (repeatable)")
+    selection.add_argument("--all", action="store_true", help="Promote every dated engagement folder")
+    p.add_argument("--dry-run", action="store_true", help="Show the plan and estimated I/O only")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    p.add_argument("--journal-dir", help=f"Journal folder (default: {JOURNAL_DIR})")
+    p = sub.add_parser("resume", help="Finish an interrupted run")
+    p.add_argument("journal")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    p = sub.add_parser("status", help="Show a run's progress")
+    p.add_argument("journal")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        base = args.base or load_base_path()
+        if not base or not os.path.isdir(base):
+            print("❌ Engagements folder not found (use --base or set engagements_base_path in config.json)")
+            sys.exit(1)
+        plan = plan_promotions(base, None if args.all else args.customer)
+        if not plan["groups"]:
+            print("Nothing to promote")
+            sys.exit(0)
+        print(f"Plan: {len(plan['groups'])} journeys")
+        print_plan(plan)
+        if args.dry_run:
+            sys.exit(0)
+        journal = Journal.create(plan, args.journal_dir)
+        print(f"Journal: {journal.path}")
+    else:
+        journal = Journal(args.journal)
+        if not os.path.isfile(journal.path):
+            print(f"❌ Journal not found: {journal.path}")
+            sys.exit(1)
+
+    plan, done, failed = journal.load()
+    if args.command == "status":
+        total = sum(len(g["steps"]) for g in plan["groups"])
+        print(f"{len(done)}/{total} steps done, {len(failed)} failed")
+        for (group, step), error in sorted(failed.items()):
+            print(f"  ❌ {plan['groups'][group]['journey']} {plan['groups'][group]['steps'][step]['op']}: {error}")
+        sys.exit(0)
+
+    result = execute(journal, args.workers,
+                     on_progress=lambda group: print(f"  ✅ {group['journey']}"))
+    print(f"✅ {result['done']} steps done, {result['skipped']} already done")
+    for journey, op, error in result["failed"]:
+        print(f"  ❌ {journey} {op}: {error}")
+    if result["failed"]:
+        print(f"   Fix and rerun: python {sys.argv[0]} resume {journal.path}")
+        sys.exit(1)
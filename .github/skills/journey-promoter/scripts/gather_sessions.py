@@ -0,0 +1,246 @@
+"""
+Concurrent gather of every session's context for a journey promotion.
+
+Promotion needs, for each of a customer's sessions, the local metadata, any
+existing summary file and the WorkIQ summary of the meeting. Fetching them one
+by one makes a customer with ten sessions cost ten round trips; gather() reads
+all folders and queries all meetings at once, bounded by `concurrency`, with a
+per-request `timeout`, so the whole gather takes about as long as the slowest
+single fetch.
+
+Meeting answers go through the shared WorkIQ cache (skillkit.workiq), so
+sessions already closed out are not fetched again.
+
+Usage:
+    python scripts/gather_sessions.py "Keller Group"
+    python scripts/gather_sessions.py "Keller Group" --json context.json --timeout 20
+
+    # Offline, against a local stand-in service
+    python ../_shared/skillkit/workiq.py serve --stub fixtures/ --latency 1 &
+    WORKIQ_URL=http://127.0.0.1:8765/ python scripts/gather_sessions.py "Keller Group"
+"""
+
+import asyncio
+import datetime
+import json
+import os
+import re
+import sys
+import time
+
+_SHARED = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "_shared"))
+if _SHARED not in sys.path:
+    sys.path.insert(0, _SHARED)
+
+from skillkit.aio import BoundedExecutor
+from skillkit.config import load_base_path
+from skillkit.customers import CustomerIndex
+from skillkit.workiq import MeetingNotFound, WorkIQClient, WorkIQError
+
+from journey_log import LOG_NAME, JourneyLog
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_TIMEOUT = 30.0
+
+_FOLDER_DATE = re.compile(r"(\d{4}-\d{2}-\d{2})$")
+_SUMMARY_PATTERNS = ("engagement_summary_{date}.md", "closeout_summary_{date}.md")
+
+
+def find_customer_folders(base_path, customer):
+    """
+    Engagement and journey folders of a customer.
+
+    Folder names containing the customer (spaces as hyphens) win; otherwise
+    the fuzzy resolver is asked, so aliases and acronyms ("BAH") work too.
+    """
+    needle = re.sub(r"[\s_]+", "-", customer.strip()).lower()
+    folders = sorted(
+        entry.path for entry in os.scandir(base_path)
+        if entry.is_dir() and needle in entry.name.lower()
+    )
+    if not folders:
+        match = CustomerIndex(base_path).best(customer)
+        folders = match.folders if match else []
+    return folders
+
+
+def load_folder(folder):
+    """
+    Session records for one folder, from its metadata and summary files.
+
+    A journey folder yields one record per `sessions[]` entry; a single
+    engagement yields one record dated from its metadata or folder name.
+    """
+    metadata = {}
+    metadata_path = os.path.join(folder, "engagement_metadata.json")
+    if os.path.isfile(os.path.join(folder, LOG_NAME)):
+        # The session log is newer than a metadata file not yet regenerated from it
+        metadata = JourneyLog(folder).materialize()
+    elif os.path.isfile(metadata_path):
+        with open(metadata_path, "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+
+    if isinstance(metadata.get("sessions"), list):
+        entries = [dict(session) for session in metadata["sessions"]]
+    else:
+        match = _FOLDER_DATE.search(os.path.basename(folder))
+        entries = [{
+            "date": metadata.get("date") or (match.group(1) if match else None),
+            "type": metadata.get("engagement_type"),
+            "status": metadata.get("status"),
+        }]
+
+    records = []
+    for entry in entries:
+        date = entry.get("date")
+        summary_file = entry.get("summary_file")
+        if not summary_file and date:
+            summary_file = next(
+                (pattern.format(date=date) for pattern in _SUMMARY_PATTERNS
+                 if os.path.isfile(os.path.join(folder, pattern.format(date=date)))),
+                None,
+            )
+        summary = None
+        if summary_file and os.path.isfile(os.path.join(folder, summary_file)):
+            with open(os.path.join(folder, summary_file), "r", encoding="utf-8") as f:
+                summary = f.read()
+        records.append({
+            "folder": os.path.basename(folder),
+            "date": date,
+            "type": entry.get("type"),
+            "status": entry.get("status"),
+            "session": entry,
+            "summary_file": summary_file,
+            "summary": summary,
+            "meeting": None,
+            "meeting_status": "skipped",
+        })
+    return records
+
+
+def _has_meeting(record, today):
+    """Only held sessions have a meeting to ask WorkIQ about."""
+    if not record["date"] or record["status"] in ("cancelled", "scheduled"):
+        return False
+    return record["date"] <= today
+
+
+async def _fetch_meeting(executor, slots, client, customer, record, query, timeout):
+    try:
+        # The timeout covers the request itself, not the wait for a free slot
+        async with slots:
+            record["meeting"] = await asyncio.wait_for(
+                executor.run(client.query, customer, record["date"], query), timeout
+            )
+        record["meeting_status"] = "ok"
+    except asyncio.TimeoutError:
+        record["meeting_status"] = "timeout"
+    except MeetingNotFound:
+        record["meeting_status"] = "not_found"
+    except WorkIQError as e:
+        record["meeting_status"] = f"error: {e}"
+
+
+async def _gather_folder(executor, slots, client, customer, folder, query, timeout, today):
+    records = await executor.run(load_folder, folder)
+    await asyncio.gather(*(
+        _fetch_meeting(executor, slots, client, customer, record, query, timeout)
+        for record in records if _has_meeting(record, today)
+    ))
+    return records
+
+
+async def gather(customer, base_path, client=None, concurrency=DEFAULT_CONCURRENCY,
+                 timeout=DEFAULT_TIMEOUT, query="summary", today=None):
+    """
+    Gather session context for every folder of a customer concurrently.
+
+    Args:
+        customer: Customer name as used in folder names
+        base_path: Engagements folder
+        client: WorkIQClient (default: shared cache + default backend)
+        concurrency: Folder reads and meeting queries in flight at once
+        timeout: Seconds to wait for one meeting query; a timed-out session
+                 gets meeting_status "timeout" and the gather carries on
+        query: WorkIQ query per meeting (named query or free text)
+        today: YYYY-MM-DD; sessions after it are not queried (default: today)
+
+    Returns:
+        Dict with customer, folders, sessions (sorted by date, each with
+        session metadata, summary text, meeting text and meeting_status)
+        and elapsed seconds. A query that times out keeps its worker until
+        the backend returns; HttpBackend's own timeout bounds that.
+    """
+    client = client or WorkIQClient()
+    today = today or datetime.date.today().isoformat()
+    folders = find_customer_folders(base_path, customer)
+    executor = BoundedExecutor(concurrency, "thread")
+    slots = asyncio.Semaphore(concurrency)
+    started = time.perf_counter()
+    try:
+        per_folder = await asyncio.gather(*(
+            _gather_folder(executor, slots, client, customer, folder, query, timeout, today)
+            for folder in folders
+        ))
+    finally:
+        executor.shutdown(wait=False)
+    sessions = sorted((r for records in per_folder for r in records), key=lambda r: r["date"] or "")
+    return {
+        "customer": customer,
+        "folders": [os.path.basename(folder) for folder in folders],
+        "sessions": sessions,
+        "elapsed": round(time.perf_counter() - started, 3),
+    }
+
+
+def gather_sessions(customer, base_path, **options):
+    """Blocking wrapper around gather() for scripts without an event loop."""
+    return asyncio.run(gather(customer, base_path, **options))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from skillkit.workiq import HttpBackend, StubBackend, WorkIQCache
+
+    parser = argparse.ArgumentParser(description="Gather all session context for a journey promotion")
+    parser.add_argument("customer", help="Customer name as used in folder names")
+    parser.add_argument("--base", help="Engagements folder (default: engagements_base_path in config.json)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Seconds per meeting query")
+    parser.add_argument("--query", default="summary", help="WorkIQ query per meeting")
+    parser.add_argument("--stub", help="Answer meetings from this fixture folder")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub seconds per answer")
+    parser.add_argument("--no-cache", action="store_true", help="Skip the shared WorkIQ cache")
+    parser.add_argument("--json", help="Write the gathered context to this file")
+    args = parser.parse_args()
+
+    base = args.base or load_base_path()
+    if not base or not os.path.isdir(base):
+        print("❌ Engagements folder not found (use --base or set engagements_base_path in config.json)")
+        sys.exit(1)
+
+    if args.stub:
+        backend = StubBackend(args.stub, latency=args.latency)
+    elif os.environ.get("WORKIQ_URL"):
+        backend = HttpBackend(timeout=args.timeout)
+    else:
+        backend = None
+    cache = WorkIQCache(":memory:") if args.no_cache else None
+    result = gather_sessions(args.customer, base, client=WorkIQClient(backend, cache),
+                             concurrency=args.concurrency, timeout=args.timeout, query=args.query)
+
+    if not result["folders"]:
+        print(f"❌ No folders matching '{args.customer}' in {base}")
+        sys.exit(1)
+    for record in result["sessions"]:
+        summary = "summary" if record["summary"] else "no summary"
+        print(f"  {record['date'] or '????-??-??'}  {record['folder']:<45} {record['status'] or '-':<10} "
+              f"{summary:<11} meeting: {record['meeting_status']}")
+    failed = sum(1 for r in result["sessions"] if r["meeting_status"] not in ("ok", "skipped"))
+    print(f"✅ {len(result['sessions'])} sessions from {len(result['folders'])} folders "
+          f"in {result['elapsed']:.2f}s ({failed} meeting queries failed)")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        print(f"   Context written to {args.json}")
@@ -0,0 +1,457 @@
+"""
+Append-only session log for customer journeys.
+
+A journey's sessions[], milestones[] and journey_health used to be edited by
+rereading, mutating and rewriting engagement_metadata.json; every edit
+re-uploaded the whole file and two edits at once could lose one. JourneyLog
+records each change as one line appended to journey_events.jsonl instead:
+
+    log = JourneyLog(folder)
+    log.add_session({"date": "2026-02-10", "type": "Prototype", "status": "scheduled"})
+    log.set_session_status("2026-02-10", "completed")
+    log.complete_milestone("Prototype Session", date="2026-02-10")
+    log.write_metadata()      # regenerate engagement_metadata.json when needed
+
+Current state lives in memory, keyed by session date and milestone name, so
+reads are dictionary lookups. Each session also carries a numeric "id",
+given once when it is added (in date order for seeded sessions) and never
+changed, which identifies it across reschedules. Opening a journey loads journey_snapshot.json
+(state plus the log offset it covers) and replays only the events after it;
+every COMPACT_EVERY events the snapshot is rewritten. A folder with only
+engagement_metadata.json is seeded from it: the first write logs a
+journey_imported event carrying that metadata, so the log alone always
+rebuilds the full state and the snapshot is only a shortcut. Only the log's
+first line can be a seed: a writer that finds the log already started skips
+its own, and a seed that lost a race is ignored on replay.
+
+Writers append whole lines with O_APPEND and re-read the log before
+validating, so concurrent writers interleave rather than overwrite. Events
+are applied leniently on replay (an update to a session another writer
+removed is ignored); checks happen when an event is written.
+
+Command line:
+    python scripts/journey_log.py FOLDER show
+    python scripts/journey_log.py FOLDER add-session --date 2026-02-10 --type Prototype --status scheduled
+    python scripts/journey_log.py FOLDER session-status --date 2026-02-10 --status completed
+    python scripts/journey_log.py FOLDER milestone --name "Prototype Session" --status completed
+    python scripts/journey_log.py FOLDER materialize
+"""
+
+import datetime
+import json
+import logging
+import os
+import sys
+
+_SHARED = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "_shared"))
+if _SHARED not in sys.path:
+    sys.path.insert(0, _SHARED)
+
+from skillkit.atomic import write_json
+
+logger = logging.getLogger(__name__)
+
+LOG_NAME = "journey_events.jsonl"
+SNAPSHOT_NAME = "journey_snapshot.json"
+METADATA_NAME = "engagement_metadata.json"
+SNAPSHOT_VERSION = 1
+COMPACT_EVERY = 200
+
+SESSION_STATUSES = ("scheduled", "completed", "cancelled")
+MILESTONE_STATUSES = ("planned", "scheduled", "completed", "blocked")
+_JOURNEY_KEYS = ("sessions", "milestones", "journey_health")
+
+
+def _empty_state():
+    return {"metadata": {}, "sessions": {}, "milestones": {}, "health": {}, "updated": None, "last_session_id": 0}
+
+
+def _session_key(sessions, date):
+    """Sessions are keyed by date; a second session on one date becomes 'YYYY-MM-DD#2'."""
+    key, n = date, 1
+    while key in sessions:
+        n += 1
+        key = f"{date}#{n}"
+    return key
+
+
+def assign_session_ids(sessions, existing=(), last=0):
+    """
+    Give each of `sessions` that lacks one (or whose id an `existing` session
+    holds) the next unused "id", in date order. A session keeps its id for
+    good, through reschedules and sessions added before it, so calendar UIDs
+    can be keyed on it; ids are not reused after `last`. Returns the highest id.
+    """
+    taken = {s.get("id") for s in existing}
+    last = max([last] + [i for i in taken if isinstance(i, int)])
+    missing = []
+    for session in sessions:
+        if isinstance(session.get("id"), int) and session["id"] not in taken:
+            taken.add(session["id"])
+            last = max(last, session["id"])
+        else:
+            missing.append(session)
+    for session in sorted(missing, key=lambda s: s.get("date") or ""):
+        last += 1
+        session["id"] = last
+    return last
+
+
+def state_from_metadata(metadata):
+    """Journey state seeded from an existing engagement_metadata.json."""
+    state = _empty_state()
+    state["metadata"] = {k: v for k, v in metadata.items() if k not in _JOURNEY_KEYS}
+    for session in metadata.get("sessions") or []:
+        state["sessions"][_session_key(state["sessions"], session.get("date") or "undated")] = dict(session)
+    state["last_session_id"] = assign_session_ids(list(state["sessions"].values()))
+    for milestone in metadata.get("milestones") or []:
+        state["milestones"][milestone.get("name") or f"Milestone {len(state['milestones']) + 1}"] = dict(milestone)
+    state["health"] = dict(metadata.get("journey_health") or {})
+    return state
+
+
+def apply_event(state, event, first=True):
+    """
+    Apply one logged event to a state dict in place.
+
+    `first` says whether the event is the first line of the log. Only that
+    line may be a journey_imported seed; a later one (from a writer that
+    raced the first seed) would wipe the events before it and is ignored.
+    """
+    op = event.get("op")
+    sessions, milestones = state["sessions"], state["milestones"]
+    if op == "journey_imported" and not first:
+        logger.warning("Ignoring journey_imported event after the start of the log")
+        return
+    if op == "journey_imported":
+        imported = state_from_metadata(event["metadata"])
+        sessions.clear()
+        milestones.clear()
+        sessions.update(imported["sessions"])
+        milestones.update(imported["milestones"])
+        state["metadata"], state["health"] = imported["metadata"], imported["health"]
+        state["last_session_id"] = imported["last_session_id"]
+    elif op == "session_added":
+        session = dict(event["session"])
+        # Events from before ids, or an id a concurrent writer claimed first, get the next one
+        last = state.get("last_session_id", 0)
+        state["last_session_id"] = assign_session_ids([session], sessions.values(), last)
+        sessions[_session_key(sessions, session.get("date") or "undated")] = session
+    elif op == "session_updated":
+        if event["key"] in sessions:
+            sessions[event["key"]].update(event["fields"])
+        else:
+            logger.warning("Ignoring update to unknown session %s", event["key"])
+    elif op == "session_removed":
+        sessions.pop(event["key"], None)
+    elif op == "milestone_set":
+        milestone = milestones.setdefault(event["name"], {"name": event["name"]})
+        milestone.update(event["fields"])
+    elif op == "journey_updated":
+        state["metadata"].update(event.get("fields", {}))
+        state["health"].update(event.get("health", {}))
+    else:
+        logger.warning("Ignoring unknown journey event %r", op)
+        return
+    state["updated"] = event.get("ts") or state["updated"]
+
+
+class JourneyLog:
+    """Event-sourced journey state for one journey folder."""
+
+    def __init__(self, folder, compact_every=COMPACT_EVERY):
+        self.folder = folder
+        self.log_path = os.path.join(folder, LOG_NAME)
+        self.snapshot_path = os.path.join(folder, SNAPSHOT_NAME)
+        self.metadata_path = os.path.join(folder, METADATA_NAME)
+        self.compact_every = compact_every
+        self._position = 0
+        self._since_snapshot = 0
+        self._seed = None
+        self._load()
+
+    def _load(self):
+        if os.path.isfile(self.snapshot_path):
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if snapshot.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported journey snapshot version: {snapshot.get('version')}")
+            self.state = snapshot["state"]
+            self._position = snapshot["offset"]
+        else:
+            self.state = _empty_state()
+            has_log = os.path.isfile(self.log_path) and os.path.getsize(self.log_path) > 0
+            if not has_log and os.path.isfile(self.metadata_path):
+                with open(self.metadata_path, "r", encoding="utf-8") as f:
+                    self._seed = json.load(f)
+                self.state = state_from_metadata(self._seed)
+        self.refresh()
+
+    def refresh(self):
+        """Apply events appended since the last read (by this or another writer); returns how many."""
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(self._position)
+                data = f.read()
+        except FileNotFoundError:
+            return 0
+        # A line without its newline is still being written; leave it for next time
+        end = data.rfind(b"\n") + 1
+        applied = 0
+        position = self._position
+        for line in data[:end].splitlines(keepends=True):
+            first, position = position == 0, position + len(line)
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                logger.warning("Skipping unreadable line in %s", self.log_path)
+                continue
+            apply_event(self.state, event, first)
+            applied += 1
+        self._position += end
+        self._since_snapshot += applied
+        return applied
+
+    def _append(self, op, **fields):
+        event = {"ts": datetime.datetime.now().isoformat(timespec="seconds"), "op": op, **fields}
+        self._write_events([event])
+        return event
+
+    def _write_events(self, events):
+        if self._seed is not None:
+            # Another writer may have started the log since this one was opened
+            self.refresh()
+            if self._position > 0:
+                self._seed = None
+        if self._seed is not None:
+            ts = datetime.datetime.now().isoformat(timespec="seconds")
+            events = [{"ts": ts, "op": "journey_imported", "metadata": self._seed}] + events
+            self._seed = None
+        if not events:
+            return
+        line = "".join(json.dumps(e, ensure_ascii=False, separators=(",", ":")) + "\n" for e in events)
+        fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode("utf-8"))
+        finally:
+            os.close(fd)
+        # Picks up these events along with anything another writer appended first
+        self.refresh()
+        if self.compact_every and self._since_snapshot >= self.compact_every:
+            self.compact()
+
+    def _require_session(self, key):
+        self.refresh()
+        if key not in self.state["sessions"]:
+            raise KeyError(f"No session {key} in {self.folder}")
+
+    # --- Writes -----------------------------------------------------------
+
+    def initialize(self):
+        """Start the log from engagement_metadata.json now; no-op once the log exists."""
+        self._write_events([])
+
+    def add_session(self, session):
+        """
+        Log a new session (dict in the sessions[] schema; needs a date). It
+        is given its permanent "id" now unless it brings an unused one.
+        Returns its key.
+        """
+        if not session.get("date"):
+            raise ValueError("Session needs a date")
+        if session.get("status") and session["status"] not in SESSION_STATUSES:
+            raise ValueError(f"Unknown session status: {session['status']}")
+        self.refresh()
+        session = dict(session)
+        assign_session_ids([session], self.state["sessions"].values(), self.state.get("last_session_id", 0))
+        key = _session_key(self.state["sessions"], session["date"])
+        self._append("session_added", session=session)
+        return key
+
+    def update_session(self, key, **fields):
+        """Log changed fields of a session (key is its date, or 'date#n')."""
+        if fields.get("status") and fields["status"] not in SESSION_STATUSES:
+            raise ValueError(f"Unknown session status: {fields['status']}")
+        self._require_session(key)
+        self._append("session_updated", key=key, fields=fields)
+
+    def set_session_status(self, key, status):
+        self.update_session(key, status=status)
+
+    def remove_session(self, key):
+        self._require_session(key)
+        self._append("session_removed", key=key)
+
+    def set_milestone(self, name, **fields):
+        """Log a new milestone or changed fields of an existing one."""
+        if fields.get("status") and fields["status"] not in MILESTONE_STATUSES:
+            raise ValueError(f"Unknown milestone status: {fields['status']}")
+        self._append("milestone_set", name=name, fields=fields)
+
+    def complete_milestone(self, name, date=None, notes=None):
+        fields = {"status": "completed", "date": date or datetime.date.today().isoformat()}
+        if notes:
+            fields["notes"] = notes
+        self.set_milestone(name, **fields)
+
+    def update_journey(self, health=None, **fields):
+        """Log journey-level fields (journey_status, ...) and journey_health fields."""
+        if any(key in _JOURNEY_KEYS for key in fields):
+            raise ValueError("Use the session and milestone methods for sessions/milestones/journey_health")
+        self._append("journey_updated", fields=fields, health=health or {})
+
+    def compact(self):
+        """Write the current state and log offset to the snapshot."""
+        write_json(self.snapshot_path, {
+            "version": SNAPSHOT_VERSION,
+            "offset": self._position,
+            "compacted": datetime.datetime.now().isoformat(timespec="seconds"),
+            "state": self.state,
+        })
+        self._since_snapshot = 0
+
+    # --- Reads ------------------------------------------------------------
+
+    @property
+    def offset(self):
+        """Bytes of the event log applied to the in-memory state."""
+        return self._position
+
+    def session(self, key):
+        return self.state["sessions"].get(key)
+
+    def sessions(self):
+        return sorted(self.state["sessions"].values(), key=lambda s: s.get("date") or "")
+
+    def milestones(self):
+        return list(self.state["milestones"].values())
+
+    def materialize(self, today=None):
+        """
+        The engagement_metadata.json content for the current state.
+
+        last_customer_contact, days_since_contact and next_touchpoint are
+        derived from the sessions; other journey_health fields come from
+        update_journey().
+        """
+        today = today or datetime.date.today()
+        metadata = dict(self.state["metadata"])
+        sessions = self.sessions()
+        health = dict(self.state["health"])
+        held = [s["date"] for s in sessions if s.get("status") == "completed" and s.get("date")]
+        if held:
+            health["last_customer_contact"] = max(held)
+            health["days_since_contact"] = (today - datetime.date.fromisoformat(max(held))).days
+        upcoming = [s["date"] for s in sessions
+                    if s.get("status") == "scheduled" and (s.get("date") or "") >= today.isoformat()]
+        if upcoming:
+            health["next_touchpoint"] = min(upcoming)
+        metadata["sessions"] = sessions
+        metadata["milestones"] = self.milestones()
+        metadata["journey_health"] = health
+        if self.state["updated"]:
+            metadata["updated"] = self.state["updated"][:10]
+        return metadata
+
+    def write_metadata(self, today=None):
+        """Regenerate engagement_metadata.json (skipped when unchanged); returns True if written."""
+        self.refresh()
+        return write_json(self.metadata_path, self.materialize(today))
+
+
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+    import time
+
+    parser = argparse.ArgumentParser(description="Append-only journey session log")
+    parser.add_argument("folder", help="Journey folder")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("show", help="Print sessions, milestones and health")
+    p = sub.add_parser("add-session", help="Log a new session")
+    p.add_argument("--date", required=True)
+    p.add_argument("--type")
+    p.add_argument("--status", default="scheduled", choices=SESSION_STATUSES)
+    p.add_argument("--format", dest="session_format", help="Teams, In-person, Hybrid")
+    p = sub.add_parser("session-status", help="Change a session's status")
+    p.add_argument("--date", required=True, help="Session key (date, or date#n)")
+    p.add_argument("--status", required=True, choices=SESSION_STATUSES)
+    p = sub.add_parser("milestone", help="Add or update a milestone")
+    p.add_argument("--name", required=True)
+    p.add_argument("--date")
+    p.add_argument("--status", choices=MILESTONE_STATUSES)
+    p.add_argument("--notes")
+    p = sub.add_parser("journey", help="Set journey_status")
+    p.add_argument("--status", required=True, choices=("active", "on-hold", "completed", "closed"))
+    sub.add_parser("compact", help="Rewrite the snapshot now")
+    sub.add_parser("materialize", help="Regenerate engagement_metadata.json")
+    p = sub.add_parser("bench", help="Time appends against rewriting the metadata file (folder is ignored)")
+    p.add_argument("--events", type=int, default=2000)
+
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        with tempfile.TemporaryDirectory() as tmp:
+            log = JourneyLog(tmp)
+            started = time.perf_counter()
+            for i in range(args.events):
+                date = (datetime.date(2026, 1, 1) + datetime.timedelta(days=i)).isoformat()
+                log.add_session({"date": date, "type": "Workshop", "status": "scheduled",
+                                 "key_outcomes": ["Outcome one", "Outcome two"]})
+            append_time = time.perf_counter() - started
+            metadata = log.materialize()
+            rewrite_path = os.path.join(tmp, "rewrite.json")
+            started = time.perf_counter()
+            for i in range(args.events):
+                metadata["sessions"][i]["status"] = "completed"
+                with open(rewrite_path, "w", encoding="utf-8") as f:
+                    json.dump(metadata, f, indent=2)
+            rewrite_time = time.perf_counter() - started
+            started = time.perf_counter()
+            reopened = JourneyLog(tmp)
+            open_time = time.perf_counter() - started
+        print(f"✅ {args.events} session events: append {append_time / args.events * 1000:.3f} ms each, "
+              f"rewrite-whole-file {rewrite_time / args.events * 1000:.3f} ms each")
+        print(f"   Reopen with snapshot: {open_time * 1000:.1f} ms ({len(reopened.state['sessions'])} sessions)")
+        sys.exit(0)
+
+    if not os.path.isdir(args.folder):
+        print(f"❌ Folder not found: {args.folder}")
+        sys.exit(1)
+    log = JourneyLog(args.folder)
+    try:
+        if args.command == "add-session":
+            session = {"date": args.date, "type": args.type, "status": args.status}
+            if args.session_format:
+                session["format"] = args.session_format
+            key = log.add_session({k: v for k, v in session.items() if v is not None})
+            print(f"✅ Logged session {key}")
+        elif args.command == "session-status":
+            log.set_session_status(args.date, args.status)
+            print(f"✅ Session {args.date} → {args.status}")
+        elif args.command == "milestone":
+            fields = {k: v for k, v in (("date", args.date), ("status", args.status), ("notes", args.notes)) if v}
+            log.set_milestone(args.name, **fields)
+            print(f"✅ Milestone '{args.name}' updated")
+        elif args.command == "journey":
+            log.update_journey(journey_status=args.status)
+            print(f"✅ Journey status → {args.status}")
+        elif args.command == "compact":
+            log.compact()
+            print(f"✅ Snapshot written at offset {log.offset}")
+        elif args.command == "materialize":
+            written = log.write_metadata()
+            print(f"✅ {METADATA_NAME} {'written' if written else 'unchanged'}")
+        else:
+            metadata = log.materialize()
+            print(f"Journey status: {metadata.get('journey_status', '-')}")
+            for session in metadata["sessions"]:
+                print(f"  {session.get('date')}  {session.get('status', '-'):<10} {session.get('type', '')}")
+            for milestone in metadata["milestones"]:
+                print(f"  ◆ {milestone.get('name')}: {milestone.get('status', '-')} {milestone.get('date') or ''}")
+            print(f"Health: {json.dumps(metadata['journey_health'])}")
+    except (KeyError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
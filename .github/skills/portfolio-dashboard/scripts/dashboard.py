@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Portfolio dashboard for every engagement and journey in the engagements folder.
+
+Writes portfolio_dashboard.html and portfolio_dashboard.md with one row per
+engagement or journey: status, T-position, next due task, overdue task count
+and next milestone. Sources per folder are engagement_metadata.json, the
+journey session log (journey_events.jsonl / journey_snapshot.json, through
+journey-promoter's JourneyLog) and the tasks*.csv files.
+
+Builds are incremental. A state index records each folder's source files
+(mtime, size, BLAKE2b digest) and its rendered rows; the facts parsed from
+each folder are kept in a file of their own:
+
+  - the engagements folder is listed again only when its own mtime changed
+  - a folder is re-read only when one of its source files changed size or
+    mtime and then also content (a touched but identical file costs a hash)
+  - rows are re-rendered only for re-read folders, or for all folders from
+    their cached facts once the date rolls over (T-positions and overdue
+    counts depend on today)
+
+so a rebuild after a single edit stats a few files per folder, parses one
+folder and takes milliseconds. Output files are written atomically and only
+when their content changed.
+
+Usage:
+    python scripts/dashboard.py [--base PATH] [--output DIR] [--force] [--today YYYY-MM-DD]
+
+The base path defaults to engagements_base_path from config.json; output
+defaults to the base path. State lives in ~/.copilot-skills/dashboard
+(SKILLS_DASHBOARD_DIR to override).
+"""
+
+import csv
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import time
+from datetime import date, datetime
+
+_SKILLS = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+for _path in (os.path.join(_SKILLS, "_shared"), os.path.join(_SKILLS, "journey-promoter", "scripts")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from journey_log import LOG_NAME, METADATA_NAME, SNAPSHOT_NAME, JourneyLog
+from skillkit.atomic import write_text
+from skillkit.config import load_base_path
+from skillkit.timeline import calculate_business_days_between
+
+DEFAULT_STATE_DIR = os.environ.get(
+    "SKILLS_DASHBOARD_DIR", os.path.join(os.path.expanduser("~"), ".copilot-skills", "dashboard")
+)
+HTML_NAME = "portfolio_dashboard.html"
+MARKDOWN_NAME = "portfolio_dashboard.md"
+STATE_VERSION = 1
+
+CLOSED_STATUSES = ("past", "completed", "closed")
+FINISHED_SESSION_STATUSES = ("completed", "cancelled")
+COMBINED_TASKS = "tasks_all_sessions.csv"
+_BUCKET_DATE = re.compile(r"^(\d{4}-\d{2}-\d{2}) - ")
+
+
+def is_source(name):
+    """Files in an engagement folder that feed the dashboard."""
+    if name in (METADATA_NAME, LOG_NAME, SNAPSHOT_NAME):
+        return True
+    return name.startswith("tasks") and name.endswith(".csv") and name != COMBINED_TASKS
+
+
+def _iso_date(value, what):
+    """A metadata date as YYYY-MM-DD (None stays None); ValueError names the field otherwise."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value).isoformat()
+    except (TypeError, ValueError):
+        raise ValueError(f"{what} is not a YYYY-MM-DD date: {value!r}") from None
+
+
+def read_facts(folder):
+    """Everything the dashboard needs from one folder, independent of today's date."""
+    if os.path.exists(os.path.join(folder, LOG_NAME)):
+        metadata = JourneyLog(folder).materialize()
+    else:
+        with open(os.path.join(folder, METADATA_NAME), "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+
+    tasks = []
+    for name in sorted(os.listdir(folder)):
+        if not (is_source(name) and name.endswith(".csv")):
+            continue
+        with open(os.path.join(folder, name), "r", encoding="utf-8", newline="") as f:
+            for task in csv.DictReader(f):
+                try:
+                    due = datetime.strptime(task["Due date"], "%m/%d/%Y").date().isoformat()
+                except (KeyError, ValueError):
+                    continue
+                bucket = _BUCKET_DATE.match(task.get("Bucket", ""))
+                tasks.append([due, task.get("Task Name", "").rsplit(" - ", 1)[-1],
+                              task.get("Progress", ""), bucket.group(1) if bucket else None])
+    tasks.sort()
+
+    journey = "sessions" in metadata or "journey_status" in metadata
+    return {
+        "folder": os.path.basename(folder),
+        "customer": metadata.get("customer") or os.path.basename(folder),
+        "kind": "journey" if journey else "engagement",
+        "status": metadata.get("journey_status") if journey else metadata.get("status"),
+        "engagement_date": _iso_date(metadata.get("engagement_date"), "engagement_date"),
+        "closed_out": bool(metadata.get("closeout_generated")),
+        "sessions": [{"date": _iso_date(s.get("date"), "session date"), "status": s.get("status"),
+                      "type": s.get("type")}
+                     for s in metadata.get("sessions", [])],
+        "milestones": [{"name": m.get("name"), "date": _iso_date(m.get("date"), f"milestone {m.get('name')!r} date"),
+                        "status": m.get("status")}
+                       for m in metadata.get("milestones", [])],
+        "tasks": tasks,
+    }
+
+
+def summarize(facts, today):
+    """Dashboard row for a folder's facts as of `today`."""
+    today_iso = today.isoformat()
+    finished = facts["closed_out"] or (facts["status"] or "").lower() in CLOSED_STATUSES
+    finished_sessions = {s["date"] for s in facts["sessions"] if s["status"] in FINISHED_SESSION_STATUSES}
+
+    if facts["kind"] == "journey":
+        upcoming = sorted(s["date"] for s in facts["sessions"]
+                          if s["date"] and s["status"] == "scheduled" and s["date"] >= today_iso)
+        held = sorted(s["date"] for s in facts["sessions"] if s["date"])
+        anchor = upcoming[0] if upcoming else (held[-1] if held else None)
+    else:
+        anchor = facts["engagement_date"]
+
+    position = None
+    if anchor:
+        days = calculate_business_days_between(today, date.fromisoformat(anchor))
+        position = f"T-{days}" if days >= 0 else f"T+{-days}"
+
+    open_tasks = [
+        (due, title) for due, title, progress, bucket_date in facts["tasks"]
+        if not finished and progress.lower() != "completed" and bucket_date not in finished_sessions
+    ]
+    overdue = sum(1 for due, _ in open_tasks if due < today_iso)
+    next_task = next(((title, due) for due, title in open_tasks if due >= today_iso), None)
+
+    if facts["kind"] == "journey":
+        pending = [m for m in facts["milestones"] if m["status"] != "completed"]
+        pending.sort(key=lambda m: (m["date"] is None, m["date"] or ""))
+        milestone = (pending[0]["name"], pending[0]["date"]) if pending else None
+    elif finished:
+        milestone = None
+    elif anchor and anchor >= today_iso:
+        milestone = ("Engagement", anchor)
+    else:
+        milestone = ("Closeout", None)
+
+    return {
+        "folder": facts["folder"],
+        "customer": facts["customer"],
+        "kind": facts["kind"],
+        "status": facts["status"] or ("closed out" if facts["closed_out"] else ""),
+        "anchor": anchor,
+        "position": position,
+        "next_task": next_task,
+        "overdue": overdue,
+        "milestone": milestone,
+    }
+
+
+def _dated(pair):
+    """'Name (date)' for a (name, date) pair, or a dash."""
+    if not pair:
+        return "—"
+    text, when = pair
+    return f"{text} ({when})" if when else text
+
+
+def render_markdown_row(row):
+    cells = [row["customer"], row["folder"], row["status"] or "—", row["position"] or "—",
+             _dated(row["next_task"]), str(row["overdue"]) if row["overdue"] else "—", _dated(row["milestone"])]
+    return "| " + " | ".join(c.replace("|", "\\|") for c in cells) + " |\n"
+
+
+def render_html_row(row):
+    overdue = f'<td class="overdue">{row["overdue"]}</td>' if row["overdue"] else "<td>—</td>"
+    cells = [row["customer"], row["folder"], row["status"] or "—", row["position"] or "—",
+             _dated(row["next_task"])]
+    return ("<tr>" + "".join(f"<td>{html.escape(c)}</td>" for c in cells) + overdue
+            + f"<td>{html.escape(_dated(row['milestone']))}</td></tr>\n")
+
+
+_HEADERS = ["Customer", "Folder", "Status", "T-position", "Next due task", "Overdue", "Next milestone"]
+_GROUPS = (("journey", "Customer Journeys"), ("engagement", "Engagements"))
+_STYLE = ("body{font-family:Segoe UI,sans-serif;margin:2em}table{border-collapse:collapse;width:100%}"
+          "th,td{border:1px solid #ddd;padding:4px 8px;text-align:left}th{background:#f3f3f3}"
+          ".overdue{color:#b00;font-weight:bold}")
+
+
+def _order(entry):
+    anchor, customer = entry["order"]
+    return (anchor is None, anchor or "", customer.lower())
+
+
+def assemble(entries, today):
+    """Full Markdown and HTML documents from the cached per-folder rows."""
+    markdown = [f"# Portfolio Dashboard\n\nAs of {today.isoformat()}\n"]
+    page = [f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Portfolio Dashboard</title>"
+            f"<style>{_STYLE}</style></head><body>\n<h1>Portfolio Dashboard</h1>\n<p>As of {today.isoformat()}</p>\n"]
+    for kind, title in _GROUPS:
+        group = sorted((e for e in entries if e["kind"] == kind), key=_order)
+        overdue = sum(e["overdue"] for e in group)
+        markdown.append(f"\n## {title} ({len(group)}, {overdue} overdue tasks)\n\n")
+        markdown.append("| " + " | ".join(_HEADERS) + " |\n|" + "---|" * len(_HEADERS) + "\n")
+        markdown.extend(e["markdown"] for e in group)
+        page.append(f"<h2>{title} ({len(group)}, {overdue} overdue tasks)</h2>\n<table><tr>"
+                    + "".join(f"<th>{h}</th>" for h in _HEADERS) + "</tr>\n")
+        page.extend(e["html"] for e in group)
+        page.append("</table>\n")
+    page.append("</body></html>\n")
+    return "".join(markdown), "".join(page)
+
+
+def _digest(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _dump(path, obj):
+    # Compact JSON: json's C encoder is only used without indent
+    write_text(path, json.dumps(obj, separators=(",", ":"), ensure_ascii=False))
+
+
+class Dashboard:
+    """
+    Incremental builder. State is kept per base/output pair: an index with
+    each folder's source stats and rendered row, and one facts file per
+    folder, read only when that folder's rows must be re-derived.
+    """
+
+    def __init__(self, base_path, output_dir=None, state_dir=DEFAULT_STATE_DIR):
+        self.base_path = os.path.abspath(base_path)
+        self.output_dir = os.path.abspath(output_dir or base_path)
+        key = hashlib.sha1(f"{self.base_path}\n{self.output_dir}".encode("utf-8")).hexdigest()[:16]
+        self.index_path = os.path.join(state_dir, f"{key}.json")
+        self.facts_dir = os.path.join(state_dir, key)
+
+    def _facts_path(self, name):
+        return os.path.join(self.facts_dir, hashlib.sha1(name.encode("utf-8")).hexdigest()[:16] + ".json")
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return index if index.get("version") == STATE_VERSION else None
+
+    def _load_facts(self, name):
+        try:
+            with open(self._facts_path(name), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _folder_names(self, index, stats):
+        base_mtime = os.stat(self.base_path).st_mtime_ns
+        if index and index.get("base_mtime") == base_mtime:
+            return index["folder_names"]
+        stats["base_listed"] = True
+        return sorted(entry.name for entry in os.scandir(self.base_path)
+                      if entry.is_dir() and not entry.name.startswith("."))
+
+    def _check_sources(self, name, cached, stats):
+        """(folder mtime, sources, changed) for a folder; sources is None when it has no metadata."""
+        folder = os.path.join(self.base_path, name)
+        try:
+            folder_mtime = os.stat(folder).st_mtime_ns
+        except FileNotFoundError:
+            return None, None, True
+
+        if cached and cached["folder_mtime"] == folder_mtime:
+            names = list(cached["sources"])
+        else:
+            names = [entry.name for entry in os.scandir(folder) if entry.is_file() and is_source(entry.name)]
+        if METADATA_NAME not in names:
+            return folder_mtime, None, True
+
+        sources, changed = {}, not cached or set(names) != set(cached["sources"])
+        for source in names:
+            path = os.path.join(folder, source)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                changed = True
+                continue
+            previous = cached["sources"].get(source) if cached else None
+            if previous and previous[0] == st.st_mtime_ns and previous[1] == st.st_size:
+                sources[source] = previous
+                continue
+            digest = _digest(path)
+            stats["hashed"] += 1
+            sources[source] = [st.st_mtime_ns, st.st_size, digest]
+            changed = changed or not previous or previous[2] != digest
+        return folder_mtime, sources, changed
+
+    def build(self, today=None, force=False):
+        """
+        Bring the dashboard up to date.
+
+        Returns:
+            Stats dict: folders, read (re-parsed), rendered (rows), hashed
+            (files), written (output files), base_listed, seconds
+        """
+        started = time.perf_counter()
+        today = today or date.today()
+        today_iso = today.isoformat()
+        index = None if force else self._load_index()
+        stats = {"folders": 0, "read": 0, "rendered": 0, "hashed": 0, "written": 0, "base_listed": False}
+        dirty = index is None
+
+        cached_folders = index["folders"] if index else {}
+        folder_names = self._folder_names(index, stats)
+        folders = {}
+        for name in folder_names:
+            cached = cached_folders.get(name)
+            folder_mtime, sources, changed = self._check_sources(name, cached, stats)
+            if sources is None:
+                continue
+            facts = None
+            if not changed and cached["today"] != today_iso:
+                facts = self._load_facts(name)
+                changed = facts is None  # Facts file lost; read the folder again
+            if changed:
+                try:
+                    facts = read_facts(os.path.join(self.base_path, name))
+                except (OSError, ValueError) as e:
+                    print(f"⚠️  Skipping {name}: {e}")
+                    continue
+                os.makedirs(self.facts_dir, exist_ok=True)
+                _dump(self._facts_path(name), facts)
+                stats["read"] += 1
+
+            if facts is None:
+                entry = cached
+                if sources != cached["sources"] or folder_mtime != cached["folder_mtime"]:
+                    entry = dict(cached, folder_mtime=folder_mtime, sources=sources)
+                    dirty = True
+            else:
+                row = summarize(facts, today)
+                entry = {
+                    "folder_mtime": folder_mtime, "sources": sources, "today": today_iso,
+                    "kind": row["kind"], "order": [row["anchor"], row["customer"]], "overdue": row["overdue"],
+                    "markdown": render_markdown_row(row), "html": render_html_row(row),
+                }
+                stats["rendered"] += 1
+                dirty = True
+            folders[name] = entry
+        for name in cached_folders.keys() - folders.keys():
+            dirty = True
+            try:
+                os.remove(self._facts_path(name))
+            except FileNotFoundError:
+                pass
+        stats["folders"] = len(folders)
+
+        if dirty or stats["base_listed"]:
+            markdown, page = assemble(list(folders.values()), today)
+            os.makedirs(self.output_dir, exist_ok=True)
+            stats["written"] += write_text(os.path.join(self.output_dir, MARKDOWN_NAME), markdown)
+            stats["written"] += write_text(os.path.join(self.output_dir, HTML_NAME), page)
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            _dump(self.index_path, {
+                "version": STATE_VERSION,
+                # Outputs may live in the base folder; record its mtime after writing them
+                "base_mtime": os.stat(self.base_path).st_mtime_ns,
+                "folder_names": folder_names,
+                "folders": folders,
+            })
+        stats["seconds"] = time.perf_counter() - started
+        return stats
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the portfolio dashboard (incrementally)")
+    parser.add_argument("--base", help="Engagements folder (default: engagements_base_path in config.json)")
+    parser.add_argument("--output", help="Folder for portfolio_dashboard.html/.md (default: the base folder)")
+    parser.add_argument("--force", action="store_true", help="Ignore the saved state and rebuild everything")
+    parser.add_argument("--today", type=date.fromisoformat, help="Build as of this date (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    base = args.base or load_base_path()
+    if not base or not os.path.isdir(base):
+        print("❌ Engagements folder not found (use --base or set engagements_base_path in config.json)")
+        sys.exit(1)
+
+    dashboard = Dashboard(base, args.output)
+    stats = dashboard.build(args.today, args.force)
+    print(f"✅ Dashboard: {stats['folders']} folders, {stats['read']} re-read, "
+          f"{stats['rendered']} rows rendered, {stats['written']} file(s) written "
+          f"in {stats['seconds'] * 1000:.1f} ms")
+    print(f"   {os.path.join(dashboard.output_dir, HTML_NAME)}")
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Check generate_task_timeline() against the Power Automate flow it replaces.
+
+business_days.py claims to match the production flow exactly; the flow's only
+record is references/power_automate_flow.json. This harness reads that
+definition and evaluates it offline for every engagement date in a range:
+
+  - task templates: the Compose action's createArray(json('{...}')) items
+    (Title, "Due T- Days")
+  - task title and bucket name: the Create_a_task / Create_a_bucket string
+    templates (@{triggerBody()?['text']}, @{items('Apply_to_each')['Title']},
+    ...), interpolated for each date and customer
+  - due date: the flow asks an AI Builder prompt for "engagement date minus T
+    business days", which cannot run offline. It is stood in for by
+    flow_due_date(), a closed-form weekday calculation written independently
+    of calculate_business_days()
+
+and compares each (title, bucket, due date) with what generate_task_timeline()
+produces for the same date, then reports mismatches and throughput of both
+sides. Run it after changing the engine (or the flow export):
+
+    python scripts/flow_parity.py                                  # 2000-2050, every day
+    python scripts/flow_parity.py --start 2026-01-01 --end 2026-12-31 --customer "Contoso"
+    python scripts/flow_parity.py --json
+
+Exit code 1 when anything differs. Assignment is not compared: the flow
+assigns by email, the CSV by display name.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from business_days import generate_task_timeline
+
+DEFAULT_FLOW = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "references", "power_automate_flow.json")
+
+_JSON_ITEM = re.compile(r"json\('((?:[^']|'')*)'\)")
+_PLACEHOLDER = re.compile(r"@\{([^}]*)\}")
+_TRIGGER_FIELD = re.compile(r"^triggerBody\(\)\?\['(\w+)'\]$")
+_ITEM_FIELD = re.compile(r"^items\('(\w+)'\)\['([^']+)'\]$")
+
+
+class FlowDefinitionError(ValueError):
+    """Raised when the flow export does not have the expected shape."""
+
+
+class Flow:
+    """The parts of the exported flow that decide which tasks get created."""
+
+    def __init__(self, path=DEFAULT_FLOW):
+        with open(path, "r", encoding="utf-8") as f:
+            definition = json.load(f)
+        try:
+            actions = definition["properties"]["definition"]["actions"]
+            loop = actions["Apply_to_each"]
+            create_task = loop["actions"]["Create_a_task"]["inputs"]["parameters"]
+            self.title_template = create_task["body/title"]
+            self.bucket_template = actions["Create_a_bucket"]["inputs"]["parameters"]["body/name"]
+            self.loop_name = "Apply_to_each"
+            offset = loop["actions"]["Run_a_prompt"]["inputs"]["parameters"]["item/requestv2/T_2dminus_20Days"]
+            compose = actions["Compose"]["inputs"]
+        except (KeyError, TypeError) as e:
+            raise FlowDefinitionError(f"Unexpected flow layout: missing {e}")
+
+        offset_field = _ITEM_FIELD.match(offset.lstrip("@"))
+        if not offset_field:
+            raise FlowDefinitionError(f"Unsupported T-minus expression in flow: {offset}")
+        self.offset_field = offset_field.group(2)
+        self.tasks = [json.loads(item.replace("''", "'")) for item in _JSON_ITEM.findall(compose)]
+        if not self.tasks:
+            raise FlowDefinitionError("No task templates found in the Compose action")
+
+    def interpolate(self, template, trigger, item=None):
+        """Evaluate a Logic Apps string template with @{...} placeholders."""
+        def value(match):
+            expression = match.group(1).strip()
+            field = _TRIGGER_FIELD.match(expression)
+            if field:
+                return str(trigger[field.group(1)])
+            field = _ITEM_FIELD.match(expression)
+            if field and item is not None and field.group(1) == self.loop_name:
+                return str(item[field.group(2)])
+            raise FlowDefinitionError(f"Unsupported expression in flow: {expression}")
+        return _PLACEHOLDER.sub(value, template)
+
+    def run(self, customer_name, engagement_date):
+        """The tasks the flow would create: [(title, bucket, due date)] in flow order."""
+        trigger = {"date": engagement_date, "text": customer_name}
+        bucket = self.interpolate(self.bucket_template, trigger)
+        day = datetime.strptime(engagement_date, "%Y-%m-%d").date()
+        return [
+            (self.interpolate(self.title_template, trigger, item), bucket,
+             flow_due_date(day, item[self.offset_field]))
+            for item in self.tasks
+        ]
+
+
+def flow_due_date(engagement, t_minus):
+    """
+    `engagement` minus `t_minus` business days (negative: after), weekends skipped.
+
+    Whole weeks are 7 calendar days from any weekday; a weekend start counts
+    like the Monday after it (going back) or the Friday before it (going on).
+    """
+    if t_minus == 0:
+        return engagement
+    weekday = engagement.weekday()
+    weeks, rest = divmod(abs(t_minus), 5)
+    if t_minus > 0:
+        day = engagement + timedelta(days=7 - weekday) if weekday > 4 else engagement
+        day -= timedelta(days=7 * weeks)
+        return day - timedelta(days=rest if rest <= day.weekday() else rest + 2)
+    day = engagement - timedelta(days=weekday - 4) if weekday > 4 else engagement
+    day += timedelta(days=7 * weeks)
+    return day + timedelta(days=rest if day.weekday() + rest <= 4 else rest + 2)
+
+
+def python_tasks(customer_name, engagement_date):
+    """generate_task_timeline() output as [(title, bucket, due date)]."""
+    return [
+        (task["Task Name"], task["Bucket"], datetime.strptime(task["Due date"], "%m/%d/%Y").date())
+        for task in generate_task_timeline(customer_name, engagement_date)
+    ]
+
+
+def compare(expected, actual):
+    """Differences between flow and engine task lists for one date, matched by title."""
+    problems = []
+    flow_by_title = {title: (bucket, due) for title, bucket, due in expected}
+    engine_by_title = {title: (bucket, due) for title, bucket, due in actual}
+    for title in sorted(flow_by_title.keys() - engine_by_title.keys()):
+        bucket, due = flow_by_title[title]
+        problems.append(("missing", title, f"{bucket} / {due.isoformat()}", None))
+    for title in sorted(engine_by_title.keys() - flow_by_title.keys()):
+        bucket, due = engine_by_title[title]
+        problems.append(("extra", title, None, f"{bucket} / {due.isoformat()}"))
+    for title in sorted(flow_by_title.keys() & engine_by_title.keys()):
+        flow_bucket, flow_due = flow_by_title[title]
+        engine_bucket, engine_due = engine_by_title[title]
+        if flow_bucket != engine_bucket:
+            problems.append(("bucket", title, flow_bucket, engine_bucket))
+        if flow_due != engine_due:
+            problems.append(("due date", title, flow_due.isoformat(), engine_due.isoformat()))
+    if len(expected) != len(actual):
+        problems.append(("count", None, len(expected), len(actual)))
+    return problems
+
+
+def check(flow, start, end, customer_name="Contoso"):
+    """Compare every engagement date from start to end inclusive; returns a report dict."""
+    dates = []
+    day = start
+    while day <= end:
+        dates.append(day.isoformat())
+        day += timedelta(days=1)
+
+    started = time.perf_counter()
+    expected = [flow.run(customer_name, d) for d in dates]
+    flow_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    actual = [python_tasks(customer_name, d) for d in dates]
+    engine_seconds = time.perf_counter() - started
+
+    mismatches = []
+    for d, flow_tasks, engine_tasks in zip(dates, expected, actual):
+        for kind, title, flow_value, engine_value in compare(flow_tasks, engine_tasks):
+            mismatches.append({"date": d, "kind": kind, "title": title,
+                               "flow": str(flow_value), "engine": str(engine_value)})
+
+    tasks = sum(len(t) for t in actual)
+    return {
+        "dates": len(dates),
+        "tasks": tasks,
+        "flow_templates": len(flow.tasks),
+        "mismatches": mismatches,
+        "engine_seconds": engine_seconds,
+        "engine_tasks_per_second": tasks / engine_seconds if engine_seconds else None,
+        "flow_seconds": flow_seconds,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare generate_task_timeline with the Power Automate flow")
+    parser.add_argument("--flow", default=DEFAULT_FLOW, help="Exported flow definition JSON")
+    parser.add_argument("--start", default="2000-01-01", help="First engagement date (YYYY-MM-DD)")
+    parser.add_argument("--end", default="2050-12-31", help="Last engagement date (YYYY-MM-DD)")
+    parser.add_argument("--customer", default="Contoso", help="Customer name passed to both sides")
+    parser.add_argument("--show", type=int, default=20, help="Mismatches to print")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    args = parser.parse_args()
+
+    try:
+        flow = Flow(args.flow)
+    except (OSError, FlowDefinitionError) as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    report = check(flow, date.fromisoformat(args.start), date.fromisoformat(args.end), args.customer)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"Flow templates: {report['flow_templates']}  Dates: {report['dates']:,}  Tasks: {report['tasks']:,}")
+        print(f"Engine: {report['engine_seconds']:.2f}s ({report['engine_tasks_per_second']:,.0f} tasks/s)  "
+              f"Flow evaluation: {report['flow_seconds']:.2f}s")
+        for mismatch in report["mismatches"][:args.show]:
+            print(f"  {mismatch['date']}  {mismatch['kind']:<8} {mismatch['title']}: "
+                  f"flow={mismatch['flow']} engine={mismatch['engine']}")
+        if report["mismatches"]:
+            print(f"❌ {len(report['mismatches']):,} mismatch(es)")
+        else:
+            print("✅ Engine matches the flow for every date")
+    sys.exit(1 if report["mismatches"] else 0)
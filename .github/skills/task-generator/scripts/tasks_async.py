@@ -0,0 +1,101 @@
+"""
+asyncio-native task timeline API for agent hosts serving several users at once.
+
+Mirrors the business_days.py entry points (skillkit.timeline and
+skillkit.planner). Timeline generation is cheap pure Python and CSV writing is
+file I/O, so both run on a bounded thread pool; nothing here blocks the event
+loop.
+
+Usage (with task-generator/scripts on sys.path):
+    import tasks_async
+
+    session_tasks = await tasks_async.generate_journey_tasks("Contoso", sessions)
+    files = await tasks_async.save_journey_tasks("Contoso", session_tasks, folder)
+"""
+
+import asyncio
+import os
+import sys
+
+_SHARED = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "_shared"))
+if _SHARED not in sys.path:
+    sys.path.insert(0, _SHARED)
+
+from skillkit import ics, planner, timeline
+from skillkit.aio import BoundedExecutor
+
+_executor = None
+
+
+def configure(max_concurrency=8):
+    """Replace the shared thread executor; returns the new BoundedExecutor."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+    _executor = BoundedExecutor(max_concurrency, "thread")
+    return _executor
+
+
+def get_executor():
+    return _executor or configure()
+
+
+def shutdown():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+
+
+async def generate_task_timeline(customer_name, engagement_date, assignee="Brendon Colburn",
+                                 session_type="initial", session_label=None):
+    """Async generate_task_timeline; see timeline.generate_task_timeline."""
+    return await get_executor().run(
+        timeline.generate_task_timeline,
+        customer_name, engagement_date, assignee, session_type, session_label,
+    )
+
+
+async def generate_journey_tasks(customer_name, sessions, assignee="Brendon Colburn"):
+    """
+    Async generate_journey_tasks.
+
+    Sessions are generated concurrently and returned as the same
+    {session date: tasks} mapping as timeline.generate_journey_tasks.
+    """
+    timelines = await asyncio.gather(*(
+        generate_task_timeline(
+            customer_name,
+            session["date"],
+            assignee,
+            session.get("type", "followon"),
+            session.get("label"),
+        )
+        for session in sessions
+    ))
+    return {session["date"]: tasks for session, tasks in zip(sessions, timelines)}
+
+
+async def save_tasks_csv(tasks, output_path, record=True):
+    """Async save_tasks_csv; the write (and ledger record) runs on the executor."""
+    return await get_executor().run(planner.save_tasks_csv, tasks, output_path, record)
+
+
+async def save_journey_tasks(customer_name, session_tasks, output_dir, combined=True, record=True):
+    """Async save_journey_tasks; see planner.save_journey_tasks."""
+    return await get_executor().run(
+        planner.save_journey_tasks, customer_name, session_tasks, output_dir, combined, record
+    )
+
+
+async def save_journey_ics(customer_name, session_tasks, output_dir, combined=True):
+    """Async save_journey_ics; see skillkit.ics.save_journey_ics."""
+    return await get_executor().run(
+        ics.save_journey_ics, customer_name, session_tasks, output_dir, combined
+    )
+
+
+async def write_task_timeline(customer_name, engagement_date, output_path, **options):
+    """Generate one timeline and write it to output_path; returns the path."""
+    tasks = await generate_task_timeline(customer_name, engagement_date, **options)
+    return await save_tasks_csv(tasks, output_path)
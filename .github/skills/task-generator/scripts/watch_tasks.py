@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Watch the engagements folder and regenerate task timelines when metadata changes.
+
+Editing engagement_date (or a journey's sessions) in engagement_metadata.json
+leaves the task CSVs next to it stale. This watcher notices the edit and
+rewrites only that folder's task files:
+
+  - single engagement: tasks.csv from generate_task_timeline()
+  - customer journey (metadata has "sessions"): per-session tasks_<date>.csv
+    and tasks_all_sessions.csv for the follow-on sessions, from
+    generate_journey_tasks(); the original tasks.csv is left as-is
+
+OneDrive delivers one edit as a burst of events, so changes are debounced per
+folder and handled once the folder has been quiet for --debounce seconds.
+Only the fields that drive the timeline are compared, so edits to status or
+notes do not regenerate anything, and unchanged CSVs are never rewritten.
+
+Events come from watchdog (inotify on Linux, ReadDirectoryChangesW on
+Windows) when it is installed; otherwise the metadata files are polled with
+one stat() each per interval, which stays negligible for hundreds of folders.
+
+Usage:
+    python scripts/watch_tasks.py [--base PATH] [--debounce 2] [--poll-interval 2]
+                                  [--polling] [--sync-on-start]
+
+The base path defaults to engagements_base_path from config.json.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+from business_days import generate_journey_tasks, generate_task_timeline, save_journey_tasks, save_tasks_csv
+from skillkit.config import load_base_path  # business_days puts _shared on sys.path
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+logger = logging.getLogger(__name__)
+
+METADATA_FILE = "engagement_metadata.json"
+DEFAULT_ASSIGNEE = "Brendon Colburn"
+
+
+def timeline_inputs(metadata):
+    """
+    The metadata fields a folder's task files are generated from.
+
+    Returns a hashable key; two metadata versions with the same key produce
+    the same task files.
+    """
+    sessions = metadata.get("sessions")
+    if isinstance(sessions, list):
+        return (
+            "journey",
+            metadata.get("customer"),
+            metadata.get("lead_architect"),
+            tuple(
+                (s.get("date"), s.get("type"), s.get("status"))
+                for s in sessions if isinstance(s, dict)
+            ),
+        )
+    return ("engagement", metadata.get("customer"), metadata.get("lead_architect"),
+            metadata.get("engagement_date"))
+
+
+def regenerate_folder(folder, metadata):
+    """
+    Rewrite the task CSVs for one engagement or journey folder.
+
+    Returns:
+        List of task file paths (files whose content did not change are left untouched)
+    """
+    customer = metadata.get("customer")
+    assignee = metadata.get("lead_architect") or DEFAULT_ASSIGNEE
+    if not customer:
+        raise ValueError("metadata has no customer")
+
+    sessions = metadata.get("sessions")
+    if isinstance(sessions, list):
+        # Session 1 is covered by the original tasks.csv; regenerate the follow-ons
+        followons = [
+            {"date": s["date"], "label": s.get("type"), "type": "followon"}
+            for s in sessions[1:]
+            if isinstance(s, dict) and s.get("date") and s.get("status") != "cancelled"
+        ]
+        if not followons:
+            return []
+        session_tasks = generate_journey_tasks(customer, followons, assignee)
+        return save_journey_tasks(customer, session_tasks, folder)
+
+    engagement_date = metadata.get("engagement_date")
+    if not engagement_date:
+        raise ValueError("metadata has no engagement_date")
+    tasks = generate_task_timeline(customer, engagement_date, assignee)
+    return [save_tasks_csv(tasks, os.path.join(folder, "tasks.csv"))]
+
+
+class _MetadataEvents(FileSystemEventHandler):
+    """watchdog handler forwarding metadata file events to the watcher."""
+
+    def __init__(self, watcher):
+        self._watcher = watcher
+
+    def on_any_event(self, event):
+        # Editors and sync clients often replace the file, which arrives as a move
+        for path in (getattr(event, "src_path", None), getattr(event, "dest_path", None)):
+            if path and os.path.basename(path) == METADATA_FILE:
+                self._watcher.notify(os.path.dirname(path))
+
+
+class TaskWatcher:
+    """Debounced metadata watcher over every folder directly under base_path."""
+
+    def __init__(self, base_path, debounce=2.0, poll_interval=2.0, polling=False):
+        self.base_path = os.path.abspath(base_path)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.polling = polling or Observer is None
+        self._inputs = {}       # folder -> timeline_inputs() last generated from
+        self._stamps = {}       # folder -> (mtime_ns, size) for the polling backend
+        self._pending = {}      # folder -> time its quiet period ends
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self.regenerated = 0
+
+    def _metadata_path(self, folder):
+        return os.path.join(folder, METADATA_FILE)
+
+    def _scan(self):
+        """Current (mtime_ns, size) of every folder's metadata file."""
+        stamps = {}
+        try:
+            entries = os.scandir(self.base_path)
+        except OSError as e:
+            logger.warning("Cannot list %s: %s", self.base_path, e)
+            return stamps
+        with entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                try:
+                    st = os.stat(self._metadata_path(entry.path))
+                except OSError:
+                    continue
+                stamps[os.path.abspath(entry.path)] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def _read_metadata(self, folder):
+        with open(self._metadata_path(folder), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def prime(self, sync=False):
+        """
+        Record the current timeline inputs of every folder.
+
+        With sync=True, also regenerate each folder's task files now (unchanged
+        files are skipped by the writer, so this is cheap to repeat).
+        """
+        self._stamps = self._scan()
+        for folder in self._stamps:
+            if sync:
+                self.process(folder)
+                continue
+            try:
+                self._inputs[folder] = timeline_inputs(self._read_metadata(folder))
+            except (OSError, ValueError) as e:
+                logger.warning("Skipping %s: %s", folder, e)
+        logger.info("Watching %d engagement folder(s) under %s (%s)", len(self._stamps),
+                    self.base_path, "polling" if self.polling else "watchdog")
+
+    def notify(self, folder):
+        """Mark a folder as changed; it is processed after debounce seconds of quiet."""
+        folder = os.path.abspath(folder)
+        if os.path.dirname(folder) != self.base_path:
+            return
+        with self._cond:
+            self._pending[folder] = time.monotonic() + self.debounce
+            self._cond.notify()
+
+    def process(self, folder):
+        """Regenerate a folder's task files if its timeline inputs changed."""
+        try:
+            metadata = self._read_metadata(folder)
+        except FileNotFoundError:
+            self._inputs.pop(folder, None)
+            return
+        except (OSError, ValueError) as e:
+            # Usually a file caught mid-sync; the write completing sends another event
+            logger.warning("Cannot read %s: %s", self._metadata_path(folder), e)
+            return
+        inputs = timeline_inputs(metadata)
+        if self._inputs.get(folder) == inputs:
+            logger.debug("No timeline change in %s", folder)
+            return
+        try:
+            files = regenerate_folder(folder, metadata)
+        except (KeyError, ValueError) as e:
+            logger.warning("Cannot regenerate tasks for %s: %s", folder, e)
+            return
+        self._inputs[folder] = inputs
+        self.regenerated += 1
+        logger.info("Regenerated %d task file(s) in %s", len(files), os.path.basename(folder))
+
+    def _poll(self):
+        while not self._stop.wait(self.poll_interval):
+            stamps = self._scan()
+            for folder, stamp in stamps.items():
+                if self._stamps.get(folder) != stamp:
+                    self.notify(folder)
+            self._stamps = stamps
+
+    def _drain(self):
+        """Process debounced folders until stop() is called."""
+        while not self._stop.is_set():
+            with self._cond:
+                now = time.monotonic()
+                due = [f for f, deadline in self._pending.items() if deadline <= now]
+                for folder in due:
+                    del self._pending[folder]
+                if not due:
+                    # Sleep until the earliest quiet period ends, or indefinitely when idle
+                    timeout = min(self._pending.values()) - now if self._pending else None
+                    self._cond.wait(timeout)
+                    continue
+            for folder in due:
+                self.process(folder)
+
+    def run(self, sync_on_start=False):
+        """Watch until stop() is called (or Ctrl+C)."""
+        self.prime(sync_on_start)
+        observer = None
+        if self.polling:
+            threading.Thread(target=self._poll, name="task-watch-poll", daemon=True).start()
+        else:
+            observer = Observer()
+            observer.schedule(_MetadataEvents(self), self.base_path, recursive=True)
+            observer.start()
+        try:
+            self._drain()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+            if observer is not None:
+                observer.stop()
+                observer.join()
+
+    def stop(self):
+        with self._cond:
+            self._stop.set()
+            self._cond.notify()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Regenerate task CSVs when engagement_metadata.json changes"
+    )
+    parser.add_argument("--base", help="Engagements folder (default: engagements_base_path in config.json)")
+    parser.add_argument("--config", help="Path to config.json")
+    parser.add_argument("--debounce", type=float, default=2.0,
+                        help="Seconds of quiet before a changed folder is processed (default: 2)")
+    parser.add_argument("--poll-interval", type=float, default=2.0,
+                        help="Polling interval in seconds when watchdog is not used (default: 2)")
+    parser.add_argument("--polling", action="store_true", help="Poll even if watchdog is installed")
+    parser.add_argument("--sync-on-start", action="store_true",
+                        help="Regenerate every folder's task files once before watching")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s", datefmt="%H:%M:%S")
+
+    base = args.base or load_base_path(args.config)
+    if not base or not os.path.isdir(base):
+        print("❌ Engagements folder not found; pass --base or set engagements_base_path in config.json")
+        sys.exit(1)
+
+    TaskWatcher(base, args.debounce, args.poll_interval, args.polling).run(args.sync_on_start)
@@ -4,9 +4,12 @@ Interactive setup script for Copilot Skills for Customer Engagements.
 Guides users through all configuration steps.
 """
 
+import argparse
+import hashlib
 import json
 import os
 import platform
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -167,40 +170,160 @@ def create_config_file():
         return False, None
 
 
-def install_dependencies():
-    """Install Python dependencies."""
+DEPS_STAMP_NAME = ".deps-stamp.json"
+WHEELHOUSE_NAME = ".wheelhouse"
+
+
+def find_requirements_files(repo_root):
+    """All .github/skills/*/requirements.txt files, in a stable order."""
+    skills_dir = repo_root / ".github" / "skills"
+    if not skills_dir.exists():
+        return []
+    return sorted(skills_dir.glob("*/requirements.txt"))
+
+
+def requirement_names(requirements_files):
+    """Distribution names listed in the requirements files (no versions, lowercased)."""
+    names = []
+    for path in requirements_files:
+        for line in path.read_text(encoding="utf-8").splitlines():
+            line = line.split("#", 1)[0].strip()
+            if not line or line.startswith("-"):
+                continue
+            name = re.match(r"[A-Za-z0-9_.\-]+", line)
+            if name and name.group(0).lower() not in names:
+                names.append(name.group(0).lower())
+    return names
+
+
+def requirements_digest(requirements_files):
+    """Hash of every requirements file's path and content."""
+    digest = hashlib.sha256()
+    for path in requirements_files:
+        digest.update(str(path.parent.name).encode("utf-8") + b"\0")
+        digest.update(path.read_bytes() + b"\0")
+    return digest.hexdigest()
+
+
+def installed_versions(names):
+    """{name: installed version or None} for the given distributions."""
+    try:
+        from importlib import metadata
+    except ImportError:  # Python 3.7
+        return {name: None for name in names}
+    versions = {}
+    for name in names:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+def read_deps_stamp(stamp_path):
+    try:
+        with open(stamp_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, PermissionError):
+        return None
+
+
+def deps_up_to_date(stamp_path, requirements_files):
+    """True when the stamp matches these requirements, this interpreter and what is installed."""
+    stamp = read_deps_stamp(stamp_path)
+    if not stamp:
+        return False
+    if stamp.get("requirements") != requirements_digest(requirements_files):
+        return False
+    if stamp.get("python") != sys.executable or stamp.get("python_version") != platform.python_version():
+        return False
+    installed = stamp.get("installed") or {}
+    current = installed_versions(list(installed))
+    return bool(installed) and all(current[name] and current[name] == version for name, version in installed.items())
+
+
+def write_deps_stamp(stamp_path, requirements_files):
+    versions = installed_versions(requirement_names(requirements_files))
+    if not all(versions.values()):
+        return  # Cannot confirm the install (or Python 3.7); check again next time
+    stamp = {
+        "requirements": requirements_digest(requirements_files),
+        "python": sys.executable,
+        "python_version": platform.python_version(),
+        "installed": versions,
+    }
+    with open(stamp_path, "w", encoding="utf-8") as f:
+        json.dump(stamp, f, indent=2)
+
+
+def install_dependencies(wheelhouse=None, build_wheelhouse=False, offline=False, force=False):
+    """
+    Install every skill's Python dependencies in one pip run.
+
+    All skill requirements files go to a single `pip install` so pip resolves
+    them together. A stamp file records the result; later runs skip pip
+    entirely while the requirements, interpreter and installed versions are
+    unchanged. With a wheelhouse (a folder of downloaded wheels), installs
+    come from it without the network; build_wheelhouse downloads into it first.
+
+    Args:
+        wheelhouse: Wheel folder (default: .wheelhouse in the repo, used if present)
+        build_wheelhouse: Download/refresh the wheelhouse before installing
+        offline: Install only from the wheelhouse, never from the index
+        force: Ignore the stamp and run pip
+    """
     print_step(3, "Installing Python Dependencies")
-    
+
     repo_root = Path(__file__).parent
-    skills_dir = repo_root / ".github" / "skills"
-    
-    # Find all requirements.txt files in skills directories
-    requirements_files = []
-    if skills_dir.exists():
-        requirements_files = list(skills_dir.glob("*/requirements.txt"))
-    
+    requirements_files = find_requirements_files(repo_root)
     if not requirements_files:
         print_info("No requirements.txt found, skipping dependency installation.")
         return True
-    
-    # Install dependencies from all requirements files
-    success = True
+
+    stamp_path = repo_root / DEPS_STAMP_NAME
+    if not force and deps_up_to_date(stamp_path, requirements_files):
+        print_success("Python dependencies already installed (requirements unchanged)")
+        return True
+
+    wheelhouse = Path(wheelhouse) if wheelhouse else repo_root / WHEELHOUSE_NAME
+    requirement_args = []
     for requirements_path in requirements_files:
-        print(f"Installing dependencies from: {requirements_path}")
-        print("This may take a minute...\n")
-        
+        print(f"Including dependencies from: {requirements_path}")
+        requirement_args += ["-r", str(requirements_path)]
+
+    pip = [sys.executable, "-m", "pip"]
+    if build_wheelhouse:
+        print(f"\nDownloading wheels into {wheelhouse}...")
         try:
-            subprocess.check_call([
-                sys.executable, "-m", "pip", "install", "-r", str(requirements_path)
-            ])
-            print_success(f"Dependencies installed from {requirements_path.parent.name}")
+            subprocess.check_call(pip + ["download", "--dest", str(wheelhouse)] + requirement_args)
+            print_success(f"Wheelhouse ready: {wheelhouse}")
         except subprocess.CalledProcessError as e:
-            print_error(f"Failed to install dependencies from {requirements_path.parent.name}: {e}")
-            success = False
-    
-    if success:
+            print_error(f"Failed to build the wheelhouse: {e}")
+
+    has_wheels = wheelhouse.is_dir() and any(wheelhouse.iterdir())
+    attempts = []
+    if has_wheels:
+        attempts.append(["--no-index", "--find-links", str(wheelhouse)])
+    if not offline:
+        attempts.append(["--find-links", str(wheelhouse)] if has_wheels else [])
+    if not attempts:
+        print_error(f"--offline needs a wheelhouse, and {wheelhouse} is empty or missing")
+        return False
+
+    print("This may take a minute...\n")
+    for extra in attempts:
+        try:
+            subprocess.check_call(pip + ["install"] + extra + requirement_args)
+        except subprocess.CalledProcessError as e:
+            if extra and extra[0] == "--no-index" and len(attempts) > 1:
+                print_info("Wheelhouse is missing packages; retrying with the package index.")
+                continue
+            print_error(f"Failed to install dependencies: {e}")
+            return False
+        write_deps_stamp(stamp_path, requirements_files)
         print_success("All Python dependencies installed successfully")
-    return success
+        return True
+    return False
 
 
 def get_vscode_settings_path():
@@ -342,8 +465,28 @@ def show_completion(workspace_created):
     print("\nHappy engaging! 🚀\n")
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Set up Copilot Skills for Customer Engagements")
+    parser.add_argument("--deps-only", action="store_true",
+                        help="Only install Python dependencies (non-interactive)")
+    parser.add_argument("--wheelhouse", metavar="DIR",
+                        help=f"Wheel folder to install from (default: {WHEELHOUSE_NAME} in the repo, if present)")
+    parser.add_argument("--build-wheelhouse", action="store_true",
+                        help="Download all dependency wheels into the wheelhouse first")
+    parser.add_argument("--offline", action="store_true", help="Install only from the wheelhouse")
+    parser.add_argument("--force", action="store_true", help="Reinstall even if the stamp says nothing changed")
+    return parser.parse_args()
+
+
 def main():
     """Main setup flow."""
+    args = parse_args()
+    install_options = dict(wheelhouse=args.wheelhouse, build_wheelhouse=args.build_wheelhouse,
+                           offline=args.offline, force=args.force)
+
+    if args.deps_only:
+        sys.exit(0 if install_dependencies(**install_options) else 1)
+
     print_header("Copilot Skills for Customer Engagements - Setup")
     print("This script will guide you through the configuration process.\n")
     
@@ -360,7 +503,7 @@ def main():
         sys.exit(1)
     
     # Install dependencies
-    install_dependencies()  # Continue even if this fails
+    install_dependencies(**install_options)  # Continue even if this fails
     
     # Configure VS Code settings
     configure_vscode_settings()